@@ -41,4 +41,213 @@ cpdef list starsplit(string_arr, float default=1.0):
 
             float_array.append(value)
 
-    return float_array
\ No newline at end of file
+    return float_array
+
+ctypedef fused number:
+    double
+    long long
+
+cdef double[23] powers = [
+    1e0,1e1,1e2,1e3,1e4,1e5,1e6,1e7,1e8,1e9,1e10,1e11,
+    1e12,1e13,1e14,1e15,1e16,1e17,1e18,1e19,1e20,1e21,1e22]
+
+cdef inline bint isblank(unsigned char char, unsigned char delimiter) nogil:
+    return (char==32 or char==9 or char==13) and char!=delimiter
+
+cdef inline bint isend(unsigned char char, unsigned char delimiter, unsigned char comment) nogil:
+    return char==32 or char==9 or char==13 or char==10 or char==delimiter or char==comment
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline Py_ssize_t tokenend(const unsigned char[:] buffer, Py_ssize_t index, unsigned char delimiter, unsigned char comment) nogil:
+
+    cdef Py_ssize_t size = buffer.shape[0]
+
+    while index<size and not isend(buffer[index],delimiter,comment):
+        index += 1
+
+    return index
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline Py_ssize_t parsefloat(const unsigned char[:] buffer, Py_ssize_t index, unsigned char delimiter, unsigned char comment, double *value) nogil:
+    """It parses the token starting at index into value and returns the index after the token.
+    It returns -1 when the token needs the slow path (too many digits, large exponents, nan, inf)."""
+
+    cdef Py_ssize_t size = buffer.shape[0]
+
+    cdef bint negative = False
+    cdef bint expnegative = False
+
+    cdef unsigned long long mantissa = 0
+    cdef int digits = 0
+    cdef int exponent = 0
+    cdef int expvalue = 0
+
+    if index<size and (buffer[index]==45 or buffer[index]==43):
+        negative = buffer[index]==45
+        index += 1
+
+    while index<size and 48<=buffer[index]<=57:
+        mantissa = mantissa*10+(buffer[index]-48)
+        digits += 1
+        index += 1
+
+    if index<size and buffer[index]==46:
+        index += 1
+        while index<size and 48<=buffer[index]<=57:
+            mantissa = mantissa*10+(buffer[index]-48)
+            digits += 1
+            exponent -= 1
+            index += 1
+
+    if digits==0 or digits>15:
+        return -1
+
+    if index<size and (buffer[index]==101 or buffer[index]==69):
+        index += 1
+        if index<size and (buffer[index]==45 or buffer[index]==43):
+            expnegative = buffer[index]==45
+            index += 1
+        if index>=size or not 48<=buffer[index]<=57:
+            return -1
+        while index<size and 48<=buffer[index]<=57 and expvalue<1000:
+            expvalue = expvalue*10+(buffer[index]-48)
+            index += 1
+        exponent += -expvalue if expnegative else expvalue
+
+    if index<size and not isend(buffer[index],delimiter,comment):
+        return -1
+
+    if exponent<-22 or exponent>22:
+        return -1
+
+    value[0] = <double>mantissa/powers[-exponent] if exponent<0 else <double>mantissa*powers[exponent]
+
+    if negative:
+        value[0] = -value[0]
+
+    return index
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline Py_ssize_t parseint(const unsigned char[:] buffer, Py_ssize_t index, unsigned char delimiter, unsigned char comment, long long *value) nogil:
+    """It parses the token starting at index into value and returns the index after the token.
+    It returns -1 when the token needs the slow path (too many digits or not an integer)."""
+
+    cdef Py_ssize_t size = buffer.shape[0]
+
+    cdef bint negative = False
+
+    cdef int digits = 0
+
+    value[0] = 0
+
+    if index<size and (buffer[index]==45 or buffer[index]==43):
+        negative = buffer[index]==45
+        index += 1
+
+    while index<size and 48<=buffer[index]<=57:
+        value[0] = value[0]*10+(buffer[index]-48)
+        digits += 1
+        index += 1
+
+    if digits==0 or digits>18 or (index<size and not isend(buffer[index],delimiter,comment)):
+        return -1
+
+    if negative:
+        value[0] = -value[0]
+
+    return index
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Py_ssize_t tokenize_(const unsigned char[:] buffer, number[:] values, unsigned char delimiter, unsigned char comment, Py_ssize_t ncols) except -1:
+    """It parses the buffer line by line into values and returns how many were written. Every
+    delimiter bounds a field so that empty fields raise ValueError; without delimiter, fields are
+    separated by whitespace. The comment starts the ignored rest of a line. If ncols is positive,
+    each line with data must have ncols fields."""
+
+    cdef Py_ssize_t size = buffer.shape[0]
+    cdef Py_ssize_t count = 0
+    cdef Py_ssize_t index = 0
+    cdef Py_ssize_t stop
+    cdef Py_ssize_t fields
+
+    cdef bint delimited = delimiter!=10
+    cdef bint pending
+
+    cdef double fvalue
+    cdef long long ivalue
+
+    while index<size:
+
+        fields,pending = 0,False
+
+        while True:
+
+            while index<size and isblank(buffer[index],delimiter):
+                index += 1
+
+            if index>=size or buffer[index]==10 or buffer[index]==comment:
+                if pending:
+                    raise ValueError(f"empty field at byte {index} of the buffer")
+                break
+
+            if delimited and buffer[index]==delimiter:
+                raise ValueError(f"empty field at byte {index} of the buffer")
+
+            if count>=values.shape[0]:
+                raise ValueError("the buffer contains more numbers than values can hold")
+
+            if number is double:
+                stop = parsefloat(buffer,index,delimiter,comment,&fvalue)
+                if stop<0:
+                    stop = tokenend(buffer,index,delimiter,comment)
+                    fvalue = float(bytes(buffer[index:stop]))
+                values[count] = fvalue
+            else:
+                stop = parseint(buffer,index,delimiter,comment,&ivalue)
+                if stop<0:
+                    stop = tokenend(buffer,index,delimiter,comment)
+                    ivalue = int(bytes(buffer[index:stop]))
+                values[count] = ivalue
+
+            count += 1
+            fields += 1
+
+            index = stop
+
+            while index<size and isblank(buffer[index],delimiter):
+                index += 1
+
+            pending = delimited and index<size and buffer[index]==delimiter
+
+            if pending:
+                index += 1
+
+        while index<size and buffer[index]!=10:
+            index += 1
+
+        index += 1
+
+        if ncols>0 and fields>0 and fields!=ncols:
+            raise ValueError(f"a line has {fields} fields instead of {ncols}")
+
+    return count
+
+cdef inline unsigned char delimitercode(str delimiter):
+    return 10 if delimiter is None or delimiter==" " else ord(delimiter)
+
+cdef inline unsigned char commentcode(str comments):
+    return 10 if not comments else ord(comments)
+
+cpdef Py_ssize_t tokenize(const unsigned char[:] buffer, double[:] values, str delimiter=None, str comments="#", Py_ssize_t ncols=0):
+    """It parses the numbers in the bytes buffer into values and returns how many were written."""
+
+    return tokenize_(buffer,values,delimitercode(delimiter),commentcode(comments),ncols)
+
+cpdef Py_ssize_t tokenize_int(const unsigned char[:] buffer, long long[:] values, str delimiter=None, str comments="#", Py_ssize_t ncols=0):
+    """It parses the integers in the bytes buffer into values and returns how many were written."""
+
+    return tokenize_(buffer,values,delimitercode(delimiter),commentcode(comments),ncols)
@@ -1,160 +1,493 @@
+import calendar
 import datetime
 
 from dateutil import parser
 
+import io
 import re
+import warnings
 
 import numpy as np
 
+def _astext(array,*strings):
+    """It returns the strings in the character kind of array, bytes for numpy.bytes_ arrays."""
+
+    if array.dtype.kind=="S":
+        return [string if string is None else string.encode("latin1") for string in strings]
+    else:
+        return list(strings)
+
+def _regex_match(array,regex,strnone=""):
+    """It returns the array of first matches of regex compiled once, strnone where there is no match."""
+
+    if array.dtype.kind=="S" and isinstance(regex,str):
+        regex = regex.encode("latin1")
+
+    regex = re.compile(regex)
+
+    matches = [regex.search(string) for string in array.ravel().tolist()]
+
+    matches = [strnone if match is None else match.group() for match in matches]
+
+    return np.array(matches,dtype=array.dtype.kind).reshape(array.shape)
+
 def str2int(
-    string: str,
+    string: np.ndarray,
     strnone: str = "",
     intnone: int = -99_999,
-    regex: str = None) -> int:
-    """It returns integer converted from string."""
+    regex: str = None,
+    sep_thousand: str = ",") -> np.ndarray:
+    """It returns integer array converted from string array after removing thousand separator."""
 
     # common expression for int type is r"[-+]?\d+\b"
 
-    if regex is None:
-        if string==strnone:
-            return intnone
-        else:
-            return int(string)
+    array = np.asarray(string)
 
-    else:
-        match = re.search(regex,string)
+    strnone,sep_thousand = _astext(array,strnone,sep_thousand)
 
-        if match is None:
-            return intnone
-        else:
-            return int(match.group())
-        
-str2int = np.vectorize(str2int,otypes=[int],excluded=["strnone","intnone","regex"])
+    if regex is not None:
+        array = _regex_match(array,regex,strnone)
+
+    nones = array==strnone
 
-# print(str2int(np.array(["john 1","sabrina 2","tarum 5 nohan","conor"]),intnone=0,regexFlag=True))
+    if sep_thousand:
+        array = np.char.replace(array,sep_thousand,"")
+
+    integers = np.full(array.shape,intnone,dtype=int)
+
+    integers[~nones] = array[~nones].astype(int)
+
+    return integers
 
 def str2float(
-    string: str,
+    string: np.ndarray,
     strnone: str = "",
     floatnone: float = np.nan,
     sep_decimal: str = ".",
     sep_thousand: str = ",",
-    regex: str = None) -> float:
-    """It returns float after removing thousand separator and setting decimal separator as full stop."""
+    regex: str = None) -> np.ndarray:
+    """It returns float array after removing thousand separator and setting decimal separator as full stop.
+    It raises ValueError if the decimal and thousand separators are the same."""
 
     # common regular expression for float type is f"[-+]?(?:\\d*\\{sep_thousand}*\\d*\\{sep_decimal}\\d+|\\d+)"
 
-    if regex is None:
-        if string==strnone:
-            return floatnone
-        elif string.count(sep_decimal)>1:
-            raise ValueError(f"String contains more than one {sep_decimal=}, {string}")
-        else:
-            if string.count(sep_thousand)>0:
-                string = string.replace(sep_thousand,"")
-            if sep_decimal!=".":
-                string = string.replace(sep_decimal,".")
-            return float(string)
+    array = np.asarray(string)
 
-    else:
-        match = re.search(regex,string)
+    if sep_decimal==sep_thousand:
+        raise ValueError(f"Decimal and thousand separators are the same, {sep_decimal=}; set sep_thousand to another one.")
 
-        if match is None:
-            return floatnone
-        else:
-            return float(match.group())
+    strnone,sep_decimal,sep_thousand,fullstop = _astext(array,strnone,sep_decimal,sep_thousand,".")
+
+    if regex is not None:
+        array = _regex_match(array,regex,strnone)
+
+    nones = array==strnone
+
+    multiples = np.char.count(array,sep_decimal)>1
+
+    if np.any(multiples):
+        raise ValueError(f"String contains more than one {sep_decimal=}, {array[multiples].ravel()[0]}")
+
+    if sep_thousand:
+        array = np.char.replace(array,sep_thousand,"")
+
+    if sep_decimal!=fullstop:
+        array = np.char.replace(array,sep_decimal,fullstop)
+
+    floats = np.full(array.shape,floatnone,dtype=float)
 
-str2float = np.vectorize(str2float,otypes=[float],excluded=["strnone","floatnone","sep_decimal","sep_thousand","regex"])
+    floats[~nones] = array[~nones].astype(float)
+
+    return floats
+
+datetime_formats = (
+    "%Y-%m-%d",
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%dT%H:%M:%S",
+    "%Y-%m-%d %H:%M:%S.%f",
+    "%Y-%m-%dT%H:%M:%S.%f",
+    "%Y/%m/%d",
+    "%Y%m%d",
+    "%m.%d.%Y",
+    "%d.%m.%Y",
+    "%m/%d/%Y",
+    "%d/%m/%Y",
+    "%d-%b-%Y",
+    "%d %b %Y",
+    "%d-%b-%y",
+    "%d %b %y",
+    "%b %d, %Y",
+    "%m.%d.%Y %H:%M:%S",
+    "%d.%m.%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M:%S",
+    "%d/%m/%Y %H:%M:%S",
+    )
+
+def _strptime(strings,fstring):
+    """It returns the datetimes of strings parsed with fstring, or None if any of them does not match."""
+
+    try:
+        return [datetime.datetime.strptime(string,fstring) for string in strings]
+    except (ValueError,TypeError):
+        return None
+
+def infer_datetime_format(strings,formats=None):
+    """It returns the first format that parses all the strings, or None if there is none. The
+    month-first formats come before the day-first ones as in dateutil.parser, so that the strings
+    which could be read both ways keep the reading of dateutil."""
+
+    formats = datetime_formats if formats is None else formats
+
+    for fstring in formats:
+        if _strptime(strings,fstring) is not None:
+            return fstring
 
 def str2datetime(
-    string: str,
+    string: np.ndarray,
     strnone: str = "",
     datetimenone: np.datetime64 = np.datetime64('NaT'),
-    regex: str = None) -> np.datetime64:
+    regex: str = None,
+    fstring: str = None,
+    sample: int = 20) -> np.ndarray:
+    """It returns datetime64 array converted from string array. Each unique string is parsed
+    only once. If fstring is not defined, the format is inferred from a sample of the unique
+    strings and applied to the whole column; if some strings do not match it, the format is
+    inferred from all of them, and the sampled one is kept when none fits. Only the strings
+    not matching the format are parsed by dateutil.parser."""
 
-    if regex is None:
-        if string==strnone:
-            return datetimenone
-        else:
-            return np.datetime64(parser.parse(string))
-    else:
-        match = re.search(regex,string)
+    array = np.asarray(string)
+
+    if array.dtype.kind=="S":
+        array = np.char.decode(array,"latin1")
+
+    if regex is not None:
+        array = _regex_match(array,regex,strnone)
+
+    uniques,inverse = np.unique(array.ravel(),return_inverse=True)
+
+    valids = uniques!=strnone
+
+    dates = np.full(uniques.shape,datetimenone,dtype="datetime64[us]")
+
+    strings = uniques[valids].tolist()
+
+    inferred = fstring is None
 
-        if match is None:
-            return datetimenone
+    if inferred:
+        fstring = infer_datetime_format(strings[::max(len(strings)//sample,1)][:sample])
+
+    if fstring=="%Y-%m-%d":
+        try:
+            dates[valids] = uniques[valids].astype("datetime64[D]")
+        except ValueError:
+            pass
         else:
-            return np.datetime64(match.group())
+            return dates[inverse].reshape(array.shape)
+
+    parsed = None if fstring is None else _strptime(strings,fstring)
+
+    if parsed is None and inferred and fstring is not None:
+        fstring = infer_datetime_format(strings) or fstring
+        parsed = _strptime(strings,fstring)
+
+    if parsed is None:
+
+        parsed = []
+
+        for string in strings:
+            try:
+                parsed.append(datetime.datetime.strptime(string,fstring))
+            except (ValueError,TypeError):
+                parsed.append(parser.parse(string))
+
+    dates[valids] = np.array(parsed,dtype="datetime64[us]")
+
+    return dates[inverse].reshape(array.shape)
+
+def _int2text(integers,thousands=False):
+    """It returns string array of non-negative integer array, digits grouped by commas if thousands."""
+
+    if not thousands:
+        return integers.astype(str)
+
+    groupnum = np.ones(integers.shape,dtype=int)
+
+    for power in range(1,7):
+        groupnum[integers>=1000**power] = power+1
+
+    strings = np.zeros(integers.shape,dtype="U1")
+
+    for power in range(groupnum.max()-1,-1,-1):
+
+        group = (integers//1000**power)%1000
+
+        leading = group.astype(str)
+        trailing = np.char.add(",",np.char.zfill(leading,3))
+
+        strings = np.char.add(strings,np.where(groupnum==power+1,leading,np.where(groupnum>power+1,trailing,"")))
+
+    return strings
+
+def _format_unique(floats,fstring):
+    """It returns string array of float array formatted with fstring once per unique value; the
+    values are told apart by their bits so that -0.0 and 0.0 keep their own strings."""
+
+    bits,inverse = np.unique(floats.ravel().view(np.int64),return_inverse=True)
+
+    formatter = fstring.format
+
+    strings = np.array([formatter(value) for value in bits.view(float).tolist()],dtype=str)
+
+    return strings[inverse.ravel()].reshape(floats.shape)
+
+def _format(array,fstring):
+    """It returns string array formatted with fstring compiled once, in a single pass."""
+
+    formatter = fstring.format
 
-str2datetime = np.vectorize(str2datetime,otypes=[np.datetime64],excluded=["strnone","datetimenone","regex"])
+    strings = [formatter(value) for value in array.ravel().tolist()]
+
+    return np.array(strings,dtype=str).reshape(array.shape)
 
 def int2str(
-    number: int,
+    number: np.ndarray,
     intnone: int = -99_999,
     strnone: str = "",
-    fstring: str = None) -> str:
+    fstring: str = None) -> np.ndarray:
+    """It returns string array of integer array. The fstrings {}, {:d}, {:,} and {:,d}
+    are formatted as array operations; the others are compiled once and applied in one pass."""
+
+    fstring = "{:,d}" if fstring is None else fstring
+
+    array = np.asarray(number)
+
+    nones = array==intnone
+
+    match = re.fullmatch(r"\{(?::(,?)d?)?\}",fstring)
 
-    if number==intnone:
-        return strnone
+    if match is None:
+        strings = _format(array,fstring)
     else:
-        fstring = "{:,d}" if fstring is None else fstring
-        return fstring.format(number)
+        strings = _int2text(np.abs(array),thousands=match.group(1)==",")
+        strings = np.char.add(np.where(array<0,"-",""),strings)
 
-int2str = np.vectorize(int2str,otypes=[str],excluded=["intnone","strnone","fstring"])
+    return np.where(nones,strnone,strings)
 
 def float2str(
-    number: float,
+    number: np.ndarray,
     floatnone: float = np.nan,
     strnone: str = "",
-    fstring: str = None) -> str:
+    fstring: str = None) -> np.ndarray:
+    """It returns string array of float array. The fstring is applied once per unique value,
+    so that the strings are the correctly rounded ones of str.format."""
 
-    if number==floatnone:
-        number = strnone
+    fstring = "{:f}" if fstring is None else fstring
+
+    array = np.asarray(number,dtype=float)
+
+    if np.isnan(floatnone):
+        nones = np.isnan(array)
     else:
-        fstring = "{:f}" if fstring is None else fstring
-        return fstring.format(number)
+        nones = array==floatnone
 
-float2str = np.vectorize(float2str,otypes=[str],excluded=["floatnone","strnone","fstring"])
+    strings = _format_unique(np.where(nones,0.,array),fstring)
+
+    return np.where(nones,strnone,strings)
 
 def str2str(
-    string: str,
+    string: np.ndarray,
     strnone: str = "",
     regex: str = None,
-    fstring: str = None) -> str:
+    fstring: str = None) -> np.ndarray:
+    """It returns string array formatted with fstring after extracting the regex match if regex is defined."""
+
+    array = np.asarray(string)
+
+    if regex is not None:
+        array = _regex_match(array,regex,*_astext(array,strnone))
+
+    if array.dtype.kind=="S":
+        array = np.char.decode(array,"latin1")
+
+    if fstring is None or fstring in ("{}","{:s}"):
+        return array.copy() if regex is None else array
+
+    match = re.fullmatch(r"\{:([<>]?)(\d+)s?\}",fstring)
+
+    if match is None:
+        return _format(array,fstring)
+    elif match.group(1)==">":
+        return np.char.rjust(array,int(match.group(2)))
+    else:
+        return np.char.ljust(array,int(match.group(2)))
+
+whitespace_codes = (9,10,11,12,13,28,29,30,31,32,133,160)
+
+def str2cols(
+    string: np.ndarray,
+    delimiter: str = None,
+    maxsplit: int = None) -> list:
+    """It returns the list of string arrays split at the delimiter; the rows with fewer fields
+    are padded with empty strings. The characters of the whole array are processed at once
+    as a two-dimensional code array, and each field is sliced out by its start and length.
+    If delimiter is None, the runs of whitespace are the delimiters as in str.split()."""
 
-    fstring = "{:s}" if fstring is None else fstring
+    array = np.asarray(string)
 
-    if regex is None:
-        if string==strnone:
-            return fstring.format(strnone)
+    if array.dtype.kind not in ("U","S"):
+        array = array.astype(str)
+
+    if delimiter is not None and len(delimiter)!=1:
+        return _split_strings(array,delimiter,maxsplit)
+
+    width = array.dtype.itemsize//(4 if array.dtype.kind=="U" else 1)
+
+    codes = np.ascontiguousarray(array.ravel()).view(np.uint32 if array.dtype.kind=="U" else np.uint8)
+    codes = codes.reshape((array.size,width))
+
+    valid = codes!=0
+
+    lengths = valid.sum(axis=1)
+
+    if delimiter is None:
+
+        table = np.ones(max(whitespace_codes)+2,dtype=bool)
+        table[0] = False
+        table[list(whitespace_codes)] = False
+
+        words = table.take(np.minimum(codes,table.size-1))
+
+        edges = np.diff(words.view(np.int8),axis=1,prepend=0,append=0)
+
+        rows,cols = np.nonzero(edges==1)
+        ranks = _ranks(rows,array.size)
+
+        limit = max(int(ranks.max(initial=0)),0) if maxsplit is None else maxsplit
+
+        starts = np.repeat(lengths.reshape((-1,1)),limit+1,axis=1)
+        starts[rows[ranks<=limit],ranks[ranks<=limit]] = cols[ranks<=limit]
+
+        rows,cols = np.nonzero(edges==-1)
+        ranks = _ranks(rows,array.size)
+
+        ends = np.repeat(lengths.reshape((-1,1)),limit+1,axis=1)
+
+        if maxsplit is None:
+            ends[rows,ranks] = cols
         else:
-            return fstring.format(string)
+            ends[rows[ranks<limit],ranks[ranks<limit]] = cols[ranks<limit]
 
     else:
-        match = re.search(regex,string)
 
-        if match is None:
-            return fstring.format(strnone)
+        rows,cols = np.nonzero(codes==ord(delimiter))
+        ranks = _ranks(rows,array.size)+1
+
+        limit = int(ranks.max(initial=0)) if maxsplit is None else maxsplit
+
+        bounds = np.repeat(lengths.reshape((-1,1)),limit+2,axis=1)
+        bounds[:,0] = -1
+        bounds[rows[ranks<=limit],ranks[ranks<=limit]] = cols[ranks<=limit]
+
+        starts,ends = bounds[:,:-1]+1,bounds[:,1:]
+
+    sizes = np.maximum(ends-starts,0)
+
+    flat = codes.ravel()
+
+    starts += np.arange(array.size).reshape((-1,1))*width
+
+    columns = []
+
+    for index in range(limit+1):
+
+        size = max(int(sizes[:,index].max(initial=0)),1)
+
+        offsets = np.arange(size)
+
+        if flat.size>0:
+            indices = starts[:,index].reshape((-1,1))+offsets
+            chars = flat.take(np.minimum(indices,flat.size-1,out=indices))
+            chars *= offsets<sizes[:,index].reshape((-1,1))
         else:
-            return fstring.format(match.group())
+            chars = np.zeros((array.size,size),dtype=codes.dtype)
+
+        column = np.ascontiguousarray(chars).view(f"{array.dtype.kind}{size}").reshape(array.shape)
+
+        columns.append(np.char.decode(column,"latin1") if array.dtype.kind=="S" else column)
+
+    return columns
+
+def _ranks(rows,size):
+    """It returns the rank of each item within its row for the row-sorted row indices."""
+
+    firsts = np.searchsorted(rows,np.arange(size))
+
+    return np.arange(rows.size)-firsts[rows]
+
+def _split_strings(array,delimiter,maxsplit):
+    """It returns the list of string arrays split at the multi-character delimiter."""
+
+    rows = [string.split(delimiter,-1 if maxsplit is None else maxsplit) for string in array.ravel().tolist()]
 
-str2str = np.vectorize(str2str,otypes=[str],excluded=["strnone","regex","fstring"])
+    count = max([len(row) for row in rows],default=1)
+
+    return [np.array([row[index] if index<len(row) else "" for row in rows],dtype=str).reshape(array.shape) for index in range(count)]
+
+datetime_directives = {
+    "%Y": lambda dates: np.char.zfill((dates.astype("datetime64[Y]").astype(int)+1970).astype(str),4),
+    "%y": lambda dates: np.char.zfill(((dates.astype("datetime64[Y]").astype(int)+1970)%100).astype(str),2),
+    "%m": lambda dates: np.char.zfill((dates.astype("datetime64[M]").astype(int)%12+1).astype(str),2),
+    "%b": lambda dates: np.array(calendar.month_abbr)[dates.astype("datetime64[M]").astype(int)%12+1],
+    "%B": lambda dates: np.array(calendar.month_name)[dates.astype("datetime64[M]").astype(int)%12+1],
+    "%d": lambda dates: np.char.zfill(((dates-dates.astype("datetime64[M]")).astype("timedelta64[D]").astype(int)+1).astype(str),2),
+    "%j": lambda dates: np.char.zfill(((dates-dates.astype("datetime64[Y]")).astype("timedelta64[D]").astype(int)+1).astype(str),3),
+    "%H": lambda dates: np.char.zfill(((dates-dates.astype("datetime64[D]")).astype("timedelta64[h]").astype(int)).astype(str),2),
+    "%M": lambda dates: np.char.zfill(((dates-dates.astype("datetime64[h]")).astype("timedelta64[m]").astype(int)).astype(str),2),
+    "%S": lambda dates: np.char.zfill(((dates-dates.astype("datetime64[m]")).astype("timedelta64[s]").astype(int)).astype(str),2),
+    "%%": lambda dates: np.full(dates.shape,"%"),
+    }
 
 def datetime2str(
-    datetime_: datetime.date,
-    datetimenone: datetime.date = None,
+    datetime_: np.ndarray,
+    datetimenone: np.datetime64 = None,
     strnone: str = "",
-    fstring: str = None) -> str:
+    fstring: str = None) -> np.ndarray:
+    """It returns string array of datetime array. The fstring is compiled once into literal and
+    directive parts, each directive is computed for the whole array with datetime64 arithmetic.
+    The fstrings with directives other than %Y, %y, %m, %b, %B, %d, %j, %H, %M and %S are applied
+    by strftime once per unique date."""
+
+    fstring = "%d-%b-%Y" if fstring is None else fstring
+
+    array = np.asarray(datetime_)
+
+    if array.dtype.type is not np.datetime64:
+        array = array.astype("datetime64[us]")
 
-    if isinstance(datetimenone,np.datetime64):
-        datetimenone = datetimenone.tolist()
+    nones = np.isnat(array)
 
-    if datetime_ == datetimenone:
-        return strnone
+    if datetimenone is not None and not np.isnat(np.datetime64(datetimenone)):
+        nones = np.logical_or(nones,array==np.datetime64(datetimenone))
+
+    dates = np.where(nones,np.datetime64(0,"D"),array).astype("datetime64[us]")
+
+    parts = re.split(r"(%.)",fstring)
+
+    if fstring=="%Y-%m-%d" and np.all((dates>=np.datetime64("0000-01-01"))&(dates<np.datetime64("10000-01-01"))):
+        strings = dates.astype("datetime64[D]").astype(str)
+    elif all([part in datetime_directives for part in parts[1::2]]):
+        strings = np.full(dates.shape,"",dtype="U1")
+        for index,part in enumerate(parts):
+            if index%2==0 and part!="":
+                strings = np.char.add(strings,part)
+            elif index%2==1:
+                strings = np.char.add(strings,datetime_directives[part](dates))
     else:
-        fstring = "%d-%b-%Y" if fstring is None else fstring
-        return datetime_.strftime(fstring)
+        uniques,inverse = np.unique(dates.ravel(),return_inverse=True)
+        strings = np.array([date.strftime(fstring) for date in uniques.tolist()],dtype=str)
+        strings = strings[inverse].reshape(dates.shape)
 
-datetime2str = np.vectorize(datetime2str,otypes=[str],excluded=["datetimenone","strnone","fstring"])
+    return np.where(nones,strnone,strings)
 
 # dtl = [datetime.datetime.today(),datetime.datetime.today()]
 # dtn = np.array(dtl,dtype=np.datetime64)
@@ -162,6 +495,33 @@ datetime2str = np.vectorize(datetime2str,otypes=[str],excluded=["datetimenone","
 # print(datetime2str(dtl))
 # print(datetime2str(dtn))
 
+def tokenize(buffer,values,delimiter=None,comments="#",ncols=0):
+    """It parses the numbers in the bytes buffer into values and returns how many were written.
+    It is the numpy counterpart of vectorcy.tokenize used when the extension is not built: every
+    delimiter bounds a field, the comments start the ignored rest of a line and, if ncols is
+    positive, each line with data must have ncols fields."""
+
+    delimiter = None if delimiter==" " else delimiter
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        numbers = np.loadtxt(io.BytesIO(buffer),dtype=values.dtype,delimiter=delimiter,comments=comments,ndmin=2)
+
+    if ncols>0 and numbers.size>0 and numbers.shape[1]!=ncols:
+        raise ValueError(f"a line has {numbers.shape[1]} fields instead of {ncols}")
+
+    if numbers.size>values.size:
+        raise ValueError("the buffer contains more numbers than values can hold")
+
+    values[:numbers.size] = numbers.ravel()
+
+    return numbers.size
+
+def tokenize_int(buffer,values,delimiter=None,comments="#",ncols=0):
+    """It parses the integers in the bytes buffer into values and returns how many were written."""
+
+    return tokenize(buffer,values,delimiter,comments,ncols)
+
 def starsplit(text,default=1.0):
     """It returns star splitted list repeating post-star pre-star times."""
 
@@ -396,9 +396,11 @@ def TimeView(data=None):
                 self.footer.see(tk.END)
                 return
 
+            frames = {}
+
             for attrname in self.attrnames:
                 if hasattr(self,attrname):
-                    getattr(self,attrname).filter(0,keywords=[itemname],inplace=False)
+                    frames[attrname] = getattr(self,attrname).filter(0,keywords=[itemname],inplace=False)
 
             if hasattr(self,"lines"):
                 [line.remove() for line in self.lines]
@@ -419,13 +421,13 @@ def TimeView(data=None):
 
                 for xaxis,yaxis,color,marker,lstyle,dstyle in zip(xaxes,yaxes,colors,markers,lstyles,dstyles):
                     line = axis.plot(
-                        getattr(self,self.attrnames[xaxis[0]]).running[xaxis[1]],
-                        getattr(self,self.attrnames[yaxis[0]]).running[yaxis[1]],
+                        frames[self.attrnames[xaxis[0]]].running[xaxis[1]],
+                        frames[self.attrnames[yaxis[0]]].running[yaxis[1]],
                         color=self.linecolors[color][0],
                         marker=self.markers[marker][0],
                         linestyle=self.linestyles[lstyle][0],
                         drawstyle=self.drawstyles[dstyle],
-                        label=getattr(self,self.attrnames[yaxis[0]]).headers[yaxis[1]])[0]
+                        label=frames[self.attrnames[yaxis[0]]].heads[yaxis[1]])[0]
                     self.lines.append(line)
 
                 # if self.curtemp.get("legends")[index]:
@@ -23,6 +23,9 @@ from textio import IrrText
 from textio import WSchedule
 from textio import VTKit
 
+from textio import shift_months
+from textio import snap_months
+
 from graphics import TimeView
 from graphics import LogView
 from graphics import PerfView
@@ -703,8 +706,8 @@ def Wells(graph=None,data=None):
             for wname in np.setdiff1d(compwellnames,prodwellnames):
                 warnings.warn(warnNOPROD.format(wname))
 
-            proddata = frame(headers=self.headers_op[:7])
-            schedule = frame(headers=self.schedule_headers)
+            proddata = DataFrame().builder(heads=self.headers_op[:7])
+            schedule = DataFrame().builder(heads=self.schedule_headers)
 
             for wname in self.itemnames:
 
@@ -731,12 +734,14 @@ def Wells(graph=None,data=None):
 
                 rows = np.array([shutwells,shutdates,shutdays,shutoptype,shutroil,shutrwater,shutrgas]).T.tolist()
 
-                proddata.set_rows(rows)
+                proddata.add_rows(rows)
 
                 if flagShowSteps:
                     print("{} check is complete.".format(wname))
 
-            proddata.sort(header_indices=[1],inplace=True)
+            proddata = proddata.finalize()
+
+            proddata.sort(cols=1,inplace=True)
 
             toil = np.cumsum(proddata.running[4])
             twater = np.cumsum(proddata.running[5])
@@ -763,13 +768,13 @@ def Wells(graph=None,data=None):
             warnWPLUG = "{:%Y-%m-%d}: {} last plug date does not fit production days."
             warnWEFAC = "{:%Y-%m-%d}: {} efficiency is more than unit [{:2d} out of {:2d} days]."
 
-            self.op2.filter(0,keywords=[wname],inplace=False)
+            op2 = self.op2.filter(0,keywords=[wname],inplace=False)
 
-            self.comp1.filter(0,keywords=[wname],inplace=False)
-            self.compuni.filter(0,keywords=[wname],inplace=False)
+            comp1 = self.comp1.filter(0,keywords=[wname],inplace=False)
+            compuni = self.compuni.filter(0,keywords=[wname],inplace=False)
 
             try:
-                datemin = self.op2.running[1].min()
+                datemin = op2.running[1].min()
             except ValueError:
                 datemin = datetime(3000,1,1)
 
@@ -779,82 +784,96 @@ def Wells(graph=None,data=None):
 
             date = datetime(date.year,date.month,days)
 
-            if self.compuni.running[1].min()>=date:
+            if compuni.running[1].min()>=date:
                 warnings.warn(warnCROSS.format(wname))
 
-            schedule.set_rows([[self.comp1.running[1][0],"WELSPECS",self.schedule_welspecs.format(wname)]])
+            schedule.add_row([comp1.running[1][0],"WELSPECS",self.schedule_welspecs.format(wname)])
 
-            for compdate,compevent,comptop,compbottom in zip(self.comp1.running[1],self.comp1.running[2],self.comp1.running[3],self.comp1.running[4]):
+            for compdate,compevent,comptop,compbottom in zip(comp1.running[1],comp1.running[2],comp1.running[3],comp1.running[4]):
 
                 if compevent == "PERF":
-                    schedule.set_rows([[compdate,"COMPDATMD",self.schedule_compdatop.format(wname,comptop,compbottom,"OPEN")]])
+                    schedule.add_row([compdate,"COMPDATMD",self.schedule_compdatop.format(wname,comptop,compbottom,"OPEN")])
                 elif compevent == "PLUG":
-                    schedule.set_rows([[compdate,"COMPDATMD",self.schedule_compdatsh.format(wname,comptop,"1*","SHUT")]])
+                    schedule.add_row([compdate,"COMPDATMD",self.schedule_compdatsh.format(wname,comptop,"1*","SHUT")])
+
+            for compunidate in compuni.running[1]:
+
+                schedule.add_row([compunidate,"COMPORD",self.schedule_compord.format(wname)])
+
+            compsort = np.argsort(np.asarray(compuni.running[1].vals,dtype="datetime64[D]"),kind="stable")
+
+            compdates = np.asarray(compuni.running[1].vals,dtype="datetime64[D]")[compsort]
+            compvals = compdates.astype("datetime64[us]").astype(object)
+            compcounts = np.asarray(compuni.running[2].vals)[compsort]
+
+            compshuts = np.append(compcounts==0,False)
+            compshutcums = np.concatenate(([0],np.cumsum(compshuts[:-1])))
+
+            opdates = np.asarray(op2.running[1].vals,dtype="datetime64[D]")
+
+            prodmonthSTARTdays = opdates+1
+            prodmonthFIRSTdays = prodmonthSTARTdays.astype("datetime64[M]").astype("datetime64[D]")
+            prodmonthENDdays = (prodmonthSTARTdays.astype("datetime64[M]")+1).astype("datetime64[D]")-1
+            prodmonthdaycounts = (prodmonthENDdays-prodmonthFIRSTdays).astype(int)+1
+
+            compBEFOREcounts = np.searchsorted(compdates,prodmonthSTARTdays,side="left")
+            compSTARTindices = np.maximum(compBEFOREcounts-1,0)
+            compENDindices = np.searchsorted(compdates,prodmonthENDdays,side="right")
+
+            flagsNoPostProd = np.append(shift_months(opdates[1:],-1)>prodmonthENDdays[:-1],True)
 
-            for compunidate in self.compuni.running[1]:
+            flagsCompShutSTART = np.logical_or(compBEFOREcounts==0,compshuts[compSTARTindices])
+            flagsCompShutEND = compshuts[compENDindices-1]
 
-                schedule.set_rows([[compunidate,"COMPORD",self.schedule_compord.format(wname)]])
+            innerSTART = np.minimum(compSTARTindices+1,compcounts.size)
+            innerEND = np.maximum(compENDindices-1,innerSTART)
+
+            flagsPlugPerf = compshutcums[innerEND]>compshutcums[innerSTART]
 
             flagNoPrevProd = True
 
             print("{} schedule is in progress ...".format(wname))
 
             opdata = zip(
-                self.op2.running[1],
-                self.op2.running[2],
-                self.op2.running[3],
-                self.op2.running[4],
-                self.op2.running[5],
-                self.op2.running[6],
+                op2.running[1],
+                op2.running[2],
+                op2.running[3],
+                op2.running[4],
+                op2.running[5],
+                op2.running[6],
                 )
 
             shutdates = []
 
             for index,(date,days,optype,oil,water,gas) in enumerate(opdata):
 
-                prodmonthSTARTday = date+relativedelta(days=1)
-
-                prodmonthdaycount = calendar.monthrange(prodmonthSTARTday.year,prodmonthSTARTday.month)[1]
-
-                prodmonthENDday = datetime(prodmonthSTARTday.year,prodmonthSTARTday.month,prodmonthdaycount)
+                prodmonthdaycount = int(prodmonthdaycounts[index])
 
-                if np.sum(self.compuni.running[1]<prodmonthSTARTday)==0:
-                    compSTARTindex = 0
-                else:
-                    compSTARTindex = np.sum(self.compuni.running[1]<prodmonthSTARTday)-1
-
-                compENDindex = np.sum(self.compuni.running[1]<=prodmonthENDday)
+                prodmonthENDday = prodmonthENDdays[index].astype("datetime64[us]").item()
 
-                compupdatedates = self.compuni.running[1][compSTARTindex:compENDindex]
-                compupdatecounts = self.compuni.running[2][compSTARTindex:compENDindex]
+                compupdatedates = compvals[compSTARTindices[index]:compENDindices[index]]
+                compupdatecounts = compcounts[compSTARTindices[index]:compENDindices[index]]
 
                 perfdates = compupdatedates[compupdatecounts!=0]
                 plugdates = compupdatedates[compupdatecounts==0]
 
-                try:
-                    flagNoPostProd = True if self.op2.running[1][index+1]-relativedelta(months=1)>prodmonthENDday else False
-                except IndexError:
-                    flagNoPostProd = True
+                flagNoPostProd = flagsNoPostProd[index]
 
-                if np.sum(self.compuni.running[1]<prodmonthSTARTday)==0:
-                    flagCompShutSTART = True
-                else:
-                    flagCompShutSTART = compupdatecounts[0]==0
+                flagCompShutSTART = flagsCompShutSTART[index]
+                flagCompShutEND = flagsCompShutEND[index]
 
-                flagCompShutEND = compupdatecounts[-1]==0
-
-                flagPlugPerf = any([compopencount==0 for compopencount in compupdatecounts[1:-1]])
+                flagPlugPerf = flagsPlugPerf[index]
 
                 if flagCompShutSTART and flagCompShutEND:
                     compday = plugdates[-1].day-perfdates[0].day
                     prodeff = days/compday
                     if optype == "production":
-                        schedule.set_rows([[perfdates[0],"WCONHIST",self.schedule_prodhist.format(wname,oil,water,gas)]])
+                        schedule.add_row([perfdates[0],"WCONHIST",self.schedule_prodhist.format(wname,oil,water,gas)])
                     elif optype == "injection":
-                        schedule.set_rows([[perfdates[0],"WCONINJH",self.schedule_injhist.format(wname,water)]])
-                    schedule.set_rows([[perfdates[0],"WEFAC",self.schedule_wefac.format(wname,prodeff)]])
-                    proddata.set_rows([[wname,perfdates[0],days,optype,oil,water,gas]])
-                    schedule.set_rows([[plugdates[-1],"WELOPEN",self.schedule_welopen.format(wname)]])
+                        schedule.add_row([perfdates[0],"WCONINJH",self.schedule_injhist.format(wname,water)])
+                    schedule.add_row([perfdates[0],"WEFAC",self.schedule_wefac.format(wname,prodeff)])
+                    proddata.add_row([wname,perfdates[0],days,optype,oil,water,gas])
+                    schedule.add_row([plugdates[-1],"WELOPEN",self.schedule_welopen.format(wname)])
                     shutdates.append(plugdates[-1])
                     flagNoPrevProd = True
                     if flagShowSteps:
@@ -864,13 +883,13 @@ def Wells(graph=None,data=None):
                     compday = prodmonthENDday.day-perfdates[0].day
                     prodeff = days/compday
                     if optype == "production":
-                        schedule.set_rows([[perfdates[0],"WCONHIST",self.schedule_prodhist.format(wname,oil,water,gas)]])
+                        schedule.add_row([perfdates[0],"WCONHIST",self.schedule_prodhist.format(wname,oil,water,gas)])
                     elif optype == "injection":
-                        schedule.set_rows([[perfdates[0],"WCONINJH",self.schedule_injhist.format(wname,water)]])
-                    schedule.set_rows([[perfdates[0],"WEFAC",self.schedule_wefac.format(wname,prodeff)]])
-                    proddata.set_rows([[wname,perfdates[0],days,optype,oil,water,gas]])
+                        schedule.add_row([perfdates[0],"WCONINJH",self.schedule_injhist.format(wname,water)])
+                    schedule.add_row([perfdates[0],"WEFAC",self.schedule_wefac.format(wname,prodeff)])
+                    proddata.add_row([wname,perfdates[0],days,optype,oil,water,gas])
                     if flagNoPostProd:
-                        schedule.set_rows([[prodmonthENDday,"WELOPEN",self.schedule_welopen.format(wname)]])
+                        schedule.add_row([prodmonthENDday,"WELOPEN",self.schedule_welopen.format(wname)])
                         shutdates.append(prodmonthENDday)
                         flagNoPrevProd = True
                         if flagShowSteps:
@@ -888,12 +907,12 @@ def Wells(graph=None,data=None):
                     compday = plugdate.day
                     prodeff = days/compday
                     if optype == "production":
-                        schedule.set_rows([[date,"WCONHIST",self.schedule_prodhist.format(wname,oil,water,gas)]])
+                        schedule.add_row([date,"WCONHIST",self.schedule_prodhist.format(wname,oil,water,gas)])
                     elif optype == "injection":
-                        schedule.set_rows([[date,"WCONINJH",self.schedule_injhist.format(wname,water)]])
-                    schedule.set_rows([[date,"WEFAC",self.schedule_wefac.format(wname,prodeff)]])
-                    proddata.set_rows([[wname,date,days,optype,oil,water,gas]])
-                    schedule.set_rows([[plugdate,"WELOPEN",self.schedule_welopen.format(wname)]])
+                        schedule.add_row([date,"WCONINJH",self.schedule_injhist.format(wname,water)])
+                    schedule.add_row([date,"WEFAC",self.schedule_wefac.format(wname,prodeff)])
+                    proddata.add_row([wname,date,days,optype,oil,water,gas])
+                    schedule.add_row([plugdate,"WELOPEN",self.schedule_welopen.format(wname)])
                     shutdates.append(plugdate)
                     flagNoPrevProd = True
                     if flagShowSteps:
@@ -908,12 +927,12 @@ def Wells(graph=None,data=None):
                         compday = plugdates[-1].day-perfdates[1].day
                         prodeff = days/compday
                         if optype == "production":
-                            schedule.set_rows([[perfdates[1],"WCONHIST",self.schedule_prodhist.format(wname,oil,water,gas)]])
+                            schedule.add_row([perfdates[1],"WCONHIST",self.schedule_prodhist.format(wname,oil,water,gas)])
                         elif optype == "injection":
-                            schedule.set_rows([[perfdates[1],"WCONINJH",self.schedule_injhist.format(wname,water)]])
-                        schedule.set_rows([[perfdates[1],"WEFAC",self.schedule_wefac.format(wname,prodeff)]])
-                        proddata.set_rows([[wname,perfdates[1],days,optype,oil,water,gas]])
-                        schedule.set_rows([[plugdates[-1],"WELOPEN",self.schedule_welopen.format(wname)]])
+                            schedule.add_row([perfdates[1],"WCONINJH",self.schedule_injhist.format(wname,water)])
+                        schedule.add_row([perfdates[1],"WEFAC",self.schedule_wefac.format(wname,prodeff)])
+                        proddata.add_row([wname,perfdates[1],days,optype,oil,water,gas])
+                        schedule.add_row([plugdates[-1],"WELOPEN",self.schedule_welopen.format(wname)])
                         shutdates.append(plugdates[-1])
                         flagNoPrevProd = True
                         if flagShowSteps:
@@ -927,11 +946,11 @@ def Wells(graph=None,data=None):
                         compday = prodmonthENDday.day-perfdate.day
                         prodeff = days/compday
                         if optype == "production":
-                            schedule.set_rows([[perfdate,"WCONHIST",self.schedule_prodhist.format(wname,oil,water,gas)]])
+                            schedule.add_row([perfdate,"WCONHIST",self.schedule_prodhist.format(wname,oil,water,gas)])
                         elif optype == "injection":
-                            schedule.set_rows([[perfdate,"WCONINJH",self.schedule_injhist.format(wname,water)]])
-                        schedule.set_rows([[perfdate,"WEFAC",self.schedule_wefac.format(wname,prodeff)]])
-                        proddata.set_rows([[wname,perfdate,days,optype,oil,water,gas]])
+                            schedule.add_row([perfdate,"WCONINJH",self.schedule_injhist.format(wname,water)])
+                        schedule.add_row([perfdate,"WEFAC",self.schedule_wefac.format(wname,prodeff)])
+                        proddata.add_row([wname,perfdate,days,optype,oil,water,gas])
                         flagNoPrevProd = False
                         if flagShowSteps:
                             print("{:%d %b %Y} Plugged and Perforated: OPEN ({:%d %b %Y}) and CONT WEFAC ({:.3f})".format(prodmonthENDday,perfdate,prodeff))
@@ -944,12 +963,12 @@ def Wells(graph=None,data=None):
                         compday = plugdate.day
                         prodeff = days/compday
                         if optype == "production":
-                            schedule.set_rows([[date,"WCONHIST",self.schedule_prodhist.format(wname,oil,water,gas)]])
+                            schedule.add_row([date,"WCONHIST",self.schedule_prodhist.format(wname,oil,water,gas)])
                         elif optype == "injection":
-                            schedule.set_rows([[date,"WCONINJH",self.schedule_injhist.format(wname,water)]])
-                        schedule.set_rows([[date,"WEFAC",self.schedule_wefac.format(wname,prodeff)]])
-                        proddata.set_rows([[wname,date,days,optype,oil,water,gas]])
-                        schedule.set_rows([[plugdate,"WELOPEN",self.schedule_welopen.format(wname)]])
+                            schedule.add_row([date,"WCONINJH",self.schedule_injhist.format(wname,water)])
+                        schedule.add_row([date,"WEFAC",self.schedule_wefac.format(wname,prodeff)])
+                        proddata.add_row([wname,date,days,optype,oil,water,gas])
+                        schedule.add_row([plugdate,"WELOPEN",self.schedule_welopen.format(wname)])
                         shutdates.append(plugdate)
                         flagNoPrevProd = True
                         if flagShowSteps:
@@ -967,29 +986,29 @@ def Wells(graph=None,data=None):
                         else:
                             compday = plugdate.day
                             prodeff = days/compday
-                            schedule.set_rows([[plugdate,"WELOPEN",self.schedule_welopen.format(wname)]])
+                            schedule.add_row([plugdate,"WELOPEN",self.schedule_welopen.format(wname)])
                             shutdates.append(plugdate)
                             flagNoPrevProd = True
                             if flagShowSteps:
                                 print("{:%d %b %Y} Plugged and Perforated: CONT and SHUT ({:%d %b %Y}) WEFAC ({:.3f})".format(prodmonthENDday,plugdate,prodeff))
                         if optype == "production":
-                            schedule.set_rows([[date,"WCONHIST",self.schedule_prodhist.format(wname,oil,water,gas)]])
+                            schedule.add_row([date,"WCONHIST",self.schedule_prodhist.format(wname,oil,water,gas)])
                         elif optype == "injection":
-                            schedule.set_rows([[date,"WCONINJH",self.schedule_injhist.format(wname,water)]])
-                        schedule.set_rows([[date,"WEFAC",self.schedule_wefac.format(wname,prodeff)]])
-                        proddata.set_rows([[wname,date,days,optype,oil,water,gas]])
+                            schedule.add_row([date,"WCONINJH",self.schedule_injhist.format(wname,water)])
+                        schedule.add_row([date,"WEFAC",self.schedule_wefac.format(wname,prodeff)])
+                        proddata.add_row([wname,date,days,optype,oil,water,gas])
 
                 else:
                     compday = prodmonthdaycount
                     prodeff = days/compday
                     if optype == "production":
-                        schedule.set_rows([[date,"WCONHIST",self.schedule_prodhist.format(wname,oil,water,gas)]])
+                        schedule.add_row([date,"WCONHIST",self.schedule_prodhist.format(wname,oil,water,gas)])
                     elif optype == "injection":
-                        schedule.set_rows([[date,"WCONINJH",self.schedule_injhist.format(wname,water)]])
-                    schedule.set_rows([[date,"WEFAC",self.schedule_wefac.format(wname,prodeff)]])
-                    proddata.set_rows([[wname,date,days,optype,oil,water,gas]])
+                        schedule.add_row([date,"WCONINJH",self.schedule_injhist.format(wname,water)])
+                    schedule.add_row([date,"WEFAC",self.schedule_wefac.format(wname,prodeff)])
+                    proddata.add_row([wname,date,days,optype,oil,water,gas])
                     if flagNoPostProd:
-                        schedule.set_rows([[prodmonthENDday,"WELOPEN",self.schedule_welopen.format(wname)]])
+                        schedule.add_row([prodmonthENDday,"WELOPEN",self.schedule_welopen.format(wname)])
                         shutdates.append(prodmonthENDday)
                         flagNoPrevProd = True
                         if flagShowSteps:
@@ -1094,7 +1113,7 @@ def Completion(graph=None,data=None):
             warnSTOPDATE = "{} stop date is not set properly in completion directory."
             warnSTARTEND = "{} start date is after or equal to stop date in completion directory."
 
-            compraw = frame(headers=self.headers_compraw)
+            compraw = DataFrame().builder(heads=self.headers_compraw)
 
             for wname in self.itemnames:
 
@@ -1143,7 +1162,9 @@ def Completion(graph=None,data=None):
                 if any([(s2-s1).days<0 for s1,s2 in zip(comp.running[4].tolist(),comp.running[5].tolist())]):
                     warnings.warn(warnSTARTEND.format(wname))
 
-                compraw.set_rows(comp.get_rows())
+                compraw.add_rows(comp.get_rows())
+
+            compraw = compraw.finalize()
 
             path = os.path.join(self.workdir,self.filename_comp+"0")
 
@@ -1202,7 +1223,7 @@ def Completion(graph=None,data=None):
 
             comp1.get_columns(headers=self.headers_comp,inplace=True)
 
-            comp1.sort(header_indices=[1],inplace=True)
+            comp1.sort(cols=1,inplace=True)
 
             path = os.path.join(self.workdir,self.filename_comp+"1")
 
@@ -1210,28 +1231,28 @@ def Completion(graph=None,data=None):
 
             comp1.write(filepath=path,fstring=fstring)
 
-            compuni = frame(headers=self.headers_compuni)
+            compuni = DataFrame().builder(heads=self.headers_compuni)
 
             for wname in self.itemnames:
 
-                comp1.filter(0,keywords=[wname],inplace=False)
+                wellcomp = comp1.filter(0,keywords=[wname],inplace=False)
 
-                update_dates = np.unique(comp1.running[1])
+                update_dates = np.unique(wellcomp.running[1])
                 update_wells = np.empty(update_dates.size,dtype=object)
                 update_counts = np.zeros(update_dates.size,dtype=int)
 
                 update_wells[:] = wname
 
                 update_indices = np.insert(
-                    np.cumsum(np.sum(comp1.running[1]==update_dates.reshape((-1,1)),axis=1)),0,0)
+                    np.cumsum(np.sum(wellcomp.running[1]==update_dates.reshape((-1,1)),axis=1)),0,0)
 
                 open_intervals = np.empty((0,2))
 
                 for index,date in enumerate(update_dates):
 
-                    compevents = comp1.running[2][update_indices[index]:update_indices[index+1]]
-                    compuppers = comp1.running[3][update_indices[index]:update_indices[index+1]]
-                    complowers = comp1.running[4][update_indices[index]:update_indices[index+1]]
+                    compevents = wellcomp.running[2][update_indices[index]:update_indices[index+1]]
+                    compuppers = wellcomp.running[3][update_indices[index]:update_indices[index+1]]
+                    complowers = wellcomp.running[4][update_indices[index]:update_indices[index+1]]
 
                     perfevents = compevents=="PERF"
 
@@ -1252,11 +1273,13 @@ def Completion(graph=None,data=None):
 
                 rows = np.array([update_wells,update_dates,update_counts]).T.tolist()
 
-                compuni.set_rows(rows)
+                compuni.add_rows(rows)
+
+            compuni = compuni.finalize()
 
             compuni.astype(header_index=2,dtype=int)
 
-            compuni.sort(header_indices=[1],inplace=True)
+            compuni.sort(cols=1,inplace=True)
 
             path = os.path.join(self.workdir,self.filename_comp+"uni")
 
@@ -1316,7 +1339,7 @@ def Completion(graph=None,data=None):
                     self.attrnames.append(attrname)
 
                     if wellname is not None:
-                        getattr(self,attrname).filter(0,keywords=[wellname],inplace=False)
+                        setattr(self,attrname,getattr(self,attrname).filter(0,keywords=[wellname],inplace=False))
 
     return CompletionClass
 
@@ -1389,7 +1412,7 @@ def Production(graph=None,data=None):
 
             prod.texttocolumn(0,deliminator="\t",maxsplit=7)
             prod.get_columns(headers=self.headers_opraw,inplace=True)
-            prod.sort(header_indices=[1],inplace=True)
+            prod.sort(cols=1,inplace=True)
 
             prod.astype(header=self.headers_opraw[1],datestring=True)
             prod.astype(header=self.headers_opraw[2],dtype=np.int64)
@@ -1398,10 +1421,10 @@ def Production(graph=None,data=None):
             prod.astype(header=self.headers_opraw[5],dtype=np.float64)
             prod.astype(header=self.headers_opraw[6],dtype=np.float64)
 
-            vdate1 = np.vectorize(lambda x: x.day!=calendar.monthrange(x.year,x.month)[1])
+            notmonthend = snap_months(prod.running[1],"end")!=np.asarray(prod.running[1],dtype="datetime64[us]")
 
-            if any(vdate1(prod.running[1])):
-                for index in np.where(vdate1(prod.running[1]))[0]:
+            if any(notmonthend):
+                for index in np.where(notmonthend)[0]:
                     well = prod.running[0][index]
                     date = prod.running[1][index]
                     warnings.warn(warnDNEOM.format(date,well))
@@ -1468,14 +1491,7 @@ def Production(graph=None,data=None):
                 vname = np.vectorize(lambda x: self.wnamefstr.format(re.sub("[^0-9]","",str(x)).zfill(3)))
                 prod.set_column(vname(prod.running[0]),header_index=0)
 
-            def shifting(x):
-                date = x+relativedelta(months=-1)
-                days = calendar.monthrange(date.year,date.month)[1]
-                return datetime(date.year,date.month,days)
-
-            vdate3 = np.vectorize(lambda x: shifting(x))
-
-            prod.set_column(vdate3(prod.running[1]),header_index=1)
+            prod.set_column(shift_months(prod.running[1],-1,snap="end"),header_index=1)
 
             path = os.path.join(self.workdir,self.filename_op+"1")
 
@@ -1557,7 +1573,7 @@ def Production(graph=None,data=None):
                     self.attrnames.append(attrname)
 
                     if wellname is not None:
-                        getattr(self,attrname).filter(0,keywords=[wellname],inplace=False)
+                        setattr(self,attrname,getattr(self,attrname).filter(0,keywords=[wellname],inplace=False))
 
     return ProductionClass
 
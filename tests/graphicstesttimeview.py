@@ -0,0 +1,64 @@
+import unittest
+
+import numpy as np
+
+if __name__ == "__main__":
+    import setup
+
+from matplotlib import pyplot as plt
+
+from textio import DataFrame
+
+from graphics import TimeView
+
+class TestTimeView(unittest.TestCase):
+
+    class Widget():
+
+        def __init__(self,selection=()):
+            self.selection = selection
+
+        def curselection(self):
+            return self.selection
+
+        def update(self):
+            pass
+
+        def draw(self):
+            pass
+
+    def test_set_lines(self):
+
+        view = TimeView().__new__(TimeView())
+
+        view.prod = DataFrame()
+
+        view.prod["well"] = np.array(["A01","B02","A01","B02"])
+        view.prod["date"] = np.array(["2020-01-31","2020-01-31","2020-02-29","2020-02-29"],dtype="datetime64[D]")
+        view.prod["oil"] = np.array([1.,5.,2.,6.])
+
+        view.attrnames = ["prod"]
+        view.itemnames = ["A01","B02"]
+
+        view.itembox = self.Widget()
+        view.itembox.listbox = self.Widget((1,))
+
+        view.plotbar = self.Widget()
+        view.canvas = self.Widget()
+
+        view.figure = plt.figure()
+        view.axes = [view.figure.add_subplot()]
+
+        view.curtemp = dict(xaxes=[[(0,1)]],yaxes=[[(0,2)]],colors=[[0]],markers=[[0]],linestyles=[[0]],drawstyles=[[0]])
+
+        view.set_lines(None)
+
+        np.testing.assert_array_equal(view.lines[0].get_ydata(),np.array([5.,6.]))
+
+        np.testing.assert_array_equal(view.prod["oil"].vals,np.array([1.,5.,2.,6.]))
+
+        plt.close(view.figure)
+                       
+if __name__ == "__main__":
+
+    unittest.main()
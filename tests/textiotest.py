@@ -4,6 +4,8 @@ import logging
 
 import os
 
+import tempfile
+
 import unittest
 
 import numpy as np
@@ -14,15 +16,39 @@ if __name__ == "__main__":
 from textio import DirBase
 from textio import Nones
 from textio import Column
+from textio import CatColumn
+from textio import Expression
 from textio import DataFrame
+from textio import RowBuilder
 from textio import RegText
 from textio import LogASCII
 from textio import Excel
 from textio import IrrText
 from textio import WSchedule
 from textio import VTKit
-
+from textio import TextCache
+from textio import loadtxt
+from textio import loadnum
+from textio import shift_months
+from textio import monthly_dates
+from textio import get_unitregistry
+from textio import get_unitfactors
+
+from cypy.vectorpy import str2int
 from cypy.vectorpy import str2float
+from cypy.vectorpy import str2str
+from cypy.vectorpy import str2datetime
+from cypy.vectorpy import infer_datetime_format
+from cypy.vectorpy import int2str
+from cypy.vectorpy import float2str
+from cypy.vectorpy import datetime2str
+
+from cypy import vectorpy
+
+try:
+    from cypy import vectorcy
+except ImportError:
+    vectorcy = None
 
 class TestDirBase(unittest.TestCase):
 
@@ -284,6 +310,72 @@ class TestColumn(unittest.TestCase):
         column = Column(head="datetime",size=10,dtype=np.datetime64)
         self.assertEqual(column._valstr_(2),"['2000-01-01T00:00:00.000000',...,'2000-10-01T00:00:00.000000']")
 
+    def test_bitmap(self):
+
+        column = Column(vals=np.array([5,-99_999,7,9]),valid=[True,True,False,True])
+
+        self.assertIs(column.dtypeM,int)
+        np.testing.assert_array_equal(column.isnone(),np.array([False,False,True,False]))
+        self.assertTrue(column.isvalid(1))
+        self.assertFalse(column.isvalid(2))
+        self.assertTrue(column.isvalid(-1))
+
+        np.testing.assert_array_equal(column[1:].isnone(),np.array([False,True,False]))
+
+        other = Column(vals=np.array([1,2,3,4]),valid=[False,True,True,True])
+
+        np.testing.assert_array_equal((column+other).isnone(),np.array([True,False,True,False]))
+        np.testing.assert_array_equal((column*2).isnone(),np.array([False,False,True,False]))
+
+        sentinel = Column(vals=np.array([3,4,5,-99_999]))
+
+        np.testing.assert_array_equal((column+sentinel).isnone(),np.array([False,False,True,True]))
+        np.testing.assert_array_equal((sentinel+column).isnone(),np.array([False,False,True,True]))
+
+        floats = Column(vals=np.array([np.nan,1.,2.,3.]))
+
+        np.testing.assert_array_equal((floats*column).isnone(),np.array([True,False,True,False]))
+
+        column[2] = 8
+        np.testing.assert_array_equal(column.isnone(),np.array([False,False,False,False]))
+
+        column = Column(vals=np.array([1.,np.nan,3.]))
+        column.set_bitmap()
+        column.astype(int)
+        np.testing.assert_array_equal(column.vals,np.array([1,0,3]))
+        np.testing.assert_array_equal(column.isnone(),np.array([False,True,False]))
+
+        column.del_bitmap()
+        np.testing.assert_array_equal(column.vals,np.array([1,-99_999,3]))
+        self.assertIsNone(column.bitmap)
+
+        df = DataFrame(A=np.array([1,2,3]))
+        df["A"].set_bitmap([True,False,True])
+        df.filter("A",keywords=[2,3])
+        np.testing.assert_array_equal(df["A"].isnone(),np.array([True,False]))
+
+    def test_view(self):
+
+        column = Column(vals=np.arange(10.),head="DEPT",unit="m")
+
+        view = column.view(slice(2,5))
+
+        self.assertTrue(np.shares_memory(view.vals,column.vals))
+        self.assertEqual(view.unit,"m")
+        np.testing.assert_array_equal(view.vals,np.array([2.,3.,4.]))
+
+        view[0] = 50.
+
+        self.assertFalse(np.shares_memory(view.vals,column.vals))
+        self.assertEqual(column.vals[2],2.)
+
+        view = column.view(slice(2,5))
+
+        column[3] = 60.
+
+        np.testing.assert_array_equal(view.vals,np.array([2.,3.,4.]))
+        self.assertEqual(column.vals[3],60.)
+
     def test_nondim(self):
         
         column = Column(["1.","2"],unit="m")
@@ -342,6 +434,17 @@ class TestColumn(unittest.TestCase):
         column.convert("km")
         np.testing.assert_array_equal(column.vals,np.array([0.001,0.002]))
 
+        column = Column(head="temperature",vals=[0.,100.],unit="degC")
+        column = column.convert("degF",inplace=False)
+        np.testing.assert_allclose(column.vals,np.array([32.,212.]))
+        self.assertEqual(column.unit,"degF")
+
+        self.assertIs(get_unitregistry(),get_unitregistry())
+
+        scale,offset = get_unitfactors("ft","m")
+        self.assertAlmostEqual(scale,0.3048)
+        self.assertEqual(offset,0.)
+
     def test_shift(self):
 
         column = Column(head="integers",vals=np.array([1,2,3,4,5],dtype=int))
@@ -387,6 +490,39 @@ class TestColumn(unittest.TestCase):
                 np.datetime64('2019-12-12'),
                 np.datetime64('NaT')]))
 
+    def test_shift_months(self):
+
+        column = Column(np.array(["2020-01-31","2020-03-15T06:00","NaT","2019-12-31"],dtype="datetime64[us]"))
+
+        shifted = column.shift(1,"M",inplace=False)
+
+        np.testing.assert_array_equal(shifted.vals,np.array([
+            "2020-02-29","2020-04-15T06:00","2020-01-31"],dtype="datetime64[us]"))
+
+        column.shift(-1,"M",snap="end")
+
+        np.testing.assert_array_equal(column.vals,np.array([
+            "2019-12-31","2020-02-29","NaT","2019-11-30"],dtype="datetime64[us]"))
+
+        column = Column(np.array(["2020-02-29","2019-03-15T12:00","NaT","2020-02-29"],dtype="datetime64[us]"))
+
+        np.testing.assert_array_equal(column.shift(1,"Y",inplace=False).vals,np.array([
+            "2021-02-28","2020-03-15T12:00","2021-02-28"],dtype="datetime64[us]"))
+
+        column.shift(4,"Y")
+
+        np.testing.assert_array_equal(column.vals,np.array([
+            "2024-02-29","2023-03-15T12:00","NaT","2024-02-29"],dtype="datetime64[us]"))
+
+        np.testing.assert_array_equal(shift_months(np.array(["2020-02-29"],dtype="datetime64[D]"),12),
+            np.array(["2021-02-28"],dtype="datetime64[D]"))
+
+        np.testing.assert_array_equal(monthly_dates("2020-11-15",stop="2021-02-01",snap="end"),
+            np.array(["2020-11-30","2020-12-31","2021-01-31","2021-02-28"],dtype="datetime64[us]"))
+
+        np.testing.assert_array_equal(monthly_dates("2020-11-15",periods=2),
+            np.array(["2020-11-01","2020-12-01"],dtype="datetime64[us]"))
+
     def test_numeric_operations(self):
 
         # Addition
@@ -425,6 +561,35 @@ class TestColumn(unittest.TestCase):
         column/2
         column/column
 
+    def test_lazy_operations(self):
+
+        rw = Column(vals=np.full(1001,0.05),head="RW",unit="ohm*m")
+        rt = Column(vals=np.linspace(1,100,1001),head="RT",unit="ohm*m")
+        phi = Column(vals=np.linspace(0.05,0.3,1001),head="PHI")
+
+        expression = (rw.lazy()/((phi.lazy()**2)*rt))**0.5
+
+        self.assertIsInstance(expression,Expression)
+        self.assertEqual(expression.unit,"(ohm*m/(ohm*m))**0.5")
+
+        column = expression.evaluate(head="SW",chunksize=100)
+
+        np.testing.assert_allclose(column.vals,np.sqrt(rw.vals/(phi.vals**2*rt.vals)))
+        self.assertEqual(column.head,"SW")
+
+        shared = phi.lazy()*2
+        column = ((shared+1)*shared).evaluate(chunksize=7)
+
+        np.testing.assert_allclose(column.vals,(phi.vals*2+1)*phi.vals*2)
+
+        meters = Column(vals=[1.,1.],unit="m")
+        feet = Column(vals=[1.,2.],unit="ft")
+
+        column = (meters.lazy()+feet).evaluate()
+
+        np.testing.assert_allclose(column.vals,np.array([1.3048,1.6096]))
+        self.assertEqual(column.unit,"m")
+
     def test_property_methods(self):
 
         column = Column(np.arange(
@@ -439,10 +604,81 @@ class TestColumn(unittest.TestCase):
         np.testing.assert_array_equal(column.day,
             np.array([29,1,2,3]))
 
+        column = Column(np.array(["2019-12-31","2020-02-29","NaT","1969-07-20"],dtype="datetime64[D]"))
+
+        np.testing.assert_array_equal(column.year,np.array([2019,2020,-99_999,1969]))
+        np.testing.assert_array_equal(column.month,np.array([12,2,-99_999,7]))
+        np.testing.assert_array_equal(column.day,np.array([31,29,-99_999,20]))
+        np.testing.assert_array_equal(column.quarter,np.array([4,1,-99_999,3]))
+        np.testing.assert_array_equal(column.dayofyear,np.array([365,60,-99_999,201]))
+        np.testing.assert_array_equal(column.days_in_month,np.array([31,29,-99_999,31]))
+
         column = Column(np.arange(1,4))
 
         # self.assertEqual(column.year,None)
 
+class TestCatColumn(unittest.TestCase):
+
+    def test_categorize(self):
+
+        names = np.array(["B02","A01","B02","","C03","A01"])
+
+        column = Column(vals=names,head="WELL").categorize()
+
+        self.assertIsInstance(column,CatColumn)
+        np.testing.assert_array_equal(column.cats,np.array(["","A01","B02","C03"]))
+        np.testing.assert_array_equal(column.codes,np.array([2,1,2,0,3,1]))
+        np.testing.assert_array_equal(column.vals,names)
+
+        np.testing.assert_array_equal(column=="A01",names=="A01")
+        np.testing.assert_array_equal(column!="A01",names!="A01")
+        np.testing.assert_array_equal(column.isin(["C03","B02","D04"]),np.isin(names,["C03","B02"]))
+        np.testing.assert_array_equal(column.isnone(),names=="")
+
+        np.testing.assert_array_equal(column.unique(),np.array(["","A01","B02","C03"]))
+        np.testing.assert_array_equal(column.argsort(),np.argsort(names,kind="stable"))
+
+        self.assertIsInstance(column[1:3],CatColumn)
+        np.testing.assert_array_equal(column[1:3].vals,names[1:3])
+
+        column[3] = "D04"
+        np.testing.assert_array_equal(column.vals,np.array(["B02","A01","B02","D04","C03","A01"]))
+
+        self.assertIs(column.decategorize().dtypeM,str)
+
+        column.replace(new="X99",old="B02")
+        np.testing.assert_array_equal(column.vals,np.array(["X99","A01","X99","D04","C03","A01"]))
+
+        self.assertIsNone(column.astype(str,charcount=2))
+        np.testing.assert_array_equal(column.vals,np.array(["X9","A0","X9","D0","C0","A0"]))
+
+        with self.assertRaises(TypeError):
+            column.astype(int)
+
+    def test_frame_setitem(self):
+
+        df = DataFrame(a=np.array([1.,2.]))
+
+        df["b"] = df["a"]
+
+        self.assertEqual(df.heads,["a","b"])
+
+        df["b"][0] = 5.
+
+        np.testing.assert_array_equal(df["a"].vals,np.array([1.,2.]))
+        np.testing.assert_array_equal(df["b"].vals,np.array([5.,2.]))
+
+    def test_frame_filter(self):
+
+        df = DataFrame(WELL=np.array(["B02","A01","B02","C03"]),OIL=np.array([1.,2.,3.,4.]))
+
+        df["WELL"] = df["WELL"].categorize()
+
+        df.filter("WELL",keywords=["B02"])
+
+        np.testing.assert_array_equal(df["OIL"].vals,np.array([1.,3.]))
+        np.testing.assert_array_equal(df["WELL"].vals,np.array(["B02","B02"]))
+
 class TestDataFrame(unittest.TestCase):
 
     def test_init(self):
@@ -601,6 +837,32 @@ class TestDataFrame(unittest.TestCase):
 
         np.testing.assert_array_equal(df["b"],df[1])
 
+    def test_index(self):
+
+        df = DataFrame(a=[1,2],b=[3,4],c=[5,6])
+
+        self.assertEqual(df.index("a","c"),(0,2))
+
+        df.running.insert(0,Column(vals=["7 8","9 10"],head="z"))
+
+        self.assertEqual(df.index("a","c","z"),(1,3,0))
+
+        df.running.pop(1)
+
+        self.assertEqual(df.index("b","z"),(1,0))
+
+        with self.assertRaises(ValueError):
+            df.index("a")
+
+        df["a"] = [9,10]
+
+        self.assertEqual(df.index("a"),(3,))
+        np.testing.assert_array_equal(df["a"].vals,np.array([9,10]))
+
+        df.str2cols("z",delimiter=" ")
+
+        self.assertEqual(df.index("z_1","b","a"),(1,2,4))
+
     def test_str2cols(self):
 
         head = "first name\tlast name"
@@ -617,6 +879,21 @@ class TestDataFrame(unittest.TestCase):
         np.testing.assert_array_equal(df["head_1"],np.array(["smith","gates"]))
         np.testing.assert_array_equal(df["head_2"],np.array(["","john"]))
 
+        df = DataFrame(line=np.array(["A01  2020-01-31  12.5","B02 2020-02-29 7","C03"]))
+
+        df.str2cols("line",dtypes={1:np.datetime64,"line_2":float})
+
+        self.assertEqual(df.heads,["line","line_1","line_2"])
+        np.testing.assert_array_equal(df["line"].vals,np.array(["A01","B02","C03"]))
+        np.testing.assert_array_equal(df["line_1"].vals,np.array(["2020-01-31","2020-02-29","NaT"],dtype="datetime64[us]"))
+        np.testing.assert_array_equal(df["line_2"].vals,np.array([12.5,7.,np.nan]))
+
+        df = DataFrame(line=np.array(["a,b,c","d"]))
+
+        df.str2cols("line",delimiter=",",maxsplit=1)
+
+        np.testing.assert_array_equal(df["line_1"].vals,np.array(["b,c",""]))
+
     def test_cols2str(self):
 
         names = np.array(["elthon","john"])
@@ -646,9 +923,241 @@ class TestDataFrame(unittest.TestCase):
         np.testing.assert_array_equal(df.running[1],
             np.array(['A','B','B','C','C','C','D','E','F']),err_msg="DataFrame.unique() has an issue!")
 
+    def test_groupby(self):
+
+        df = DataFrame()
+
+        df["well"] = CatColumn(vals=np.array(["B","A","B","A","C"]))
+        df["date"] = np.array(["2020-01-31","2020-01-31","2020-02-29","2020-02-29","NaT"],dtype="datetime64[D]")
+        df["oil"] = np.array([1.,2.,np.nan,4.,5.])
+        df["days"] = np.array([31,30,-99_999,29,1])
+
+        frame = df.groupby("well",{"oil":["sum","mean","max","count","last"],"date":"min","days":"sum"})
+
+        self.assertEqual(frame.heads,["well","oil_sum","oil_mean","oil_max","oil_count","oil_last","date_min","days_sum"])
+
+        np.testing.assert_array_equal(frame["well"].vals,np.array(["A","B","C"]))
+        np.testing.assert_array_equal(frame["oil_sum"].vals,np.array([6.,1.,5.]))
+        np.testing.assert_array_equal(frame["oil_mean"].vals,np.array([3.,1.,5.]))
+        np.testing.assert_array_equal(frame["oil_max"].vals,np.array([4.,1.,5.]))
+        np.testing.assert_array_equal(frame["oil_count"].vals,np.array([2,1,1]))
+        np.testing.assert_array_equal(frame["oil_last"].vals,np.array([4.,1.,5.]))
+        np.testing.assert_array_equal(frame["date_min"].vals,np.array(["2020-01-31","2020-01-31","NaT"],dtype="datetime64[D]"))
+        np.testing.assert_array_equal(frame["days_sum"].vals,np.array([59,31,1]))
+
+        frame = df.groupby("well",{"oil":"first","date":["first","last"]})
+
+        np.testing.assert_array_equal(frame["oil_first"].vals,np.array([2.,1.,5.]))
+        np.testing.assert_array_equal(frame["date_first"].vals,np.array(["2020-01-31","2020-01-31","NaT"],dtype="datetime64[D]"))
+        np.testing.assert_array_equal(frame["date_last"].vals,np.array(["2020-02-29","2020-02-29","NaT"],dtype="datetime64[D]"))
+
+        frame = df.groupby(["well"],{"oil":"cumsum"})
+
+        np.testing.assert_array_equal(frame["oil_cumsum"].vals,np.array([1.,2.,1.,6.,5.]))
+
+        with self.assertRaises(ValueError):
+            df.groupby("well",{"oil":["sum","cumsum"]})
+
+        df = DataFrame()
+
+        df["well"] = np.array(["B","B","B","A"])
+        df["oil"] = np.array([0.1,0.2,0.3,1e17])
+
+        np.testing.assert_array_equal(df.groupby("well",{"oil":"cumsum"})["oil_cumsum"].vals,
+            np.cumsum([0.1,0.2,0.3]).tolist()+[1e17])
+
+        empty = DataFrame()
+
+        empty["well"] = np.array([],dtype=str)
+        empty["oil"] = np.array([],dtype=float)
+
+        frame = empty.groupby("well",{"oil":["sum","count"]})
+
+        self.assertEqual(frame.heads,["well","oil_sum","oil_count"])
+
+        self.assertEqual(frame["oil_sum"].vals.dtype,np.float64)
+        self.assertEqual(frame["oil_count"].vals.size,0)
+
+    def test_join(self):
+
+        prod = DataFrame()
+
+        prod["well"] = CatColumn(vals=np.array(["A","A","B","C",""]))
+        prod["date"] = np.array(["2020-01-31","2020-02-29","2020-01-31","2020-01-31","2020-01-31"],dtype="datetime64[D]")
+        prod["oil"] = np.arange(5.)
+
+        comp = DataFrame()
+
+        comp["well"] = CatColumn(vals=np.array(["A","A","B","D"]))
+        comp["date"] = np.array(["2020-01-15","2020-02-29","2020-02-01","2020-01-01"],dtype="datetime64[D]")
+        comp["count"] = np.array([1,2,3,4])
+
+        frame = prod.join(comp,"well")
+
+        self.assertEqual(frame.heads,["well","date","oil","date_right","count"])
+
+        np.testing.assert_array_equal(frame["oil"].vals,np.array([0.,0.,1.,1.,2.]))
+        np.testing.assert_array_equal(frame["count"].vals,np.array([1,2,1,2,3]))
+
+        frame = prod.join(comp,"well",how="left")
+
+        np.testing.assert_array_equal(frame["oil"].vals,np.array([0.,0.,1.,1.,2.,3.,4.]))
+        np.testing.assert_array_equal(frame["count"].vals,np.array([1,2,1,2,3,-99_999,-99_999]))
+
+        frame = prod.join(comp.take(np.array([],dtype=int),inplace=False),"well",how="left")
+
+        self.assertEqual(frame.heads,["well","date","oil","date_right","count"])
+
+        np.testing.assert_array_equal(frame["oil"].vals,np.arange(5.))
+        np.testing.assert_array_equal(frame["count"].vals,np.full(5,-99_999))
+        np.testing.assert_array_equal(frame["date_right"].isnone(),np.ones(5,dtype=bool))
+
+        frame = prod.asof(comp,"date",by="well")
+
+        np.testing.assert_array_equal(frame["count"].vals,np.array([1,2,-99_999,-99_999,-99_999]))
+        np.testing.assert_array_equal(frame["date_right"].vals,np.array(["2020-01-15","2020-02-29","NaT","NaT","NaT"],dtype="datetime64[D]"))
+
+        frame = prod.asof(comp,"date",by="well",strict=True)
+
+        np.testing.assert_array_equal(frame["count"].vals,np.array([1,1,-99_999,-99_999,-99_999]))
+
+    def test_query(self):
+
+        df = DataFrame()
+
+        df["well"] = CatColumn(vals=np.array(["A01","B02","A03","C04","A01"]))
+        df["name"] = np.array(["north","south","north-east","west",""])
+        df["date"] = np.array(["2019-12-31","2020-01-31","2020-02-29","2020-05-31","NaT"],dtype="datetime64[D]")
+        df["oil"] = np.array([1.,5.,np.nan,2.,3.])
+
+        np.testing.assert_array_equal(df.mask({"well":{"regex":r"A\d+"},"oil":{"lower":0,"upper":2}}),
+            np.array([True,False,False,False,False]))
+
+        np.testing.assert_array_equal(df.mask({"date":{"year":2020,"quarter":[1]},"name":{"regex":"north"}}),
+            np.array([False,False,True,False,False]))
+
+        np.testing.assert_array_equal(df.mask({"date":{"lower":"2020-01-01"},"well":{"notin":["C04"]}}),
+            np.array([False,True,True,False,False]))
+
+        frame = df.query({"well":["A01","C04"],1:{"regex":r"\w"}},inplace=False)
+
+        np.testing.assert_array_equal(frame["well"].vals,np.array(["A01","C04"]))
+        np.testing.assert_array_equal(frame["oil"].vals,np.array([1.,2.]))
+
+        df.query({"well":"B02"})
+
+        np.testing.assert_array_equal(df["name"].vals,np.array(["south"]))
+
+    def test_sort(self):
+
+        df = DataFrame()
+
+        df["well"] = CatColumn(vals=np.array(["B","A","B","","A"]))
+        df["date"] = np.array(["2020-02-01","2020-01-01","NaT","2020-01-01","2020-03-01"],dtype="datetime64[D]")
+        df["oil"] = np.array([1.,np.nan,2.,3.,1.])
+
+        permutation = df.sort(["well","date"],inplace=True,returnFlag=True)
+
+        np.testing.assert_array_equal(permutation,np.array([1,4,0,2,3]))
+        np.testing.assert_array_equal(df.permutation,permutation)
+        np.testing.assert_array_equal(df["well"].vals,np.array(["A","A","B","B",""]))
+        np.testing.assert_array_equal(df["oil"].vals,np.array([np.nan,1.,1.,2.,3.]))
+
+        frame = df.sort(["oil","well"],reverse=True)
+
+        np.testing.assert_array_equal(frame["oil"].vals,np.array([3.,2.,1.,1.,np.nan]))
+        np.testing.assert_array_equal(frame["well"].vals,np.array(["","B","B","A","A"]))
+
+        sibling = DataFrame()
+        sibling["index"] = np.arange(5)
+        sibling.take(frame.permutation)
+
+        np.testing.assert_array_equal(sibling["index"].vals,frame.permutation)
+
+    def test_builder(self):
+
+        builder = RowBuilder(["well","date","oil"])
+
+        builder.add_row(["A01",datetime.date(2020,1,31),1.5])
+        builder.add_rows([["B02",datetime.date(2020,2,29),2],["C03",datetime.date(2020,3,31),3.]])
+        builder.add_cols(np.array(["D04"]),np.array(["2020-04-30"],dtype="datetime64[D]"),np.array([4.]))
+
+        self.assertEqual(len(builder),4)
+
+        df = builder.finalize()
+
+        self.assertEqual(df.heads,["well","date","oil"])
+        np.testing.assert_array_equal(df["well"].vals,np.array(["A01","B02","C03","D04"]))
+        np.testing.assert_array_equal(df["date"].vals,np.array(["2020-01-31","2020-02-29","2020-03-31","2020-04-30"],dtype="datetime64[D]"))
+        np.testing.assert_array_equal(df["oil"].vals,np.array([1.5,2.,3.,4.]))
+
+        builder = df.builder()
+
+        for index in range(1000):
+            builder.add_row(["E05",datetime.date(2020,5,31),float(index)])
+
+        builder.finalize()
+
+        self.assertEqual(df["oil"].vals.size,1004)
+        self.assertEqual(df["oil"].vals[-1],999.)
+
+        df.set_rows(["F06",np.datetime64("2020-06-30"),5.],index=0)
+
+        self.assertEqual(df["well"].vals[0],"F06")
+        self.assertEqual(df["oil"].vals[0],5.)
+
+        with self.assertRaises(ValueError):
+            builder.add_row(["G07",1.])
+
+        df = DataFrame()
+
+        df["date"] = np.array(["2020-01-31"],dtype="datetime64[D]")
+        df["days"] = np.array([31])
+        df["oil"] = np.array([1.5])
+
+        df.builder().add_row(["2020-02-29",29.,2]).add_row(["2020-03-31",31.,3]).finalize()
+
+        self.assertEqual(df["date"].vals.dtype,np.dtype("datetime64[D]"))
+        self.assertEqual(df["days"].vals.dtype,np.dtype(int))
+        self.assertEqual(df["oil"].vals.dtype,np.float64)
+
+        np.testing.assert_array_equal(df["date"].vals,np.array(["2020-01-31","2020-02-29","2020-03-31"],dtype="datetime64[D]"))
+        np.testing.assert_array_equal(df["days"].vals,np.array([31,29,31]))
+        np.testing.assert_array_equal(df["oil"].vals,np.array([1.5,2.,3.]))
+
     def test_write(self):
 
-        pass
+        df = DataFrame()
+
+        df["well"] = np.array(["A01","B02","C03"])
+        df["date"] = np.array(["2020-01-31","2020-02-29","NaT"],dtype="datetime64[D]")
+        df["days"] = np.array([31,29,-99_999])
+        df["oil"] = np.array([1234.56,0.04,np.nan])
+
+        fstring = "{:6s}\t{:%Y-%m-%d}\t{:2d}\t{:.1f}\n"
+
+        with tempfile.TemporaryDirectory() as tempdir:
+
+            filepath = os.path.join(tempdir,"frame.txt")
+
+            df.write(filepath,fstring=fstring,chunksize=2)
+
+            with open(filepath,"r") as rfile:
+                text = rfile.read()
+
+            self.assertEqual(text,"well\tdate\tdays\toil\n"
+                "A01   \t2020-01-31\t31\t1234.6\n"
+                "B02   \t2020-02-29\t29\t0.0\n"
+                "C03   \t\t\t\n")
+
+            batches = ([df["well"].vals[:1],df["date"].vals[:1],df["days"].vals[:1],df["oil"].vals[:1]] for _ in range(3))
+
+            df.write(filepath,fstring=fstring,batches=batches)
+
+            with open(filepath,"r") as rfile:
+                lines = rfile.readlines()
+
+            self.assertEqual(lines[1:],["A01   \t2020-01-31\t31\t1234.6\n"]*3)
 
     def test_writeb(self):
 
@@ -660,6 +1169,37 @@ class TestDataFrame(unittest.TestCase):
         df["a"] = a
         df["b"] = b
 
+        df["c"] = np.array(["A01","B02"]*10)
+        df["d"] = np.arange(np.datetime64("2020-01-01"),np.datetime64("2020-01-21"))
+
+        df[1].set_unit("m")
+
+        df["e"] = np.linspace(0.,1.,20)
+        df["e"].set_bitmap(np.arange(20)%3!=0)
+
+        with tempfile.TemporaryDirectory() as tempdir:
+
+            df.set_homedir(tempdir)
+            df.writeb("frame")
+
+            dfb = DataFrame(homedir=tempdir)
+            dfb.readb("frame")
+
+            self.assertEqual(dfb.heads,df.heads)
+            self.assertEqual(dfb.units,df.units)
+            self.assertEqual(dfb.infos,df.infos)
+
+            self.assertIsInstance(dfb["a"].vals,np.memmap)
+
+            for column,columnb in zip(df,dfb):
+                np.testing.assert_array_equal(column.vals,columnb.vals)
+                np.testing.assert_array_equal(column.isnone(),columnb.isnone())
+
+            self.assertIsNone(dfb["a"].bitmap)
+            np.testing.assert_array_equal(dfb["e"].isnone(),np.arange(20)%3==0)
+
+            del dfb
+
 class TestGlossary(unittest.TestCase):
 
     def test_init(self):
@@ -672,6 +1212,83 @@ class TestLoadtxt(unittest.TestCase):
 
         pass
 
+class TestTextCache(unittest.TestCase):
+
+    def test_get_set(self):
+
+        with tempfile.TemporaryDirectory() as tempdir:
+
+            filepath = os.path.join(tempdir,"well.las")
+
+            with open(filepath,"w") as wfile:
+                wfile.write(TestLogASCII.lasfile)
+
+            cache = TextCache(os.path.join(tempdir,"cache"))
+
+            self.assertIsNone(cache.get(filepath,"logascii"))
+
+            frame = loadtxt(filepath,"logascii",cache=cache)
+
+            cached = cache.get(filepath,"logascii")
+
+            self.assertEqual(cached.heads,frame.heads)
+            self.assertEqual(cached.well["NULL","value"],-999.25)
+            self.assertIsInstance(cached["GR"].vals,np.memmap)
+            np.testing.assert_array_equal(cached["GR"].vals,frame["GR"].vals)
+
+            cache.version += 1
+            self.assertIsNone(cache.get(filepath,"logascii"))
+            cache.version -= 1
+
+            with open(f"{cache.get_path(filepath,'logascii')}.pkl","wb") as wfile:
+                wfile.write(b"\x80\x04\x95stale")
+
+            with self.assertLogs(level="WARNING"):
+                self.assertIsNone(cache.get(filepath,"logascii"))
+
+            self.assertEqual(os.listdir(cache.cachedir),[])
+
+            orphan = os.path.join(cache.cachedir,"orphan.1234.tmp.pkl")
+
+            with open(orphan,"w") as wfile:
+                wfile.write("")
+
+            os.utime(orphan,(0,0))
+
+            with open(filepath,"a") as wfile:
+                wfile.write("1669.625   100.000 SHALE\n")
+
+            self.assertIsNone(cache.get(filepath,"logascii"))
+
+            frame = loadtxt(filepath,"logascii",cache=cache)
+
+            self.assertEqual(len(frame["DEPT"]),4)
+
+            cache.maxsize = 0
+            cache.evict()
+
+            self.assertEqual(os.listdir(cache.cachedir),[])
+
+    def test_constructor(self):
+
+        with tempfile.TemporaryDirectory() as tempdir:
+
+            filepath = os.path.join(tempdir,"well.las")
+
+            with open(filepath,"w") as wfile:
+                wfile.write(TestLogASCII.lasfile)
+
+            cache = TextCache(os.path.join(tempdir,"cache"))
+
+            las = LogASCII(filepath,cache=cache)
+
+            self.assertEqual(las.heads,[])
+            self.assertEqual(len(os.listdir(cache.cachedir)),2)
+
+            las = LogASCII(filepath,cache=cache)
+
+            self.assertIsInstance(las.frames[0]["GR"].vals,np.memmap)
+
 class TestRegText(unittest.TestCase):
 
     def test_init(self):
@@ -698,12 +1315,213 @@ class TestRegText(unittest.TestCase):
 
         text = rt.__str__()
 
+    def test_iterread(self):
+
+        text = "SCADA export\nID\tDATE\tWELL\tRATE\n1\t2020-01-31\tA01\t12.5\n# paused\n2\t2020-02-29\tB02\t\n3\t2020-03-31\tA01\t7\n"
+
+        with tempfile.TemporaryDirectory() as tempdir:
+
+            filepath = os.path.join(tempdir,"scada.txt")
+
+            with open(filepath,"w") as wfile:
+                wfile.write(text)
+
+            batches = list(RegText().iterread(filepath,chunksize=2))
+
+            frame = RegText().read(filepath,nondigitflag=True)
+
+        self.assertEqual(len(batches),2)
+        self.assertEqual(batches[0].heads,["ID","DATE","WELL","RATE"])
+        self.assertEqual(batches[1].heads,["ID","DATE","WELL","RATE"])
+
+        np.testing.assert_array_equal(batches[0]["RATE"].vals,np.array([12.5,np.nan]))
+        np.testing.assert_array_equal(batches[1]["DATE"].vals,np.array(["2020-03-31"],dtype="datetime64[us]"))
+        np.testing.assert_array_equal(batches[1]["WELL"].vals,np.array(["A01"]))
+
+        np.testing.assert_array_equal(frame["ID"].vals,np.array([1.,2.,3.]))
+        np.testing.assert_array_equal(frame["WELL"].vals,np.array(["A01","B02","A01"]))
+        np.testing.assert_array_equal(frame["RATE"].vals,np.array([12.5,np.nan,7.]))
+
+    def test_loadnum(self):
+
+        text = "WELL DATA\nDEPTH\tPORO\n# start\n1000\t0.25\n\n1001.5\t-1.5e-1\n1003\t3"
+
+        with tempfile.TemporaryDirectory() as tempdir:
+
+            filepath = os.path.join(tempdir,"poro.txt")
+
+            with open(filepath,"w") as wfile:
+                wfile.write(text)
+
+            floats = loadnum(filepath,delimiter="\t",skiprows=2,blocksize=8)
+            selected = loadnum(filepath,delimiter="\t",skiprows=2,usecols=[1],blocksize=8)
+            integers = loadnum(filepath,dtype=int,ncols=2,offset=text.index("1003"))
+
+            frame = RegText().read(filepath)
+
+            with self.assertRaises(ValueError):
+                loadnum(filepath,delimiter="\t",skiprows=1)
+
+            with open(filepath,"w") as wfile:
+                wfile.write("1\t2\t3\n4\t\t6\n")
+
+            with self.assertRaises(ValueError):
+                loadnum(filepath,delimiter="\t")
+
+        np.testing.assert_array_equal(floats,np.array([[1000,0.25],[1001.5,-0.15],[1003,3]]))
+        np.testing.assert_array_equal(selected,np.array([[0.25],[-0.15],[3]]))
+        np.testing.assert_array_equal(integers,np.array([[1003,3]]))
+
+        self.assertEqual(integers.dtype,np.int64)
+
+        np.testing.assert_array_equal(frame.running[1].vals,np.array([0.25,-0.15,3]))
+
 class TestLogASCII(unittest.TestCase):
 
+    lasfile = """~VERSION INFORMATION
+ VERS.                  2.0 :   CWLS LOG ASCII STANDARD -VERSION 2.0
+ WRAP.                  NO  :   ONE LINE PER DEPTH STEP
+~WELL INFORMATION
+ STRT.M              1670.0000 :
+ STOP.M              1669.7500 :
+ STEP.M              -0.1250 :
+ NULL.               -999.25 :
+ WELL.               ANY ET AL 12-34-12-34 : WELL
+~CURVE INFORMATION
+ DEPT.M                      :  1  DEPTH
+ GR  .GAPI                   :  2  GAMMA RAY
+ ZONE.                       :  3  ZONE NAME
+~PARAMETER INFORMATION
+ BHT .DEGC            35.5000:   BOTTOM HOLE TEMPERATURE
+~A  DEPTH     GR     ZONE
+1670.000   123.450 SAND
+1669.875   -999.25 SAND
+# comment line
+1669.750   110.200 SHALE
+"""
+
+    def setUp(self):
+
+        self.tempdir = tempfile.TemporaryDirectory()
+
+        self.filepath = os.path.join(self.tempdir.name,"well.las")
+
+        with open(self.filepath,"w") as wfile:
+            wfile.write(self.lasfile)
+
+    def tearDown(self):
+
+        self.tempdir.cleanup()
+
     def test_init(self):
 
         pass
 
+    def test_read(self):
+
+        frame = LogASCII().read(self.filepath)
+
+        self.assertEqual(frame.heads,["DEPT","GR","ZONE"])
+        self.assertEqual(frame.units,["M","GAPI",None])
+        self.assertEqual(frame.info,"LAS 2.0")
+        self.assertEqual(frame.mode,"Un-wrapped")
+
+        np.testing.assert_array_equal(frame["DEPT"].vals,np.array([1670.,1669.875,1669.75]))
+        np.testing.assert_array_equal(frame["GR"].vals,np.array([123.45,np.nan,110.2]))
+        np.testing.assert_array_equal(frame["ZONE"].vals,np.array(["SAND","SAND","SHALE"]))
+
+        self.assertEqual(frame.well["NULL","value"],-999.25)
+        self.assertEqual(frame.parameter["BHT","value"],35.5)
+
+    def test_usecols(self):
+
+        frame = LogASCII().read(self.filepath,usecols=["GR","DEPT"])
+
+        self.assertEqual(frame.heads,["GR","DEPT"])
+        self.assertEqual(list(frame.curve[:,"mnemonic"]),["DEPT","GR","ZONE"])
+
+        np.testing.assert_array_equal(frame["GR"].vals,np.array([123.45,np.nan,110.2]))
+
+        with self.assertLogs(level="WARNING"):
+            las = LogASCII(self.filepath,usecols=["DEPT","RHOB"])
+
+        self.assertEqual(las.frames[0].heads,["DEPT"])
+
+        np.testing.assert_array_equal(las.frames[0]["DEPT"].vals,np.array([1670.,1669.875,1669.75]))
+
+        numeric = self.lasfile.replace("SAND","1").replace("SHALE","2")
+
+        with open(self.filepath,"w") as wfile:
+            wfile.write(numeric)
+
+        frame = LogASCII().read(self.filepath,usecols=[2,0])
+
+        self.assertEqual(frame.heads,["ZONE","DEPT"])
+
+        self.assertEqual(LogASCII().read(self.filepath,usecols=-1).heads,["ZONE"])
+
+        with self.assertRaises(ValueError):
+            LogASCII().read(self.filepath,usecols=[0,3])
+
+        np.testing.assert_array_equal(frame["ZONE"].vals,np.array([1.,1.,2.]))
+
+    def test_interval(self):
+
+        las = LogASCII(self.filepath)
+
+        rows, = las.get_interval(1669.7,1669.9)
+
+        self.assertEqual(rows,slice(1,3))
+
+        curve, = las.get_interval(1669.7,1669.9,curveID="ZONE")
+
+        np.testing.assert_array_equal(curve.vals,np.array(["SAND","SHALE"]))
+
+        frame, = las.set_interval(1669.7,1669.9)
+
+        self.assertTrue(np.shares_memory(frame["GR"].vals,las.frames[0]["GR"].vals))
+        np.testing.assert_array_equal(frame["DEPT"].vals,np.array([1669.875,1669.75]))
+
+        las.set_interval(1669.8,1670.,inplace=True)
+
+        np.testing.assert_array_equal(las.frames[0]["DEPT"].vals,np.array([1669.875]))
+
+    def test_add_frames(self):
+
+        badpath = os.path.join(self.tempdir.name,"bad.las")
+
+        with open(badpath,"w") as wfile:
+            wfile.write("not a las file")
+
+        for workers in (None,2):
+
+            las = LogASCII()
+
+            with self.assertLogs(level="ERROR"):
+                with self.assertRaises(Exception):
+                    las.add_frames([self.filepath,badpath,self.filepath],workers=workers)
+
+            self.assertEqual(len(las.frames),1)
+            self.assertEqual(list(las.errors.keys()),[badpath])
+
+            las = LogASCII([self.filepath,self.filepath],workers=workers)
+
+            np.testing.assert_array_equal(las.frames[1]["DEPT"].vals,np.array([1670.,1669.875,1669.75]))
+
+        class Subclass(LogASCII):
+
+            def __init__(self,root,**kwargs):
+                self.root = root
+                super().__init__(**kwargs)
+
+        las = Subclass(None,filepaths=self.filepath)
+
+        self.assertEqual(len(las.frames),1)
+        self.assertEqual(las.errors,{})
+
+        with self.assertRaises(ValueError):
+            loadtxt(self.filepath,"unknown")
+
 class TestExcel(unittest.TestCase):
 
     def test_init(self):
@@ -739,6 +1557,120 @@ class TestFunctions(unittest.TestCase):
         self.assertEqual(a1,10000.,"could not remove thousand separator...")
         self.assertEqual(a2,10000.,"could not remove thousand separator...")
         self.assertEqual(a3,10000.,"could not remove thousand separator...")
+
+    def test_str2number_arrays(self):
+
+        strings = np.array(["1.234,5","","-7,25","12"])
+
+        np.testing.assert_array_equal(str2float(strings,sep_decimal=",",sep_thousand="."),
+            np.array([1234.5,np.nan,-7.25,12.]))
+
+        np.testing.assert_array_equal(str2float(strings.astype(bytes),sep_decimal=",",sep_thousand="."),
+            np.array([1234.5,np.nan,-7.25,12.]))
+
+        np.testing.assert_array_equal(str2int(np.array(["1,000","","35"])),
+            np.array([1000,-99_999,35]))
+
+        np.testing.assert_array_equal(str2int(np.array(["john 1","conor","tarum 5 nohan"]),intnone=0,regex=r"\d+"),
+            np.array([1,0,5]))
+
+        np.testing.assert_array_equal(str2int(np.array(["john 1","tarum 5"]),"",0,r"\d+"),np.array([1,5]))
+
+        np.testing.assert_array_equal(str2str(np.array(["A1","B","C3"]),regex=r"\d",fstring="<{:s}>"),
+            np.array(["<1>","<>","<3>"]))
+
+        with self.assertRaises(ValueError):
+            str2float(np.array(["1.2.3"]))
+
+        with self.assertRaises(ValueError):
+            str2float(np.array(["1,5"]),sep_decimal=",")
+
+    def test_str2datetime(self):
+
+        self.assertEqual(infer_datetime_format(["31-Jan-2020","29-Feb-2020"]),"%d-%b-%Y")
+        self.assertEqual(infer_datetime_format(["31.01.2020","29.02.2020"]),"%d.%m.%Y")
+
+        dates = str2datetime(np.array(["31-Jan-2020","","29-Feb-2020","March 3 2021","31-Jan-2020"]))
+
+        np.testing.assert_array_equal(dates,np.array([
+            "2020-01-31","NaT","2020-02-29","2021-03-03","2020-01-31"],dtype="datetime64[us]"))
+
+        dates = str2datetime(np.array(["2020-01-31","2020-02-29",""]))
+
+        np.testing.assert_array_equal(dates,np.array([
+            "2020-01-31","2020-02-29","NaT"],dtype="datetime64[us]"))
+
+        dates = str2datetime(np.array(["well A 2020-01-31","well B"]),regex=r"\d{4}-\d{2}-\d{2}")
+
+        np.testing.assert_array_equal(dates,np.array(["2020-01-31","NaT"],dtype="datetime64[us]"))
+
+        dates = str2datetime(np.array(["02/01/2020","03/01/2020","04/01/2020"]))
+
+        np.testing.assert_array_equal(dates,np.array([
+            "2020-02-01","2020-03-01","2020-04-01"],dtype="datetime64[us]"))
+
+        dates = str2datetime(np.array(["02/01/2020","03/01/2020","25/01/2020"]),sample=1)
+
+        np.testing.assert_array_equal(dates,np.array([
+            "2020-01-02","2020-01-03","2020-01-25"],dtype="datetime64[us]"))
+
+        dates = str2datetime(np.array(["25.01.2020","26.01.2020","02.01.2020","5 February 2020"]),sample=3)
+
+        np.testing.assert_array_equal(dates,np.array([
+            "2020-01-25","2020-01-26","2020-01-02","2020-02-05"],dtype="datetime64[us]"))
+
+    def _check_tokenize_(self,module):
+
+        def tokenize(text,delimiter="\t",ncols=0,dtype=float):
+            values = np.empty(16,dtype=dtype)
+            kernel = module.tokenize_int if dtype is np.int64 else module.tokenize
+            count = kernel(np.frombuffer(text,dtype=np.uint8),values,delimiter,"#",ncols)
+            return values[:count]
+
+        np.testing.assert_array_equal(tokenize(b"1\t2.5 # note\n# line\n\n3\t-4e1\r\n",ncols=2),np.array([1,2.5,3,-40]))
+        np.testing.assert_array_equal(tokenize(b" 1  2\n3 4",delimiter=None),np.array([1,2,3,4]))
+        np.testing.assert_array_equal(tokenize(b"1,-2,3\n",delimiter=",",dtype=np.int64),np.array([1,-2,3]))
+
+        for text in (b"1\t\t3\n",b"1\t2\t\n",b"1\t2\n3\n",b"1\tA\n"):
+            with self.assertRaises(ValueError):
+                tokenize(text,ncols=2)
+
+    def test_tokenize_numpy(self):
+
+        self._check_tokenize_(vectorpy)
+
+    @unittest.skipIf(vectorcy is None,"cypy.vectorcy extension is not built, run cypy/setup.py build_ext --inplace")
+    def test_tokenize_cython(self):
+
+        self._check_tokenize_(vectorcy)
+
+    def test_number2str_arrays(self):
+
+        integers = np.array([0,-12345,1234567,-99_999])
+
+        np.testing.assert_array_equal(int2str(integers),np.array(["0","-12,345","1,234,567",""]))
+        np.testing.assert_array_equal(int2str(integers,fstring="{:05d}"),np.array(["00000","-12345","1234567",""]))
+
+        floats = np.array([2.345,-0.04,np.nan,1234567.891])
+
+        np.testing.assert_array_equal(float2str(floats,fstring="{:,.2f}"),np.array(["2.35","-0.04","","1,234,567.89"]))
+        np.testing.assert_array_equal(float2str(floats,fstring="{:.3e}"),np.array(["2.345e+00","-4.000e-02","","1.235e+06"]))
+
+        generator = np.random.default_rng(2021)
+
+        floats = np.concatenate([
+            (generator.random(20_000)-0.5)*2e6,
+            np.round((generator.random(20_000)-0.5)*200,3),
+            np.array([-0.0,0.0,-0.001,0.5,1.5,2.5,1e17,-1e-9])])
+
+        for fstring in ("{:f}","{:.0f}","{:.2f}","{:,.3f}","{:,f}"):
+            np.testing.assert_array_equal(float2str(floats,fstring=fstring),np.array([fstring.format(value) for value in floats.tolist()]))
+
+        dates = np.array(["2020-01-05T13:04:05","NaT"],dtype="datetime64[us]")
+
+        np.testing.assert_array_equal(datetime2str(dates),np.array(["05-Jan-2020",""]))
+        np.testing.assert_array_equal(datetime2str(dates,fstring="%Y/%m/%d %H:%M"),np.array(["2020/01/05 13:04",""]))
+        np.testing.assert_array_equal(datetime2str(dates,fstring="%A"),np.array(["Sunday",""]))
                        
 if __name__ == "__main__":
 
@@ -1,14 +1,23 @@
 import calendar
+import copy
 import datetime
 
-from dateutil import parser, relativedelta
+from concurrent.futures import ProcessPoolExecutor
+
+from dateutil import parser
 
 from difflib import SequenceMatcher
 
+import functools
+import hashlib
+import itertools
+import json
 import logging
 
 import math
+import mmap
 import os
+import pickle
 import re
 
 import numpy as np
@@ -22,12 +31,21 @@ if __name__ == "__main__":
 from cypy.vectorpy import str2int
 from cypy.vectorpy import str2float
 from cypy.vectorpy import str2str
+from cypy.vectorpy import str2cols
 from cypy.vectorpy import str2datetime
+from cypy.vectorpy import infer_datetime_format
 
 from cypy.vectorpy import int2str
 from cypy.vectorpy import float2str
 from cypy.vectorpy import datetime2str
 
+try:
+    from cypy.vectorcy import tokenize
+    from cypy.vectorcy import tokenize_int
+except ImportError:
+    from cypy.vectorpy import tokenize
+    from cypy.vectorpy import tokenize_int
+
 """
 1. Column nones, better ways
 2. Shift dates several months, end of month or beginning of month
@@ -215,8 +233,12 @@ class Column():
     none_str = ""
     none_datetime = np.datetime64('NaT')
 
+    bitmap = None
+
+    cow = False
+
     """INITIALIZATION"""
-    def __init__(self,vals=None,head=None,unit=None,info=None,size=None,dtype=None,charcount=None):
+    def __init__(self,vals=None,head=None,unit=None,info=None,size=None,dtype=None,charcount=None,valid=None):
         """Returns a numpy array (N,) with additional attributes."""
 
         """
@@ -230,6 +252,9 @@ class Column():
         The argument "dtype" is optional and can be any of the {int, float, str, np.datetime64}
         
         Depending on the dtype optional arguments "none" and "charcount" can be used.
+
+        The optional boolean array "valid" sets the validity bitmap of vals; the entries
+        marked invalid are nones regardless of their values.
         """
 
         if vals is not None:
@@ -278,9 +303,7 @@ class Column():
                 else:
                     vals = np.empty(shape,dtype=f"U{charcount}")
             elif dtype is np.datetime64:
-                base = datetime.datetime(2000, 1, 1)
-                dates = [base+relativedelta.relativedelta(months=i) for i in range(shape[0])]
-                vals = np.array(dates,dtype=np.datetime64)
+                vals = monthly_dates("2000-01-01",periods=shape[0])
             else:
                 raise ValueError(f"dtype is not int, float, str or np.datetime64, given {dtype=}")
 
@@ -290,6 +313,9 @@ class Column():
         self.set_unit(unit)
         self.set_info(info)
 
+        if valid is not None:
+            self.set_bitmap(valid)
+
     def set_head(self,head=None):
         """Sets the head of Column."""
 
@@ -335,6 +361,41 @@ class Column():
         else:
             self.info = str(info)
 
+    def set_bitmap(self,valid=None):
+        """It sets the packed validity bitmap of vals. If valid is not defined,
+        it is found by comparing vals to the none values defined by Column."""
+
+        if valid is None:
+            valid = ~self.isnone()
+
+        self.bitmap = np.packbits(np.asarray(valid,dtype=bool).ravel())
+
+    def del_bitmap(self):
+        """It deletes the validity bitmap after writing none values to the invalid entries."""
+
+        if self.bitmap is None:
+            return
+
+        nones = self.isnone()
+
+        self.bitmap = None
+
+        if not np.any(nones):
+            return
+
+        self._own_()
+
+        dtypeM = self.dtypeM
+
+        if dtypeM is int:
+            self.vals[nones] = self.none_int
+        elif dtypeM is float:
+            self.vals[nones] = self.none_float
+        elif dtypeM is str:
+            self.vals[nones] = self.none_str
+        elif dtypeM is np.datetime64:
+            self.vals[nones] = self.none_datetime
+
     def astype(self,dtype=None,regex=None,charcount=None,fstring=None):
         """It changes the dtype of the Column and alters the None values accordingly."""
 
@@ -359,6 +420,8 @@ class Column():
 
         if self.dtype is np.object_:
 
+            self._own_()
+
             self.vals[self.vals==None] = none
             self.vals = self.vals.astype(dtype)
 
@@ -373,7 +436,9 @@ class Column():
 
         elif self.dtypeM is float:
 
-            if dtype is int:
+            if dtype is int and self.bitmap is not None:
+                self.vals = np.around(np.where(self.valid,self.vals,0),decimals=0).astype(dtype)
+            elif dtype is int:
                 self.vals = np.around(self.vals,decimals=0).astype(dtype)
             elif dtype is str:
                 self.vals = float2str(self.vals,floatnone=self.none_float,strnone=self.none_str,fstring=fstring)
@@ -411,39 +476,46 @@ class Column():
         self.set_unit()
 
     def stringify(self,fstring=None,upper=False,lower=False,zfill=None,inplace=False):
-        """It has more capabilities than str2str on the outputting part."""
+        """It has more capabilities than str2str on the outputting part. The fstring is parsed
+        once and the whole column is formatted with array operations."""
 
         if fstring is None:
             fstring_inner = "{}"
-            fstring_clean = "{}"
+            prefix,suffix = "",""
         else:
-            fstring_inner = re.search(r"\{(.*?)\}",fstring).group()
-            fstring_clean = re.sub(r"\{(.*?)\}","{}",fstring,count=1)
-
-        vals_str = []
-
-        for val in self.vals:
+            match = re.search(r"\{(.*?)\}",fstring)
+            fstring_inner = match.group()
+            prefix = fstring[:match.start()].replace("{{","{").replace("}}","}")
+            suffix = fstring[match.end():].replace("{{","{").replace("}}","}")
 
-            val = val.tolist()
-
-            if isinstance(val,datetime.date):
-                string = val.strftime(fstring_inner[1:-1])
-            else:
-                string = fstring_inner.format(val)
+        if self.dtypeM is int:
+            vals_str = int2str(self.vals,intnone=self.none_int,strnone=self.none_str,fstring=fstring_inner)
+        elif self.dtypeM is float:
+            vals_str = float2str(self.vals,floatnone=self.none_float,strnone=self.none_str,fstring=fstring_inner)
+        elif self.dtypeM is np.datetime64:
+            fstring_date = re.sub(r"^:","",fstring_inner[1:-1]) or None
+            vals_str = datetime2str(self.vals,datetimenone=self.none_datetime,strnone=self.none_str,fstring=fstring_date)
+        elif self.dtypeM is str:
+            vals_str = str2str(self.vals,strnone=self.none_str,fstring=fstring_inner)
+        else:
+            vals_str = np.array([fstring_inner.format(val) for val in self.vals.tolist()],dtype=str)
 
-            if zfill is not None:
-                string = string.zfill(zfill)
+        if self.bitmap is not None:
+            vals_str = np.where(self.valid,vals_str,self.none_str)
 
-            if upper:
-                string = string.upper()
-            elif lower:
-                string = string.lower()
+        if zfill is not None:
+            vals_str = np.char.zfill(vals_str,zfill)
 
-            string = fstring_clean.format(string)
+        if upper:
+            vals_str = np.char.upper(vals_str)
+        elif lower:
+            vals_str = np.char.lower(vals_str)
 
-            vals_str.append(string)
+        if prefix:
+            vals_str = np.char.add(prefix,vals_str)
 
-        vals_str = np.array(vals_str,dtype=str)
+        if suffix:
+            vals_str = np.char.add(vals_str,suffix)
 
         if inplace:
             self.vals = vals_str
@@ -521,7 +593,11 @@ class Column():
 
     """COMPARISON"""
     def isnone(self):
-        """It return boolean array by comparing the values of vals to none types defined by Column."""
+        """It return boolean array by comparing the values of vals to none types defined by Column.
+        If Column has validity bitmap, the nones are read from the bitmap instead."""
+
+        if self.bitmap is not None:
+            return ~self.valid
 
         dtypeM = self.dtypeM
 
@@ -542,6 +618,55 @@ class Column():
         else:
             raise TypeError(f"Unidentified problem with column dtype={self.dtype}")
 
+    def isin(self,keywords):
+        """It returns boolean array showing whether the vals are in keywords."""
+
+        return np.isin(self.vals,np.asarray(keywords).ravel())
+
+    def match(self,regex):
+        """It returns boolean array showing whether the vals match the regex compiled once."""
+
+        pattern = re.compile(regex)
+
+        return np.array([bool(pattern.match(string)) for string in self.vals.tolist()],dtype=bool)
+
+    def query(self,isin=None,notin=None,lower=None,upper=None,regex=None,year=None,month=None,day=None,quarter=None):
+        """It returns boolean array of the rows satisfying all the given conditions. The isin and
+        notin are sets of values, lower and upper are inclusive bounds that exclude the nones,
+        regex is matched from the start of strings, and year, month, day and quarter are single
+        values or sets of values of the date parts."""
+
+        mask = np.ones(self.vals.shape,dtype=bool)
+
+        if isin is not None:
+            mask &= self.isin(isin)
+
+        if notin is not None:
+            mask &= ~self.isin(notin)
+
+        if lower is not None or upper is not None:
+
+            mask &= ~self.isnone()
+
+            if self.dtypeM is np.datetime64:
+                lower = None if lower is None else np.datetime64(lower)
+                upper = None if upper is None else np.datetime64(upper)
+
+            if lower is not None:
+                mask &= self.vals>=lower
+
+            if upper is not None:
+                mask &= self.vals<=upper
+
+        if regex is not None:
+            mask &= self.match(regex)
+
+        for part,value in (("year",year),("month",month),("day",day),("quarter",quarter)):
+            if value is not None:
+                mask &= np.isin(getattr(self,part),np.asarray(value).ravel())
+
+        return mask
+
     def nondim(self):
         """It checks whether Column has unit or not."""
 
@@ -661,12 +786,12 @@ class Column():
         else:
             vals = self.stringify(inplace=False).vals
 
-        charsize = np.dtype(f"{vals.dtype.char}1").itemsize
+        lengths = np.char.str_len(vals)
 
         if string:
-            return max(vals,key=len)
+            return vals[np.argmax(lengths)]
         else:
-            return int(vals.dtype.itemsize/charsize)
+            return int(lengths.max()) if lengths.size>0 else 0
 
     def replace(self,new=None,old=None,method="upper"):
         """It replaces old with new. If old is not defined, it replaces nones.
@@ -677,6 +802,8 @@ class Column():
         else:
             conds = self.vals == old
 
+        self._own_()
+
         if new is None:
 
             if method=="upper":
@@ -692,8 +819,15 @@ class Column():
 
     def __setitem__(self,key,vals):
 
+        self._own_()
+
         self.vals[key] = vals
 
+        if self.bitmap is not None:
+            valid = self.valid
+            valid[key] = True
+            self.set_bitmap(valid)
+
     def __iter__(self):
 
         return iter(self.vals)
@@ -704,7 +838,55 @@ class Column():
 
     def __getitem__(self,key):
 
-        return Column(vals=self.vals[key],head=self.head,unit=self.unit,info=self.info)
+        if self.bitmap is None:
+            return Column(vals=self.vals[key],head=self.head,unit=self.unit,info=self.info)
+        else:
+            return Column(vals=self.vals[key],head=self.head,unit=self.unit,info=self.info,valid=self.valid[key])
+
+    def view(self,key=None):
+        """It returns lightweight Column sharing the buffer of self for basic slicing keys.
+        Both self and the view copy their buffer on the first in-place modification."""
+
+        column = copy.copy(self)
+
+        if key is not None:
+            column.vals = self.vals[key]
+            if self.bitmap is not None:
+                column.set_bitmap(self.valid[key])
+
+        self.cow = column.cow = True
+
+        return column
+
+    def _own_(self):
+        """It copies the shared buffer of vals before in-place modification."""
+
+        if self.cow:
+            self.vals = self.vals.copy()
+            self.cow = False
+
+    def factorize(self):
+        """It returns integer codes of vals and sorted unique values so that vals = uniques[codes]."""
+
+        uniques,codes = np.unique(self.vals,return_inverse=True)
+
+        return codes.ravel(),uniques
+
+    def argsort(self):
+        """It returns the indices that stably sort the vals."""
+
+        return np.argsort(self.vals,kind="stable")
+
+    def lazy(self):
+        """It returns deferred Expression of Column; the arithmetic operators on it build
+        an expression tree which is evaluated in chunks by Expression.evaluate."""
+
+        return Expression(column=self)
+
+    def categorize(self):
+        """It returns dictionary-encoded CatColumn of string Column."""
+
+        return CatColumn(vals=self.vals,head=self.head,info=self.info)
 
     """OPERATIONS"""
     def convert(self,unit,inplace=True):
@@ -716,17 +898,27 @@ class Column():
             else:
                 return self
 
-        ur = pint.UnitRegistry()
+        scale,offset = get_unitfactors(self.unit,unit)
 
         if inplace:
-            ur.Quantity(self.vals,self.unit).ito(unit)
+            self._own_()
+            self.vals *= scale
+            if offset!=0:
+                self.vals += offset
             self.unit = unit
         else:
-            vals = ur.Quantity(self.vals,self.unit).to(unit).magnitude
+            vals = self.vals*scale
+            if offset!=0:
+                vals += offset
             return Column(head=self.head,vals=vals,unit=unit,info=self.info)
     
-    def shift(self,delta,deltaunit=None,inplace=True):
-        """Shifting the entries depending on its dtype."""
+    def shift(self,delta,deltaunit=None,inplace=True,snap=None):
+        """Shifting the entries depending on its dtype. For numpy.datetime64, the month
+        and year shifts are calendar-correct and snap, start or end, moves the shifted
+        dates to the bounds of their months."""
+
+        if inplace:
+            self._own_()
 
         if self.vals.dtype.type is np.int32:
             if inplace:
@@ -778,61 +970,56 @@ class Column():
             as: attosecond,
             """
 
-            if deltaunit == "Y":
-
-                year0 = self.year
-                year1 = year0+delta
-
-                feb28_bool = np.logical_and(self.month==2,self.day==28)
-                feb29_bool = np.logical_and(self.month==2,self.day==29)
-
-                year0_leap_bool = year0%4==0
-                year0_leap_bool[year0%100==0] = False
-                year0_leap_bool[year0%400==0] = True
-                year0_leap_bool[self.month>2] = False
-                year0_leap_bool[feb29_bool] = False
-
-                year1_leap_bool = year1%4==0
-                year1_leap_bool[year1%100==0] = False
-                year1_leap_bool[year1%400==0] = True
-                year1_leap_bool[self.month>2] = False
-                year1_leap_bool[np.logical_and(~year0_leap_bool,feb28_bool)] = False
-                year1_leap_bool[feb29_bool] = False
-                
-                leap_year_count4 = year1//4-year0//4
-                leap_year_count100 = year1//100-year0//100
-                leap_year_count400 = year1//400-year0//400
-                leap_year_count = leap_year_count4-leap_year_count100+leap_year_count400
-                
-                day_arr = 365*delta+leap_year_count+year0_leap_bool-year1_leap_bool
-
-                timedelta = day_arr.astype("timedelta64[D]")
-                timedelta = timedelta[~self.isnone()]
-
-            elif deltaunit == "M":
-                timedelta = np.timedelta64(30*delta,"timedelta64[D]")
+            if deltaunit in ("Y","M"):
+                months = 12*delta if deltaunit=="Y" else delta
+                timedelta = shift_months(self.vals[~self.isnone()],months)-self.vals[~self.isnone()]
             else:
                 timedelta = np.timedelta64(delta,deltaunit)
 
             if inplace:
                 self.vals[~self.isnone()] += timedelta
+                if snap is not None:
+                    self.vals[~self.isnone()] = snap_months(self.vals[~self.isnone()],snap)
             else:
                 vals = self.vals[~self.isnone()]+timedelta
+                if snap is not None:
+                    vals = snap_months(vals,snap)
                 return Column(head=self.head,vals=vals,unit=self.unit,info=self.info)
 
+    def _bitmapped_(self,column,other=None):
+        """It sets the validity bitmap of the column resulting from an operation on self and other."""
+
+        if self.bitmap is None and getattr(other,"bitmap",None) is None:
+            return column
+
+        valid = ~self.isnone()
+
+        if isinstance(other,Column):
+            valid = np.logical_and(valid,~other.isnone())
+
+        column.set_bitmap(valid)
+
+        return column
+
     def __add__(self,other):
         """Implementing '+' operator."""
 
+        if isinstance(other,Expression):
+            return self.lazy().__add__(other)
+
         if isinstance(other,Column):
             if self.unit!=other.unit:
                 other = other.convert(self.unit,inplace=False)
-            return Column(vals=self.vals+other.vals,unit=self.unit)
+            return self._bitmapped_(Column(vals=self.vals+other.vals,unit=self.unit),other)
         else:
-            return Column(vals=self.vals+other,head=self.head,unit=self.unit,info=self.info)
+            return self._bitmapped_(Column(vals=self.vals+other,head=self.head,unit=self.unit,info=self.info),other)
 
     def __floordiv__(self,other):
         """Implementing '//' operator."""
 
+        if isinstance(other,Expression):
+            return self.lazy().__floordiv__(other)
+
         if isinstance(other,Column):
             # ureg = pint.UnitRegistry()
             # unit = ureg.Unit(f"{self.unit}/({other.unit})").__str__()
@@ -846,27 +1033,33 @@ class Column():
             else:
                 unit = f"{self.unit}/({other.unit})"
 
-            return Column(self.vals//other.vals,unit=unit)
+            return self._bitmapped_(Column(self.vals//other.vals,unit=unit),other)
         else:
-            return Column(self.vals//other,self.head,self.unit,self.info)
+            return self._bitmapped_(Column(self.vals//other,self.head,self.unit,self.info),other)
 
     def __mod__(self,other):
         """Implementing '%' operator."""
 
+        if isinstance(other,Expression):
+            return self.lazy().__mod__(other)
+
         if isinstance(other,Column):
         #     ureg = pint.UnitRegistry()
         #     unit = ureg.Unit(f"{self.unit}/({other.unit})").__str__()
         #     return Column(self.vals%other.vals,unit=unit)
             if other.nondim():
-                return Column(self.vals%other.vals,self.head,self.unit,self.info)
+                return self._bitmapped_(Column(self.vals%other.vals,self.head,self.unit,self.info),other)
             else:
                 logging.critical(f"Cannot operate % on a dimensional Column.")
         else:
-            return Column(self.vals%other,self.head,self.unit,self.info)
+            return self._bitmapped_(Column(self.vals%other,self.head,self.unit,self.info),other)
 
     def __mul__(self,other):
         """Implementing '*' operator."""
 
+        if isinstance(other,Expression):
+            return self.lazy().__mul__(other)
+
         if isinstance(other,Column):
             # ur = pint.UnitRegistry()
             # unit = ur.Unit(f"{self.unit}*{other.unit}").__str__()
@@ -878,33 +1071,42 @@ class Column():
             else:
                 unit = f"{self.unit}*{other.unit}"
 
-            return Column(self.vals*other.vals,unit=unit)
+            return self._bitmapped_(Column(self.vals*other.vals,unit=unit),other)
         else:
-            return Column(self.vals*other,self.head,self.unit,self.info)
+            return self._bitmapped_(Column(self.vals*other,self.head,self.unit,self.info),other)
 
     def __pow__(self,other):
         """Implementing '**' operator."""
 
+        if isinstance(other,Expression):
+            return self.lazy().__pow__(other)
+
         if isinstance(other,int) or isinstance(other,float):
             # ureg = pint.UnitRegistry()
             # unit = ureg.Unit(f"{self.unit}^{other}").__str__()
-            return Column(self.vals**other,self.head,f"({self.unit})**{other}",self.info)
+            return self._bitmapped_(Column(self.vals**other,self.head,f"({self.unit})**{other}",self.info),other)
         else:
             logging.critical("Cannot take to the power of non-int or non-float entries.")
 
     def __sub__(self,other):
         """Implementing '-' operator."""
 
+        if isinstance(other,Expression):
+            return self.lazy().__sub__(other)
+
         if isinstance(other,Column):
             if self.unit!=other.unit:
                 other = other.convert(self.unit,inplace=False)
-            return Column(self.vals-other.vals,unit=self.unit)
+            return self._bitmapped_(Column(self.vals-other.vals,unit=self.unit),other)
         else:
-            return Column(self.vals-other,self.head,self.unit,self.info)
+            return self._bitmapped_(Column(self.vals-other,self.head,self.unit,self.info),other)
 
     def __truediv__(self,other):
         """Implementing '/' operator."""
 
+        if isinstance(other,Expression):
+            return self.lazy().__truediv__(other)
+
         if isinstance(other,Column):
             # ur = pint.UnitRegistry()
             # unit = ur.Unit(f"{self.unit}/({other.unit})").__str__()
@@ -918,15 +1120,34 @@ class Column():
             else:
                 unit = f"{self.unit}/({other.unit})"
 
-            return Column(self.vals/other.vals,unit=unit)
+            return self._bitmapped_(Column(self.vals/other.vals,unit=unit),other)
         else:
-            return Column(self.vals/other,self.head,self.unit,self.info)
+            return self._bitmapped_(Column(self.vals/other,self.head,self.unit,self.info),other)
 
     """PROPERTY METHODS"""
     @property
     def dtype(self):
         """Return dtype of Column.vals."""
         return self.vals.dtype.type
+
+    @property
+    def valid(self):
+        """Return boolean validity array of Column.vals."""
+
+        if self.bitmap is None:
+            return np.ones(len(self),dtype=bool)
+        else:
+            return np.unpackbits(self.bitmap,count=len(self)).astype(bool)
+
+    def isvalid(self,index):
+        """It returns the validity of the entry at index in O(1)."""
+
+        if self.bitmap is None:
+            return not self.isnone()[index]
+
+        index = index%len(self)
+
+        return bool((self.bitmap[index>>3]>>(7-(index&7)))&1)
     
     @property
     def dtypeM(self):
@@ -934,6 +1155,8 @@ class Column():
 
         if self.vals.size==0:
             dtype = self.vals.dtype.type
+        elif self.vals.dtype.type is np.datetime64:
+            dtype = np.datetime64
         elif self.vals.dtype.type is np.object_:
             dtype = type(self.vals[np.argmax(self.vals!=None)])
         else:
@@ -943,6 +1166,8 @@ class Column():
             return int
         elif dtype is np.int32:
             return int
+        elif dtype is np.int64:
+            return int
         elif dtype is float:
             return float
         elif dtype is np.float64:
@@ -964,21 +1189,22 @@ class Column():
         else:
             raise TypeError(f"Input is shape={self.vals.shape} and {dtype=} which is unrecognized.")
 
+    def _datetimeint_(self,vals):
+        """It returns integer array of datetime component vals with none_int at NaT values."""
+
+        vals = vals.astype(int)
+
+        vals[np.isnat(self.vals)] = self.none_int
+
+        return vals
+
     @property
     def year(self):
 
         if self.vals.dtype.type is not np.datetime64:
             return
 
-        year_arr = np.empty(self.vals.shape,dtype=int)
-
-        for index,dt in enumerate(self.vals.tolist()):
-            if dt is None:
-                year_arr[index] = self.none_int
-            else:
-                year_arr[index] = dt.year
-
-        return year_arr
+        return self._datetimeint_(self.vals.astype("datetime64[Y]").astype(int)+1970)
 
     @property
     def month(self):
@@ -986,15 +1212,7 @@ class Column():
         if self.vals.dtype.type is not np.datetime64:
             return
 
-        month_arr = np.empty(self.vals.shape,dtype=int)
-
-        for index,dt in enumerate(self.vals.tolist()):
-            if dt is None:
-                month_arr[index] = self.none_int
-            else:
-                month_arr[index] = dt.month
-
-        return month_arr
+        return self._datetimeint_(self.vals.astype("datetime64[M]").astype(int)%12+1)
 
     @property
     def day(self):
@@ -1002,241 +1220,735 @@ class Column():
         if self.vals.dtype.type is not np.datetime64:
             return
 
-        day_arr = np.empty(self.vals.shape,dtype=int)
+        days = self.vals.astype("datetime64[D]")-self.vals.astype("datetime64[M]")
 
-        for index,dt in enumerate(self.vals.tolist()):
-            if dt is None:
-                day_arr[index] = self.none_int
-            else:
-                day_arr[index] = dt.day
+        return self._datetimeint_(days.astype(int)+1)
 
-        return day_arr
+    @property
+    def quarter(self):
 
-class DataFrame(DirBase):
-    """It stores equal-size one-dimensional numpy arrays in a list."""
+        if self.vals.dtype.type is not np.datetime64:
+            return
 
-    print_cols = None
-    print_rows = None
-    print_rlim = 20
+        return self._datetimeint_(self.vals.astype("datetime64[M]").astype(int)%12//3+1)
 
-    """INITIALIZATION"""
-    def __init__(self,**kwargs):
-        """Initializes DataFrame with headers & running and parent class DirBase."""
+    @property
+    def dayofyear(self):
 
-        homedir = kwargs.get('homedir')
-        filedir = kwargs.get('filedir')
+        if self.vals.dtype.type is not np.datetime64:
+            return
 
-        super().__init__(homedir=homedir,filedir=filedir)
+        days = self.vals.astype("datetime64[D]")-self.vals.astype("datetime64[Y]")
 
-        if homedir is not None:
-            homedir = kwargs.pop('homedir')
+        return self._datetimeint_(days.astype(int)+1)
 
-        if filedir is not None:
-            filedir = kwargs.pop('filedir')
+    @property
+    def days_in_month(self):
 
-        self.running = []
+        if self.vals.dtype.type is not np.datetime64:
+            return
 
-        for key,vals in kwargs.items():
-            self[key] = vals
+        months = self.vals.astype("datetime64[M]")
 
-    """REPRESENTATION"""
-    def __str__(self):
-        """It prints to the console limited number of rows with headers."""
+        days = (months+1).astype("datetime64[D]")-months.astype("datetime64[D]")
 
-        if self.print_cols is None:
-            cols = range(len(self.running))
-        else:
-            cols = self.print_cols
+        return self._datetimeint_(days.astype(int))
 
-        fstring = "{}\n".format("{}\t"*len(cols))
+class CatColumn(Column):
+    """It is a dictionary-encoded string Column storing integer codes and the table of sorted
+    unique values, cats. Comparisons, filtering, unique and sorting work on the codes."""
 
-        headers = self.heads
-        unlines = ["-"*len(headers[col]) for col in cols]
+    def __init__(self,vals=None,head=None,unit=None,info=None,codes=None,cats=None):
 
-        string = ""
+        if codes is None:
+            self.vals = np.array([],dtype=str) if vals is None else vals
+        else:
+            self.codes,self.cats = codes,cats
 
-        try:
-            nrows = self.running[0].vals.size
-        except IndexError:
-            nrows = 0
+        self.set_head(head)
+        self.set_unit(unit)
+        self.set_info(info)
 
-        if self.print_rows is None:
+    @property
+    def vals(self):
+        """It returns the decoded string array."""
+        return self.cats[self.codes]
 
-            if nrows<=int(self.print_rlim):
+    @vals.setter
+    def vals(self,vals):
+        """It encodes the string array as codes and cats."""
 
-                rows = range(nrows)
+        vals = np.asarray(vals).ravel()
 
-                string += fstring.format(*headers)
-                string += fstring.format(*unlines)
+        if vals.dtype.kind not in ("U","S"):
+            vals = Column(vals=vals).stringify().vals
 
-                for row in rows:
-                    string += fstring.format(*[self.running[col].vals[row] for col in cols])
+        cats,codes = np.unique(vals,return_inverse=True)
 
-            else:
+        self.cats = cats
+        self.codes = codes.ravel().astype(np.min_scalar_type(max(cats.size-1,0)))
 
-                rows1 = list(range(int(self.print_rlim/2)))
-                rows2 = list(range(-1,-int(self.print_rlim/2)-1,-1))
+    def set_unit(self,unit=None):
+        """CatColumn is a string Column and can not have unit."""
 
-                rows2.reverse()
+        if unit is not None:
+            logging.critical(f"CatColumn can not have units, not {unit}")
 
-                string += fstring.format(*headers)
-                string += fstring.format(*unlines)
+        self.unit = None
 
-                for row in rows1:
-                    string += fstring.format(*[self.running[col][row] for col in cols])
+    def astype(self,dtype=None,**kwargs):
+        """It converts the cats in place as Column.astype does. CatColumn is a string Column;
+        for the other dtypes, the decategorized Column must be converted."""
 
-                string += "...\n"*3
+        if dtype is not None and dtype is not str:
+            raise TypeError(f"CatColumn can be converted to str only, not {dtype}; use decategorize first.")
 
-                for row in rows2:
-                    string += fstring.format(*[self.running[col][row] for col in cols])
+        cats = Column(vals=self.cats)
 
-        else:
+        cats.astype(dtype=str,**kwargs)
 
-            string += fstring.format(*headers)
-            string += fstring.format(*unlines)
+        self.vals = cats.vals[self.codes]
 
-            for row in self.print_rows:
-                string += fstring.format(*[self.running[col][row] for col in cols])
+    def replace(self,new=None,old=None,method="upper"):
+        """It replaces old with new on the decoded strings and encodes them back."""
 
-        return string
+        strings = Column(vals=self.vals,valid=None if self.bitmap is None else self.valid)
 
-    """ATTRIBUTES AND GLOSSARY"""
-    def add_attrs(self,**kwargs):
+        strings.replace(new=new,old=old,method=method)
 
-        for key,value in kwargs.items():
+        self.vals = strings.vals
 
-            if not hasattr(self,key):
-                setattr(self,key,value)
-                continue
-            else:
-                key_edited = f"{key}_{1}"
+    def decategorize(self):
+        """It returns the Column of decoded string array."""
 
-            for i in range(2,100):
-                if hasattr(self,key_edited):
-                    key_edited = f"{key}_{i}"
-                else:
-                    break
-            else:
-                logging.critical(f"Could not add Glossary, copy limit of key reached 100!")
-            
-            setattr(self,key_edited,value)
+        return Column(vals=self.vals,head=self.head,info=self.info)
 
-            logging.info(f"Added value after replacing {key} with {key_edited}.")
+    def categorize(self):
 
-    def add_glossary(self,title,*args,**kwargs):
+        return self
 
-        if not hasattr(self,title):
+    def encode(self,keywords):
+        """It returns the codes of keywords; the keywords not in cats are dropped."""
 
-            setattr(self,title,Glossary(*args,**kwargs))
+        keywords = np.asarray(keywords).ravel()
 
-        else:
+        indices = np.searchsorted(self.cats,keywords)
 
-            logging.warning(f"{title} already exists.")
+        found = indices<self.cats.size
+        found[found] = self.cats[indices[found]]==keywords[found]
 
-    """CONTAINER METHODS"""
-    def index(self,*args):
+        return indices[found]
 
-        indices = []
+    def isnone(self):
 
-        for key in args:
+        if self.bitmap is not None:
+            return ~self.valid
 
-            if isinstance(key,str):
-                indices.append(self.heads.index(key))
-            elif isinstance(key,int):
-                indices.append(key)
-            else:
-                raise TypeError(f"The input/s can be str or int, not type={type(key)}.")
+        return self.isin(self.none_str)
 
-        if len(args)==0:
-            raise TypeError(f"Index expected at least 1 argument, got 0")
-        else:
-            return tuple(indices)
+    def del_bitmap(self):
 
-    def __setitem__(self,key,vals):
+        if self.bitmap is None:
+            return
 
-        if not isinstance(key,str):
-            raise TypeError(f"The key can be str, not type={type(key)}.")
+        nones = ~self.valid
 
-        if key in self.heads:
-            index_key = self.heads.index(key)
-            self.running[index_key] = Column(vals=vals,head=key)
-        else:
-            self.running.append(Column(vals=vals,head=key))
+        self.bitmap = None
 
-    def __iter__(self):
+        if np.any(nones):
+            self[nones] = self.none_str
 
-        return iter(self.running)
+    def isin(self,keywords):
 
-    def __len__(self):
+        return np.isin(self.codes,self.encode(keywords))
 
-        return len(self.running)
+    def match(self,regex):
 
-    def __getitem__(self,key):
+        pattern = re.compile(regex)
 
-        if key is None:
-            key = slice(None,None,None)
+        matches = np.array([bool(pattern.match(string)) for string in self.cats.tolist()],dtype=bool)
 
-        if isinstance(key,int):
-            return self.running[key]
-        elif isinstance(key,str):
-            return self.running[self.index(key)[0]]
-        elif isinstance(key,range):
-            return [np.asarray(self[KEY].vals) for KEY in key]
-        elif isinstance(key,list):
-            return [np.asarray(self[KEY].vals) for KEY in key]
-        elif isinstance(key,tuple):
-            return [np.asarray(self[KEY].vals) for KEY in key]
-        elif isinstance(key,slice):
-            return [np.asarray(column.vals) for column in self.running[key]]
-        else:
-            raise TypeError(f"The key cannot be type={type(key)}.") 
+        return matches[self.codes]
 
-    """OPERATIONS"""
-    def str2cols(self,col=None,delimiter=None,maxsplit=None):
+    def __eq__(self,other):
 
-        if isinstance(col,int):
-            idcol = col
-        elif isinstance(col,str):
-            idcol = self.index(col)[0]
+        if isinstance(other,CatColumn) and other.cats is self.cats:
+            return self.codes==other.codes
+        elif isinstance(other,Column):
+            return self.vals==other.vals
         else:
-            logging.critical(f"Excpected col is int or str, input is {type(col)}")
+            return self.isin(other)
 
-        column_ = self.running.pop(idcol)
-        
-        header_string = column_.head
-        column_string = np.asarray(column_.vals)
+    def __ne__(self,other):
 
-        if maxsplit is None:
-            maxsplit = np.char.count(column_,delimiter).max()
+        return ~self.__eq__(other)
 
-        headers = [header_string,]
+    def __setitem__(self,key,vals):
 
-        [headers.append("{}_{}".format(header_string,index)) for index in range(1,maxsplit+1)]
+        strings = self.vals
+        strings[key] = vals
 
-        running = []
+        self.vals = strings
 
-        for index,string in enumerate(column_string):
+    def __len__(self):
 
-            # string = re.sub(delimiter+'+',delimiter,string)
-            row = string.split(delimiter,maxsplit=maxsplit)
+        return len(self.codes)
 
-            if maxsplit+1>len(row):
-                indices = range(maxsplit+1-len(row))
-                [row.append("") for index in indices]
+    def __getitem__(self,key):
 
-            running.append(row)
+        column = CatColumn(codes=self.codes[key].ravel(),cats=self.cats,head=self.head,info=self.info)
 
-        running = np.array(running,dtype=str).T
+        if self.bitmap is not None:
+            column.set_bitmap(self.valid[key])
 
-        for index,(vals,head) in enumerate(zip(running,headers),start=idcol):
-            self.running.insert(index,Column(vals=vals,head=head))
+        return column
 
-        # line = re.sub(r"[^\w]","",line)
-        # line = "_"+line if line[0].isnumeric() else line
-        # vmatch = np.vectorize(lambda x: bool(re.compile('[Ab]').match(x)))
-        
-        # self.headers = self._headers
-        # self.running = [np.asarray(column) for column in self._running]
+    def view(self,key=None):
+
+        column = copy.copy(self)
+
+        if key is not None:
+            column.codes = self.codes[key]
+            if self.bitmap is not None:
+                column.set_bitmap(self.valid[key])
+
+        return column
+
+    def factorize(self):
+
+        return self.codes,self.cats
+
+    def argsort(self):
+
+        return np.argsort(self.codes,kind="stable")
+
+    def unique(self):
+        """It returns the sorted unique values present in the Column."""
+
+        return self.cats[np.unique(self.codes)]
+
+    @property
+    def dtype(self):
+        return self.cats.dtype.type
+
+    @property
+    def dtypeM(self):
+        return str
+
+class Expression():
+    """It is a deferred arithmetic expression of Columns. The operators build a tree with the units
+    tracked symbolically, and evaluate computes it in cache-sized chunks with in-place ufunc calls."""
+
+    chunksize = 32_768
+
+    ufuncs = {
+        "+": np.add,
+        "-": np.subtract,
+        "*": np.multiply,
+        "/": np.true_divide,
+        "//": np.floor_divide,
+        "%": np.mod,
+        "**": np.power,
+        }
+
+    __array_ufunc__ = None
+
+    def __init__(self,operator=None,operands=(),unit=None,column=None):
+
+        self.operator = operator
+        self.operands = operands
+        self.column = column
+
+        if column is None:
+            self.unit = unit
+            self.size = max([operand.size for operand in operands if isinstance(operand,Expression)])
+        else:
+            self.unit = column.unit
+            self.size = len(column)
+
+    """REPRESENTATION"""
+    def __repr__(self):
+
+        if self.column is not None:
+            return self.column.head
+
+        left,right = [operand.__repr__() for operand in self.operands]
+
+        return f"({left}{self.operator}{right})"
+
+    """BUILDING"""
+    @staticmethod
+    def wrap(other):
+        """It returns Column as Expression and keeps numbers and Expressions as they are."""
+
+        if isinstance(other,Column):
+            return other.lazy()
+        elif isinstance(other,Expression):
+            return other
+        elif isinstance(other,int) or isinstance(other,float):
+            return float(other)
+        else:
+            raise TypeError(f"Expression operands can be Column, Expression, int or float, not {type(other)}.")
+
+    def nondim(self):
+        """It checks whether Expression has unit or not."""
+
+        return self.unit is None or self.unit=="dimensionless"
+
+    def convert(self,unit):
+        """It returns Expression converting self to the unit."""
+
+        if self.unit==unit or self.nondim():
+            return self
+
+        scale,offset = get_unitfactors(self.unit,unit)
+
+        expression = Expression("*",(self,scale),unit)
+
+        if offset!=0:
+            expression = Expression("+",(expression,offset),unit)
+
+        return expression
+
+    def _operate_(self,operator,other,reflected=False):
+
+        other = self.wrap(other)
+
+        left,right = (other,self) if reflected else (self,other)
+
+        if not isinstance(other,Expression):
+            if operator=="**":
+                unit = left.unit if left.nondim() else f"({left.unit})**{right}"
+            elif reflected and operator in ("/","//") and not self.nondim():
+                unit = f"1/{self.unit}"
+            else:
+                unit = self.unit
+        elif operator in ("+","-"):
+            right = right.convert(left.unit)
+            unit = left.unit
+        elif operator=="*":
+            if right.nondim():
+                unit = left.unit
+            elif left.nondim():
+                unit = right.unit
+            else:
+                unit = f"{left.unit}*{right.unit}"
+        elif operator in ("/","//"):
+            if left.nondim() and right.nondim():
+                unit = "dimensionless"
+            elif left.nondim():
+                unit = f"1/{right.unit}"
+            elif right.nondim():
+                unit = left.unit
+            else:
+                unit = f"{left.unit}/({right.unit})"
+        elif operator=="%":
+            if not right.nondim():
+                raise TypeError("Cannot operate % on a dimensional Expression.")
+            unit = left.unit
+        else:
+            raise TypeError("Cannot take to the power of Expression.")
+
+        if isinstance(other,Expression) and other.size!=self.size:
+            raise ValueError(f"Expression sizes do not match, {self.size} and {other.size}.")
+
+        return Expression(operator,(left,right),unit)
+
+    def __add__(self,other):
+        return self._operate_("+",other)
+
+    def __radd__(self,other):
+        return self._operate_("+",other,reflected=True)
+
+    def __sub__(self,other):
+        return self._operate_("-",other)
+
+    def __rsub__(self,other):
+        return self._operate_("-",other,reflected=True)
+
+    def __mul__(self,other):
+        return self._operate_("*",other)
+
+    def __rmul__(self,other):
+        return self._operate_("*",other,reflected=True)
+
+    def __truediv__(self,other):
+        return self._operate_("/",other)
+
+    def __rtruediv__(self,other):
+        return self._operate_("/",other,reflected=True)
+
+    def __floordiv__(self,other):
+        return self._operate_("//",other)
+
+    def __rfloordiv__(self,other):
+        return self._operate_("//",other,reflected=True)
+
+    def __mod__(self,other):
+        return self._operate_("%",other)
+
+    def __pow__(self,other):
+        return self._operate_("**",other)
+
+    def __neg__(self):
+        return self._operate_("*",-1.)
+
+    """EVALUATION"""
+    def columns(self):
+        """It returns the list of Columns in the leaves of Expression."""
+
+        if self.column is not None:
+            return [self.column]
+
+        columns = []
+
+        for operand in self.operands:
+            if isinstance(operand,Expression):
+                columns.extend(operand.columns())
+
+        return columns
+
+    def _count_(self,counts):
+        """It counts the occurrences of internal nodes in the tree."""
+
+        if self.column is not None:
+            return
+
+        counts[id(self)] = counts.get(id(self),0)+1
+
+        for operand in self.operands:
+            if isinstance(operand,Expression):
+                operand._count_(counts)
+
+    def _allocate_(self,buffers,counts,chunksize):
+        """It assigns a buffer to each internal node; a node writes into the buffer
+        of an internal operand if the operand occurs only once in the tree."""
+
+        if self.column is not None or id(self) in buffers:
+            return
+
+        for operand in self.operands:
+            if isinstance(operand,Expression):
+                operand._allocate_(buffers,counts,chunksize)
+
+        for operand in self.operands:
+            if isinstance(operand,Expression) and operand.column is None and counts[id(operand)]==1:
+                buffers[id(self)] = buffers[id(operand)]
+                break
+        else:
+            buffers[id(self)] = np.empty(chunksize,dtype=float)
+
+    def _evaluate_(self,start,stop,buffers):
+        """It evaluates the rows from start to stop into the buffer of the node."""
+
+        if self.column is not None:
+            return self.column.vals[start:stop]
+
+        left,right = [operand._evaluate_(start,stop,buffers) if isinstance(operand,Expression)
+            else operand for operand in self.operands]
+
+        out = buffers[id(self)][:stop-start]
+
+        self.ufuncs[self.operator](left,right,out=out)
+
+        return out
+
+    def evaluate(self,head=None,info=None,chunksize=None):
+        """It returns Column of the evaluated expression."""
+
+        if self.column is not None:
+            return self.column
+
+        chunksize = self.chunksize if chunksize is None else chunksize
+
+        vals = np.empty(self.size,dtype=float)
+
+        counts,buffers = {},{}
+
+        self._count_(counts)
+        self._allocate_(buffers,counts,min(chunksize,self.size))
+
+        for start in range(0,self.size,chunksize):
+
+            stop = min(start+chunksize,self.size)
+
+            vals[start:stop] = self._evaluate_(start,stop,buffers)
+
+        column = Column(vals=vals,head=head,unit=self.unit,info=info)
+
+        valids = [column_.valid for column_ in self.columns() if column_.bitmap is not None]
+
+        if len(valids)>0:
+            column.set_bitmap(np.logical_and.reduce(valids))
+
+        return column
+
+class DataFrame(DirBase):
+    """It stores equal-size one-dimensional numpy arrays in a list."""
+
+    print_cols = None
+    print_rows = None
+    print_rlim = 20
+
+    binary_magic = b"PETEPYDF"
+    binary_align = 64
+    binary_extension = "dfb"
+
+    permutation = None
+
+    group_functions = ("sum","mean","min","max","count","first","last","cumsum")
+
+    write_chunksize = 65_536
+    write_buffering = 4_194_304
+
+    """INITIALIZATION"""
+    def __init__(self,**kwargs):
+        """Initializes DataFrame with headers & running and parent class DirBase."""
+
+        homedir = kwargs.get('homedir')
+        filedir = kwargs.get('filedir')
+
+        super().__init__(homedir=homedir,filedir=filedir)
+
+        if homedir is not None:
+            homedir = kwargs.pop('homedir')
+
+        if filedir is not None:
+            filedir = kwargs.pop('filedir')
+
+        self.running = []
+
+        self._headmap_ = {}
+
+        for key,vals in kwargs.items():
+            self[key] = vals
+
+    """REPRESENTATION"""
+    def __str__(self):
+        """It prints to the console limited number of rows with headers."""
+
+        if self.print_cols is None:
+            cols = range(len(self.running))
+        else:
+            cols = self.print_cols
+
+        fstring = "{}\n".format("{}\t"*len(cols))
+
+        headers = self.heads
+        unlines = ["-"*len(headers[col]) for col in cols]
+
+        string = ""
+
+        try:
+            nrows = self.running[0].vals.size
+        except IndexError:
+            nrows = 0
+
+        if self.print_rows is None:
+
+            if nrows<=int(self.print_rlim):
+
+                rows = range(nrows)
+
+                string += fstring.format(*headers)
+                string += fstring.format(*unlines)
+
+                for row in rows:
+                    string += fstring.format(*[self.running[col].vals[row] for col in cols])
+
+            else:
+
+                rows1 = list(range(int(self.print_rlim/2)))
+                rows2 = list(range(-1,-int(self.print_rlim/2)-1,-1))
+
+                rows2.reverse()
+
+                string += fstring.format(*headers)
+                string += fstring.format(*unlines)
+
+                for row in rows1:
+                    string += fstring.format(*[self.running[col][row] for col in cols])
+
+                string += "...\n"*3
+
+                for row in rows2:
+                    string += fstring.format(*[self.running[col][row] for col in cols])
+
+        else:
+
+            string += fstring.format(*headers)
+            string += fstring.format(*unlines)
+
+            for row in self.print_rows:
+                string += fstring.format(*[self.running[col][row] for col in cols])
+
+        return string
+
+    """ATTRIBUTES AND GLOSSARY"""
+    def add_attrs(self,**kwargs):
+
+        for key,value in kwargs.items():
+
+            if not hasattr(self,key):
+                setattr(self,key,value)
+                continue
+            else:
+                key_edited = f"{key}_{1}"
+
+            for i in range(2,100):
+                if hasattr(self,key_edited):
+                    key_edited = f"{key}_{i}"
+                else:
+                    break
+            else:
+                logging.critical(f"Could not add Glossary, copy limit of key reached 100!")
+            
+            setattr(self,key_edited,value)
+
+            logging.info(f"Added value after replacing {key} with {key_edited}.")
+
+    def add_glossary(self,title,*args,**kwargs):
+
+        if not hasattr(self,title):
+
+            setattr(self,title,Glossary(*args,**kwargs))
+
+        else:
+
+            logging.warning(f"{title} already exists.")
+
+    """CONTAINER METHODS"""
+    def _headindex_(self,head):
+        """It returns the index of head in running or None if it does not exist. The lookup
+        is done in a hash map of heads which is validated in O(1) and rebuilt only when stale."""
+
+        index = self._headmap_.get(head)
+
+        if index is not None and index<len(self.running):
+            if self.running[index].head==head:
+                return index
+
+        self._headmap_ = {column.head:index for index,column in reversed(list(enumerate(self.running)))}
+
+        return self._headmap_.get(head)
+
+    def index(self,*args):
+
+        indices = []
+
+        for key in args:
+
+            if isinstance(key,str):
+                index = self._headindex_(key)
+                if index is None:
+                    raise ValueError(f"{key} is not in heads.")
+                indices.append(index)
+            elif isinstance(key,int):
+                indices.append(key)
+            else:
+                raise TypeError(f"The input/s can be str or int, not type={type(key)}.")
+
+        if len(args)==0:
+            raise TypeError(f"Index expected at least 1 argument, got 0")
+        else:
+            return tuple(indices)
+
+    def __setitem__(self,key,vals):
+
+        if not isinstance(key,str):
+            raise TypeError(f"The key can be str, not type={type(key)}.")
+
+        if isinstance(vals,Column):
+            vals = vals.view()
+            vals.set_head(key)
+        else:
+            vals = Column(vals=vals,head=key)
+
+        index = self._headindex_(key)
+
+        if index is not None:
+            self.running[index] = vals
+        else:
+            self.running.append(vals)
+            self._headmap_[self.running[-1].head] = len(self.running)-1
+
+    def __iter__(self):
+
+        return iter(self.running)
+
+    def __len__(self):
+
+        return len(self.running)
+
+    def __getitem__(self,key):
+
+        if key is None:
+            key = slice(None,None,None)
+
+        if isinstance(key,int):
+            return self.running[key]
+        elif isinstance(key,str):
+            return self.running[self.index(key)[0]]
+        elif isinstance(key,range):
+            return [np.asarray(self[KEY].vals) for KEY in key]
+        elif isinstance(key,list):
+            return [np.asarray(self[KEY].vals) for KEY in key]
+        elif isinstance(key,tuple):
+            return [np.asarray(self[KEY].vals) for KEY in key]
+        elif isinstance(key,slice):
+            return [np.asarray(column.vals) for column in self.running[key]]
+        else:
+            raise TypeError(f"The key cannot be type={type(key)}.") 
+
+    """OPERATIONS"""
+    def builder(self,heads=None):
+        """It returns RowBuilder appending to DataFrame when finalized. The heads are
+        required only if DataFrame does not have any column yet."""
+
+        return RowBuilder(self.heads if heads is None else heads,frame=self)
+
+    def set_rows(self,rows,index=None):
+        """It appends the rows, or replaces the rows starting at index. The rows can be
+        a single row or a list of rows, the columns are reallocated once per call. For
+        many calls, collect the rows with the builder and finalize it once."""
+
+        if len(rows)>0 and not isinstance(rows[0],(list,tuple,np.ndarray)):
+            rows = [rows]
+
+        if index is None:
+            self.builder().add_rows(rows).finalize()
+            return
+
+        for column,vals in zip(self.running,zip(*rows)):
+            column[index:index+len(vals)] = np.array(vals)
+
+    def str2cols(self,col=None,delimiter=None,maxsplit=None,dtypes=None):
+        """It splits the string column at the delimiter into new columns inserted in its place,
+        named as head, head_1, head_2 and so on. The whole column is split at once, see
+        cypy.vectorpy.str2cols. The dtypes is a list or a dictionary of the output column
+        index or head and the dtype to convert the strings to."""
+
+        if isinstance(col,int):
+            idcol = col
+        elif isinstance(col,str):
+            idcol = self.index(col)[0]
+        else:
+            raise TypeError(f"Expected col is int or str, input is {type(col)}")
+
+        column_ = self.running.pop(idcol)
+
+        running = str2cols(np.asarray(column_.vals),delimiter=delimiter,maxsplit=maxsplit)
+
+        headers = [column_.head]+[f"{column_.head}_{index}" for index in range(1,len(running))]
+
+        if dtypes is None:
+            dtypes = {}
+        elif isinstance(dtypes,list) or isinstance(dtypes,tuple):
+            dtypes = dict(enumerate(dtypes))
+
+        for index,(vals,head) in enumerate(zip(running,headers)):
+            dtype = dtypes.get(index,dtypes.get(head))
+            self.running.insert(idcol+index,Column(vals=vals,head=head,dtype=dtype))
 
     def cols2str(self,cols=None,header_new=None,fstring=None):
 
@@ -1265,150 +1977,771 @@ class DataFrame(DirBase):
         # self.running = [np.asarray(column) for column in self._running]
             
     def sort(self,cols=None,reverse=False,inplace=False,returnFlag=False):
+        """It sorts the rows stably by cols, the first col being the primary key; nones are
+        ordered last also when reverse is True. The permutation is cached in self.permutation
+        so that sibling frames can be reordered with take(permutation) without sorting again.
+        It returns the permutation if returnFlag is True, and the sorted frame if not inplace."""
 
         if cols is None:
-            idcols = range(len(self._running))
-        elif isinstance(cols,int):
-            idcols = (cols,)
-        elif isinstance(cols,str):
-            idcols = (self._headers.index(cols),)
+            idcols = range(len(self.running))
+        elif isinstance(cols,int) or isinstance(cols,str):
+            idcols = self.index(cols)
+        elif isinstance(cols,list) or isinstance(cols,tuple):
+            idcols = self.index(*cols)
+        else:
+            raise TypeError(f"Expected cols is integer or string or their list or tuples; input is {cols}")
+
+        keys = [self._sortkey_(self.running[idcol],reverse) for idcol in idcols]
+
+        radix = 1
+
+        for _,size in keys:
+            radix = None if radix is None or radix*size>=2**62 else radix*size
+
+        nrows = len(self.running[0]) if len(self.running)>0 else 0
+
+        if radix is None:
+            permutation = np.lexsort([key for key,_ in reversed(keys)])
+        else:
+            composite = np.zeros(nrows,dtype=np.int64)
+            for key,size in keys:
+                composite *= size
+                composite += key
+            if radix*max(nrows,1)<2**62:
+                composite *= nrows
+                composite += np.arange(nrows)
+                permutation = np.argsort(composite)
+            else:
+                permutation = np.argsort(composite,kind="stable")
+
+        self.permutation = permutation
+
+        if inplace:
+            self.take(permutation,inplace=True)
+        else:
+            frame = self.take(permutation,inplace=False)
+            frame.permutation = permutation
+
+        if returnFlag:
+            return permutation
+        elif not inplace:
+            return frame
+
+    @staticmethod
+    def _sortkey_(column,reverse=False):
+        """It returns the integer ordering key of column with the nones placed last and
+        the number of possible key values."""
+
+        nones = column.isnone()
+
+        if isinstance(column,CatColumn):
+            key = column.codes.astype(np.int64)
+        elif column.dtypeM is str:
+            key = column.factorize()[0].astype(np.int64)
+        elif column.dtypeM is np.datetime64:
+            key = column.vals.view(np.int64)
+        elif column.dtypeM is int:
+            key = column.vals.astype(np.int64)
+        else:
+            key = np.where(nones,0.,column.vals)
+            order = np.lexsort((-key if reverse else key,nones))
+            steps = np.diff(key[order])!=0
+            steps = np.logical_or(steps,np.diff(nones[order]))
+            ranks = np.empty(key.shape,dtype=np.int64)
+            ranks[order] = np.cumsum(np.insert(steps,0,False))
+            return ranks,int(ranks.max())+1 if ranks.size>0 else 1
+
+        valids = key[~nones]
+
+        if valids.size==0:
+            return np.zeros(key.shape,dtype=np.int64),1
+
+        lower,upper = int(valids.min()),int(valids.max())
+
+        key = upper-key if reverse else key-lower
+
+        key[nones] = upper-lower+1
+
+        return key,upper-lower+2
+
+    def filter(self,cols=None,keywords=None,regex=None,year=None,inplace=True):
+        """It filters the rows by the values of the first column in cols."""
+
+        if cols is None:
+            return
+        elif isinstance(cols,int) or isinstance(cols,str):
+            idcols = self.index(cols)
         elif isinstance(cols,list) or isinstance(cols,tuple):
-            if isinstance(cols[0],int):
-                idcols = cols
-            elif isinstance(cols[0],str):
-                idcols = [self._headers.index(col) for col in cols]
+            idcols = self.index(*cols)
+        else:
+            logging.critical(f"Expected cols is integer or string or their list or tuples; input is {cols}")
+
+        return self.query({idcols[0]:dict(isin=keywords,regex=regex,year=year)},inplace=inplace)
+
+    def mask(self,predicates):
+        """It returns boolean array of the rows satisfying all predicates. The predicates is
+        a dictionary of col and its conditions, which are keyword arguments of Column.query
+        in a dictionary, a set of values in a list, tuple or array, or a single value."""
+
+        mask = np.ones(len(self.running[0]) if len(self.running)>0 else 0,dtype=bool)
+
+        for col,conditions in predicates.items():
+
+            column = self[col]
+
+            if isinstance(conditions,dict):
+                mask &= column.query(**conditions)
+            elif isinstance(conditions,(list,tuple,np.ndarray)):
+                mask &= column.isin(conditions)
+            else:
+                mask &= column.isin([conditions])
+
+        return mask
+
+    def query(self,predicates,inplace=True):
+        """It takes the rows satisfying all predicates, see mask, gathering each column once."""
+
+        return self.take(self.mask(predicates),inplace=inplace)
+
+    def unique(self,cols):
+
+        if isinstance(cols,int):
+            cols = (cols,)
+        elif isinstance(cols,str):
+            cols = (cols,)
+
+        _,order,starts,_ = self._groups_(self.index(*cols))
+
+        self.running = [column[order[starts]] for column in self.running]
+
+    def groupby(self,cols,aggs):
+        """It groups the rows by the key cols and returns new DataFrame of the key columns and
+        the aggregations. The aggs is a dictionary of col and its function or list of functions
+        named sum, mean, min, max, count, first or last, returning one row per group sorted by
+        the keys, or cumsum, returning the running totals within groups for the rows of self.
+        The aggregated columns are named as head_function, and nones are skipped; first and last
+        are the first and last valid rows of the group, none when it has no valid row."""
+
+        if isinstance(cols,int) or isinstance(cols,str):
+            cols = (cols,)
+
+        idcols = self.index(*cols)
+
+        aggs = [(col,func) for col,funcs in aggs.items() for func in ((funcs,) if isinstance(funcs,str) else funcs)]
+
+        funcs = set([func for _,func in aggs])
+
+        if not funcs.issubset(self.group_functions):
+            raise ValueError(f"Unknown group functions, {funcs.difference(self.group_functions)}.")
+        elif "cumsum" in funcs and len(funcs)>1:
+            raise ValueError("The cumsum can not be combined with the group reductions.")
+
+        groups,order,starts,counts = self._groups_(idcols)
+
+        frame = DataFrame(homedir=self.homedir,filedir=self.filedir)
+
+        keyrows = slice(None) if "cumsum" in funcs else order[starts]
+
+        for idcol in idcols:
+            frame.running.append(self.running[idcol][keyrows])
+
+        for col,func in aggs:
+
+            column = self[col]
+
+            vals = self._groupkernel_(column,func,groups,order,starts,counts)
+
+            unit = column.unit if vals.dtype.type is np.float64 else None
+
+            frame.running.append(Column(vals=vals,head=f"{column.head}_{func}",unit=unit,info=column.info))
+
+        return frame
+
+    def _groups_(self,idcols):
+        """It sorts the rows by the key columns once and returns the group index of each row,
+        the stable order of rows sorted by group, and the start index and size of each group."""
+
+        nrows = len(self.running[0]) if len(self.running)>0 else 0
+
+        keys = [self._sortkey_(self.running[idcol]) for idcol in idcols]
+
+        if np.prod(np.array([size for _,size in keys],dtype=float))*max(nrows,1)<2**62:
+            composite = np.zeros(nrows,dtype=np.int64)
+            for key,size in keys:
+                composite *= size
+                composite += key
+            composite *= nrows
+            composite += np.arange(nrows)
+            order = np.argsort(composite)
+            composite = composite[order]//max(nrows,1)
+        else:
+            order = np.lexsort([key for key,_ in reversed(keys)])
+            composite = np.array([key[order] for key,_ in keys]).T
+
+        steps = composite[1:]!=composite[:-1]
+
+        if steps.ndim>1:
+            steps = np.any(steps,axis=1)
+
+        groups = np.empty(nrows,dtype=np.int64)
+        groups[order] = np.cumsum(np.insert(steps,0,False))
+
+        counts = np.bincount(groups)
+
+        starts = np.cumsum(counts)-counts
+
+        return groups,order,starts,counts
+
+    def _groupkernel_(self,column,func,groups,order,starts,counts):
+        """It returns the vals of func applied to column within groups."""
+
+        nones = column.isnone()
+
+        if func=="first" or func=="last":
+            positions = np.arange(order.size)
+            if func=="first":
+                found = np.minimum.reduceat(np.where(nones[order],order.size,positions),starts)
+                found[found==order.size] = starts[found==order.size]
+            else:
+                found = np.maximum.reduceat(np.where(nones[order],-1,positions),starts)
+                found[found<0] = (starts+counts-1)[found<0]
+            return column[order[found]].vals
+
+        valids = np.bincount(groups[~nones],minlength=counts.size)
+
+        if func=="count":
+            return valids
+
+        if func=="sum" or func=="mean":
+            sums = np.bincount(groups,weights=np.where(nones,0,column.vals).astype(float),minlength=counts.size).astype(float)
+            if func=="sum":
+                return sums.astype(column.vals.dtype) if column.dtypeM is int else sums
+            with np.errstate(invalid="ignore",divide="ignore"):
+                return np.where(valids>0,sums/valids,np.nan)
+
+        if func=="cumsum":
+            vals = np.where(nones,0,column.vals)[order]
+            totals = np.concatenate([np.cumsum(part) for part in np.split(vals,starts[1:])])
+            cumsums = np.empty_like(totals)
+            cumsums[order] = totals
+            return cumsums
+
+        if column.dtypeM is str:
+            keys = column.codes if isinstance(column,CatColumn) else column.vals
+            ranked = np.lexsort((keys,nones if func=="min" else ~nones,groups))
+            return column[ranked[starts] if func=="min" else ranked[starts+counts-1]].vals
+
+        vals = column.vals.view(np.int64) if column.dtypeM is np.datetime64 else column.vals
+
+        if vals.dtype.kind=="f":
+            fills = np.where(nones,np.nan,vals)[order]
+            results = (np.fmin if func=="min" else np.fmax).reduceat(fills,starts)
+        else:
+            limit = np.iinfo(vals.dtype).max if func=="min" else np.iinfo(vals.dtype).min
+            fills = np.where(nones,limit,vals)[order]
+            results = (np.minimum if func=="min" else np.maximum).reduceat(fills,starts)
+
+        if column.dtypeM is np.datetime64:
+            results = results.view(column.vals.dtype)
+            results[valids==0] = column.none_datetime
+        elif column.dtypeM is int:
+            results[valids==0] = column.none_int
+
+        return results
+
+    def join(self,other,on,other_on=None,how="inner",suffix="_right"):
+        """It returns new DataFrame joining the rows of self and other having equal keys. The
+        on is the key col or cols of self, and other_on of other if they are different. The
+        keys of both frames are encoded to common integer codes once, the matches are found
+        by binary search on the sorted codes of other. If how is "left", the rows of self
+        without any match are kept with nones. The rows with none keys do not match."""
+
+        if how not in ("inner","left"):
+            raise ValueError(f"how can be inner or left, not {how}.")
+
+        cols = (on,) if isinstance(on,int) or isinstance(on,str) else tuple(on)
+
+        other_cols = cols if other_on is None else ((other_on,) if isinstance(other_on,int) or isinstance(other_on,str) else tuple(other_on))
+
+        codes,other_codes = self._joinkeys_(other,cols,other_cols)
+
+        other_order = np.argsort(other_codes,kind="stable")
+        other_sorted = other_codes[other_order]
+
+        lower = np.searchsorted(other_sorted,codes,side="left")
+        upper = np.searchsorted(other_sorted,codes,side="right")
+
+        counts = np.where(codes<0,0,upper-lower)
+
+        if how=="left":
+            unmatched = counts==0
+            lower[unmatched] = -1
+            counts[unmatched] = 1
+
+        rows = np.repeat(np.arange(codes.size),counts)
+
+        offsets = np.arange(rows.size)-np.repeat(np.cumsum(counts)-counts,counts)
+
+        positions = np.repeat(lower,counts)+offsets
+
+        matched = np.repeat(lower>=0,counts)
+
+        other_rows = np.full(rows.size,-1,dtype=np.int64)
+        other_rows[matched] = other_order[positions[matched]]
+
+        return self._joined_(other,rows,other_rows,other.index(*other_cols),suffix)
+
+    def asof(self,other,on,by=None,other_on=None,other_by=None,strict=False,suffix="_right"):
+        """It returns new DataFrame with the rows of self and the latest rows of other whose
+        on col is earlier than or equal to, or only earlier if strict, the on col of self. If by
+        is defined, the rows are matched within the groups of equal by keys. The rows of both
+        frames are merged in a single sort, and the latest row of other is carried forward."""
+
+        other_on = on if other_on is None else other_on
+
+        if by is None:
+            cols,other_cols = (),()
+            codes,other_codes = np.zeros(len(self.running[0]),dtype=np.int64),np.zeros(len(other.running[0]),dtype=np.int64)
+        else:
+            cols = (by,) if isinstance(by,int) or isinstance(by,str) else tuple(by)
+            other_by = by if other_by is None else other_by
+            other_cols = (other_by,) if isinstance(other_by,int) or isinstance(other_by,str) else tuple(other_by)
+            codes,other_codes = self._joinkeys_(other,cols,other_cols)
+
+        column,other_column = self[on],other[other_on]
+
+        times = np.concatenate((column.vals,other_column.vals))
+
+        nones = np.concatenate((np.logical_or(column.isnone(),codes<0),np.logical_or(other_column.isnone(),other_codes<0)))
+
+        if times.dtype.type is np.datetime64:
+            times = times.view(np.int64)
+
+        kinds = np.concatenate((np.zeros(codes.size,dtype=bool),np.ones(other_codes.size,dtype=bool)))
+
+        rows = np.concatenate((np.arange(codes.size),np.arange(other_codes.size)))
+
+        groups = np.concatenate((codes,other_codes))
+
+        keep = np.logical_or(~kinds,~nones)
+
+        times,kinds,rows,groups,nones = times[keep],kinds[keep],rows[keep],groups[keep],nones[keep]
+
+        order = np.lexsort((kinds if strict else ~kinds,times,groups))
+
+        kinds,rows,groups,nones = kinds[order],rows[order],groups[order],nones[order]
+
+        latest = np.maximum.accumulate(np.where(kinds,np.arange(kinds.size),-1))
+
+        found = np.logical_and(latest>=0,~nones)
+        found[found] = groups[latest[found]]==groups[found]
+
+        other_rows = np.full(codes.size,-1,dtype=np.int64)
+        other_rows[rows[~kinds]] = np.where(found,rows[latest],-1)[~kinds]
+
+        return self._joined_(other,np.arange(codes.size),other_rows,other.index(*other_cols) if by is not None else (),suffix)
+
+    def _joinkeys_(self,other,cols,other_cols):
+        """It returns common integer codes of the key cols of self and other_cols of other;
+        the rows with any none key get negative codes that never match."""
+
+        if len(cols)!=len(other_cols):
+            raise ValueError(f"Key cols do not match, {cols} and {other_cols}.")
+
+        size = len(self.running[0]) if len(self.running)>0 else 0
+
+        codes = np.zeros(size+len(other.running[0]),dtype=np.int64)
+
+        nones = np.zeros(codes.shape,dtype=bool)
+
+        for col,other_col in zip(cols,other_cols):
+
+            column,other_column = self[col],other[other_col]
+
+            if isinstance(column,CatColumn) and isinstance(other_column,CatColumn):
+                cats = np.union1d(column.cats,other_column.cats)
+                code = np.concatenate((np.searchsorted(cats,column.cats)[column.codes],
+                    np.searchsorted(cats,other_column.cats)[other_column.codes]))
+            else:
+                cats,code = np.unique(np.concatenate((column.vals,other_column.vals)),return_inverse=True)
+
+            nones |= np.concatenate((column.isnone(),other_column.isnone()))
+
+            if (codes.max(initial=0)+1)*max(cats.size,1)>=2**62:
+                _,codes = np.unique(codes,return_inverse=True)
+
+            codes = codes*max(cats.size,1)+code.ravel()
+
+        codes[nones] = -1
+
+        other_codes = codes[size:].copy()
+        other_codes[nones[size:]] = -2
+
+        return codes[:size],other_codes
+
+    def _joined_(self,other,rows,other_rows,other_keys,suffix):
+        """It returns new DataFrame of the rows of self and other_rows of other without the
+        other_keys columns; the negative other_rows are filled with nones."""
+
+        frame = DataFrame(homedir=self.homedir,filedir=self.filedir)
+
+        frame.running = [column[rows] for column in self.running]
+
+        heads = set(self.heads)
+
+        missing = other_rows<0
+
+        for index,column in enumerate(other.running):
+
+            if index in other_keys:
+                continue
+
+            if len(column)==0:
+                column = Column(vals=np.zeros(rows.size,dtype=column.vals.dtype),head=column.head,
+                    unit=column.unit,info=column.info,valid=np.zeros(rows.size,dtype=bool))
+                column.del_bitmap()
             else:
-                logging.critical(f"Expected cols is the list or tuple of integer or string; input, however, is {cols}")
+                column = column[np.where(missing,0,other_rows)]
+                if np.any(missing):
+                    column.set_bitmap(np.logical_and(~missing,~column.isnone()))
+                    column.del_bitmap()
+
+            if column.head in heads:
+                column.set_head(f"{column.head}{suffix}")
+
+            frame.running.append(column)
+
+        return frame
+
+    def view(self,rows=None):
+        """It returns DataFrame of Column views of the rows sharing the buffers of self."""
+
+        frame = DataFrame(homedir=self.homedir,filedir=self.filedir)
+
+        frame.running = [column.view(rows) for column in self.running]
+
+        return frame
+
+    def window(self,top,bottom,col=0):
+        """It returns the rows where top<col<bottom. For monotonic col, the rows
+        are a slice found by binary search so that slicing gives views."""
+
+        vals = self[col].vals
+
+        steps = np.diff(vals)
+
+        if np.all(steps>=0):
+            return slice(np.searchsorted(vals,top,side="right"),np.searchsorted(vals,bottom,side="left"))
+        elif np.all(steps<=0):
+            return slice(np.searchsorted(-vals,-bottom,side="right"),np.searchsorted(-vals,-top,side="left"))
+        else:
+            return np.logical_and(vals>top,vals<bottom)
+
+    def take(self,rows,inplace=True):
+        """It takes the rows, boolean mask or indices, of all columns."""
+
+        running = [column[rows] for column in self.running]
+
+        if inplace:
+            self.running = running
         else:
-            logging.critical(f"Other than None, expected cols is integer or string or their list or tuples; input, however, is {cols}")
+            frame = DataFrame(homedir=self.homedir,filedir=self.filedir)
+            frame.running = running
+            return frame
+
+    """CONTEXT MANAGERS"""
+    def write(self,filepath,fstring=None,batches=None,chunksize=None,**kwargs):
+        """It writes text form of DataFrame. The fstring is parsed once and the rows are
+        formatted in blocks of chunksize, one array operation per column, and each block is
+        written as a single buffer. If batches is defined, it is an iterable of DataFrames or
+        lists of column arrays that are streamed to the file below the heads of DataFrame."""
+
+        chunksize = self.write_chunksize if chunksize is None else chunksize
+
+        if fstring is None:
+            fstring = ("{}\t"*len(self.running))[:-1]+"\n"
+
+        parts = re.split(r"(\{[^{}]*\})",fstring)
+
+        fields = [literal+spec for literal,spec in zip(parts[0:-1:2],parts[1::2])]
+
+        if len(fields)!=len(self.running):
+            raise ValueError(f"fstring has {len(fields)} fields for {len(self.running)} columns.")
+
+        ending = parts[-1].replace("{{","{").replace("}}","}")
+
+        if batches is None:
+            batches = self._batches_(chunksize)
+
+        with open(filepath,"w",encoding='utf-8',buffering=self.write_buffering) as wfile:
+
+            wfile.write(("{}\t"*len(self.running))[:-1].format(*self.heads)+"\n")
+
+            for batch in batches:
+
+                if isinstance(batch,DataFrame):
+                    columns = batch.running
+                else:
+                    columns = [column if isinstance(column,Column) else Column(vals=column) for column in batch]
+
+                lines = None
+
+                for field,column in zip(fields,columns):
+                    strings = column.stringify(fstring=field).vals
+                    lines = strings if lines is None else np.char.add(lines,strings)
+
+                if lines is None or lines.size==0:
+                    continue
+
+                wfile.write(ending.join(lines.tolist())+ending)
+
+    def _batches_(self,chunksize):
+        """It yields lists of Columns for consecutive blocks of chunksize rows."""
+
+        nrows = self.running[0].vals.size if len(self.running)>0 else 0
+
+        for start in range(0,nrows,chunksize):
+            yield [column[start:start+chunksize] for column in self.running]
+
+    def writeb(self,filename):
+        """It writes binary columnar form of DataFrame. The file starts with a json header
+        holding head, unit, info, dtype and offset of each column followed by the raw column
+        buffers so that they can be memory-mapped by readb. The packed validity bitmap of a
+        column is written after its buffer and its offset is kept in the header."""
+
+        filepath = self.get_abspath(f"{filename}.{self.binary_extension}",homeFlag=True)
+
+        items,offset = [],0
+
+        for column in self.running:
+
+            if column.vals.dtype.hasobject:
+                raise TypeError(f"Column {column.head} has object dtype and can not be written in binary form.")
+
+            items.append({
+                "head": column.head,
+                "unit": column.unit,
+                "info": column.info,
+                "dtype": column.vals.dtype.str,
+                "size": column.vals.size,
+                "offset": offset,
+                "bitmap": None,
+                })
+
+            offset += -(-column.vals.nbytes//self.binary_align)*self.binary_align
+
+            if column.bitmap is not None:
+                items[-1]["bitmap"] = offset
+                offset += -(-column.bitmap.nbytes//self.binary_align)*self.binary_align
+
+        header = json.dumps({"columns":items}).encode("utf-8")
+
+        start = len(self.binary_magic)+8+len(header)
+        start = -(-start//self.binary_align)*self.binary_align
+
+        with open(filepath,"wb") as bfile:
+
+            bfile.write(self.binary_magic)
+            bfile.write(len(header).to_bytes(8,"little"))
+            bfile.write(header)
+
+            for item,column in zip(items,self.running):
+                bfile.seek(start+item["offset"])
+                bfile.write(np.ascontiguousarray(column.vals).tobytes())
+                if item["bitmap"] is not None:
+                    bfile.seek(start+item["bitmap"])
+                    bfile.write(column.bitmap.tobytes())
+
+            bfile.truncate(start+offset)
+
+    def readb(self,filename,mode="c"):
+        """It reads binary columnar form of DataFrame. The vals of Columns are numpy.memmap
+        views of the file, so only the touched parts of the columns are loaded to memory.
+        The mode is passed to numpy.memmap, the default "c" is copy-on-write."""
+
+        filepath = self.get_abspath(f"{filename}.{self.binary_extension}",homeFlag=True)
+
+        with open(filepath,"rb") as bfile:
+
+            if bfile.read(len(self.binary_magic))!=self.binary_magic:
+                raise ValueError(f"{filepath} is not a binary DataFrame file.")
+
+            length = int.from_bytes(bfile.read(8),"little")
+
+            header = json.loads(bfile.read(length).decode("utf-8"))
+
+        start = len(self.binary_magic)+8+length
+        start = -(-start//self.binary_align)*self.binary_align
+
+        self.running = []
+
+        for item in header["columns"]:
+
+            dtype = np.dtype(item["dtype"])
+
+            if item["size"]==0:
+                vals = np.empty((0,),dtype=dtype)
+            else:
+                vals = np.memmap(filepath,dtype=dtype,mode=mode,offset=start+item["offset"],shape=(item["size"],))
+
+            column = Column(head=item["head"],info=item["info"])
+
+            column.vals = vals
+            column.unit = item["unit"]
+
+            if item.get("bitmap") is not None:
+                column.bitmap = np.fromfile(filepath,dtype=np.uint8,count=-(-item["size"]//8),offset=start+item["bitmap"])
+
+            self.running.append(column)
+
+    """PROPERTY METHODS"""
+    @property
+    def types(self):
+
+        return [column.vals.dtype.type for column in self.running]
+
+    @property
+    def heads(self):
+
+        return [column.head for column in self.running]
+
+    @property
+    def units(self):
+
+        return [column.unit for column in self.running]
+
+    @property
+    def infos(self):
+
+        return [column.info for column in self.running]
+
+class RowBuilder():
+    """It collects rows in per-column chunk lists and finalizes them into typed Columns once."""
+
+    def __init__(self,heads,frame=None):
 
-        columns = [self._running[idcol] for idcol in idcols]
+        self.heads = list(heads)
+        self.frame = frame
 
-        columns.reverse()
+        self.chunks = [[] for _ in self.heads]
+        self.pending = [[] for _ in self.heads]
 
-        sort_index = np.lexsort(columns)
+        self.size = 0
 
-        if reverse:
-            sort_index = np.flip(sort_index)
+    def add_row(self,row):
+        """It appends a single row of values, one for each head."""
 
-        if inplace:
-            self._running = [column[sort_index] for column in self._running]
-            self.running = [np.asarray(column) for column in self._running]
-        else:
-            self.running = [np.asarray(column[sort_index]) for column in self._running]
+        if len(row)!=len(self.heads):
+            raise ValueError(f"Row has {len(row)} values for {len(self.heads)} heads.")
 
-        if returnFlag:
-            return sort_index
+        for pending,val in zip(self.pending,row):
+            pending.append(val)
 
-    def filter(self,cols=None,keywords=None,regex=None,year=None):
-        """It should allow multiple header indices filtering"""
+        self.size += 1
 
-        if cols is None:
-            return
-        elif isinstance(cols,int):
-            idcols = (cols,)
-        elif isinstance(cols,str):
-            idcols = (self._headers.index(cols),)
-        elif isinstance(cols,list) or isinstance(cols,tuple):
-            if isinstance(cols[0],int):
-                idcols = cols
-            elif isinstance(cols[0],str):
-                idcols = [self._headers.index(col) for col in cols]
-            else:
-                logging.critical(f"Expected cols is the list or tuple of integer or string; input is {cols}")
-        else:
-            logging.critical(f"Expected cols is integer or string or their list or tuples; input is {cols}")
+        return self
 
-        if keywords is not None:
-            match_array = np.array(keywords).reshape((-1,1))
-            match_index = np.any(self._running[idcols[0]]==match_array,axis=0)
-        elif regex is not None:
-            match_vectr = np.vectorize(lambda x: bool(re.compile(regex).match(x)))
-            match_index = match_vectr(self._running[idcols[0]])
-        elif year is not None:
-            match_vectr = np.vectorize(lambda x: x.year==year)
-            match_index = match_vectr(self._running[idcols[0]].tolist())
+    def add_rows(self,rows):
+        """It appends a batch of rows. The rows can be a list of rows or a DataFrame
+        with the same column order, whose column arrays are appended without copying."""
 
-        if inplace:
-            self._running = [column[match_index] for column in self._running]
-            self.running = [np.asarray(column) for column in self._running]
-        else:
-            self.running = [np.asarray(column[match_index]) for column in self._running]
+        if isinstance(rows,DataFrame):
+            self.add_cols(*[column.vals for column in rows.running])
+        elif len(rows)>0:
+            self.add_cols(*zip(*rows))
 
-    def unique(self,cols):
+        return self
 
-        if isinstance(cols,int):
-            cols = (cols,)
-        elif isinstance(cols,str):
-            cols = (cols,)
+    def add_cols(self,*cols):
+        """It appends a batch of rows given as column arrays of equal size."""
 
-        idcols = self.index(*cols)
+        if len(cols)!=len(self.heads):
+            raise ValueError(f"Batch has {len(cols)} columns for {len(self.heads)} heads.")
 
-        Z = []
+        self._flush_()
 
-        for idcol in idcols:
-            column_ = self[idcol][:]
-            column_.astype(str)
-            Z.append(column_.vals)
+        cols = [np.asarray(col) if isinstance(col,np.ndarray) else np.array(col) for col in cols]
 
-        Z = np.array(Z,dtype=str).T
+        if len(set([col.size for col in cols]))>1:
+            raise ValueError("Columns of the batch do not have the same size.")
 
-        _,idrows = np.unique(Z,axis=0,return_index=True)
+        for chunks,col in zip(self.chunks,cols):
+            chunks.append(col.ravel())
 
-        # if inplace:
-        self.running = [column[idrows] for column in self.running]
-            # self.running = [np.asarray(column) for column in self._running]
-        # else:
-        #     self.running = [np.asarray(column[idrows]) for column in self.running]
+        self.size += cols[0].size
 
-    """CONTEXT MANAGERS"""
-    def write(self,filepath,fstring=None,**kwargs):
-        """It writes text form of DataFrame."""
+        return self
 
-        header_fstring = ("{}\t"*len(self._headers))[:-1]+"\n"
+    def _flush_(self):
+        """It moves the single rows collected so far to the chunk lists."""
 
-        if fstring is None:
-            running_fstring = ("{}\t"*len(self._headers))[:-1]+"\n"
-        else:
-            running_fstring = fstring
+        if len(self.pending)==0 or len(self.pending[0])==0:
+            return
 
-        vprint = np.vectorize(lambda *args: running_fstring.format(*args))
+        for chunks,pending in zip(self.chunks,self.pending):
+            chunks.append(np.array(pending))
 
-        with open(filepath,"w",encoding='utf-8') as wfile:
-            wfile.write(header_fstring.format(*self._headers))
-            for line in vprint(*self._running):
-                wfile.write(line)
+        self.pending = [[] for _ in self.heads]
 
-    def writeb(self,filename):
-        """It writes binary form of DataFrame."""
+    def __len__(self):
 
-        filepath = self.get_abspath(f"{filename}.npz",homeFlag=True)
+        return self.size
 
-        for header,column in zip(self._headers,self._running):
-            kwargs[header] = column
+    def tocolumns(self):
+        """It returns the collected rows as typed Columns, each allocated once."""
 
-        np.savez_compressed(filepath,**kwargs)
+        self._flush_()
 
-    """PROPERTY METHODS"""
-    @property
-    def types(self):
+        columns = []
 
-        return [column.vals.dtype.type for column in self.running]
+        for head,chunks in zip(self.heads,self.chunks):
 
-    @property
-    def heads(self):
+            if len(chunks)==0:
+                vals = np.array([])
+            elif len(chunks)==1:
+                vals = chunks[0]
+            else:
+                vals = np.concatenate(chunks)
 
-        return [column.head for column in self.running]
+            columns.append(Column(vals=vals,head=head))
 
-    @property
-    def units(self):
+        return columns
 
-        return [column.unit for column in self.running]
+    def finalize(self):
+        """It appends the collected rows to the frame, or to a new DataFrame if the
+        builder is not bound to any, empties the builder and returns the frame. The rows
+        appended to the columns of the frame are converted to their dtypes."""
 
-    @property
-    def infos(self):
+        frame = DataFrame() if self.frame is None else self.frame
 
-        return [column.info for column in self.running]
+        if self.size==0:
+            return frame
+
+        columns = self.tocolumns()
+
+        if len(frame.running)==0:
+            for column in columns:
+                frame[column.head] = column
+        elif len(frame.running)!=len(columns):
+            raise ValueError(f"Builder has {len(columns)} columns for {len(frame.running)} columns of DataFrame.")
+        else:
+            for column,new in zip(frame.running,columns):
+                nones = new.isnone()
+                valid = None if column.bitmap is None else np.concatenate((column.valid,~nones))
+                if new.dtypeM is not column.dtypeM:
+                    new.astype(dtype=column.dtypeM)
+                    if valid is None and nones.any():
+                        valid = np.concatenate((~column.isnone(),~nones))
+                vals = new.vals if column.dtypeM is str else new.vals.astype(column.vals.dtype)
+                column.vals = np.concatenate((column.vals,vals))
+                column.cow = False
+                if valid is not None:
+                    column.set_bitmap(valid)
+
+        self.chunks = [[] for _ in self.heads]
+        self.size = 0
+
+        return frame
 
 class Glossary():
     """It is a table of lines vs heads"""
@@ -1510,107 +2843,485 @@ class Glossary():
 
         return len(self.lines)
 
-def loadtxt(path,classname=None,**kwargs):
+def loadtxt(path,classname=None,cache=None,**kwargs):
+    """It returns the frame read from the path. The classname is the name of a reader class,
+    a reader class itself or a callable reading a path; if None, the reader is chosen by the
+    file extension. If cache, TextCache, is given, the frame is taken from the cache when
+    the path has not changed since it was stored."""
+
+    if classname is None or isinstance(classname,str):
+        cachename = classname
+    else:
+        cachename = classname.__qualname__
+
+    if cache is not None:
+
+        frame = cache.get(path,cachename,**kwargs)
+
+        if frame is not None:
+            return frame
 
     if classname is None:
         if path.lower().endswith(".txt"):
-            obj = RegText()
+            read = RegText().read
         elif path.lower().endswith(".las"):
-            obj = LogASCII()
+            read = LogASCII().read
         elif path.lower().endswith(".xlsx"):
-            obj = Excel()
+            read = Excel().read
         elif path.lower().endswith(".vtk"):
-            obj = VTKit()
+            read = VTKit().read
         else:
-            obj = IrrText()
+            read = IrrText().read
+    elif isinstance(classname,type):
+        read = classname().read
+    elif callable(classname):
+        read = classname
     elif classname.lower()=="regtext":
-        obj = RegText()
+        read = RegText().read
     elif classname.lower()=="logascii":
-        obj = LogASCII()
+        read = LogASCII().read
     elif classname.lower()=="excel":
-        obj = Excel()
+        read = Excel().read
     elif classname.lower()=="irrtext":
-        obj = IrrText()
+        read = IrrText().read
     elif classname.lower()=="wschedule":
-        obj = WSchedule()
+        read = WSchedule().read
     elif classname.lower()=="vtkit":
-        obj = VTKit()
+        read = VTKit().read
+    else:
+        raise ValueError(f"Expected classname is one of the reader classes; input is {classname}")
 
-    frame = obj.read(path,**kwargs)
+    frame = read(path,**kwargs)
+
+    if cache is not None:
+        cache.set(frame,path,cachename,**kwargs)
 
     return frame
 
+def loadtxts(paths,classname=None,workers=None,**kwargs):
+    """It returns the frames read from the paths in the input order. When workers
+    is more than one, the paths are parsed in a pool of processes and classname must
+    be picklable. A path that could not be read does not abort the batch; its frame
+    is None and the error is returned in the dictionary of errors keyed by the path."""
+
+    frames,errors = [],{}
+
+    if workers is None or workers<=1:
+
+        for path in paths:
+            try:
+                frames.append(loadtxt(path,classname,**kwargs))
+            except Exception as error:
+                frames.append(None)
+                errors[path] = error
+
+    else:
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+
+            futures = [executor.submit(loadtxt,path,classname,**kwargs) for path in paths]
+
+            for path,future in zip(paths,futures):
+                try:
+                    frames.append(future.result())
+                except Exception as error:
+                    frames.append(None)
+                    errors[path] = error
+
+    for path,error in errors.items():
+        logging.error(f"Could not load {path}, {error!r}.")
+
+    return frames,errors
+
+def loadnum(path,ncols=None,delimiter=None,comments="#",skiprows=0,offset=0,dtype=float,usecols=None,wrapped=False,blocksize=16_777_216):
+    """It returns the numbers of a purely numeric file as two dimensional float64 or int64 array.
+    The file is memory mapped and, after the byte offset and skiprows lines, tokenized in blocks
+    of blocksize bytes cut at line ends straight into the preallocated output, so that no python
+    string is created per line. The number of columns is counted on the first data line unless
+    ncols is given. If usecols, column indices, is given, each block is tokenized in a scratch
+    array and only the usecols are stored, so that the output scales with the selected columns.
+    Every delimiter bounds a field and the comments start the ignored rest of a line. It raises
+    ValueError if a field is empty or not a number, or if a line does not have ncols fields;
+    when wrapped, the rows may span several lines and only the total count is checked."""
+
+    kernel = tokenize_int if np.dtype(dtype).kind in "iu" else tokenize
+
+    dtype = "int64" if np.dtype(dtype).kind in "iu" else "float64"
+
+    if os.path.getsize(path)<=offset:
+        return np.empty((0,(ncols or 0) if usecols is None else len(usecols)),dtype=dtype)
+
+    with open(path,"rb") as file:
+        buffer = mmap.mmap(file.fileno(),0,access=mmap.ACCESS_READ)
+
+    size = len(buffer)
+
+    for _ in range(skiprows):
+        offset = buffer.find(b"\n",offset)+1 or size
+
+    data,start = np.frombuffer(buffer,dtype=np.uint8),offset
+
+    while ncols is None and start<size:
+        stop = buffer.find(b"\n",start)+1 or size
+        line = data[start:stop]
+        ncols = kernel(line,np.empty(line.size//2+1,dtype=dtype),delimiter,comments) or None
+        start = stop
+
+    if ncols is None:
+        return np.empty((0,0),dtype=dtype)
+
+    fields = 0 if wrapped else ncols
+
+    nlines = sum(np.count_nonzero(data[index:index+blocksize]==10) for index in range(offset,size,blocksize))
+
+    if usecols is None:
+        values = np.empty((nlines+1)*ncols,dtype=dtype)
+    else:
+        values,carry = np.empty((nlines+1,len(usecols)),dtype=dtype),np.empty(0,dtype=dtype)
+
+    count,start = 0,offset
+
+    while start<size:
+        stop = buffer.rfind(b"\n",start,start+blocksize)+1 if start+blocksize<size else size
+        stop = stop if stop>start else buffer.find(b"\n",start+blocksize)+1 or size
+        if usecols is None:
+            count += kernel(data[start:stop],values[count:],delimiter,comments,fields)
+        else:
+            scratch = np.empty(carry.size+(np.count_nonzero(data[start:stop]==10)+1)*ncols,dtype=dtype)
+            scratch[:carry.size] = carry
+            nvals = carry.size+kernel(data[start:stop],scratch[carry.size:],delimiter,comments,fields)
+            nrows = nvals//ncols
+            values[count:count+nrows] = scratch[:nrows*ncols].reshape((-1,ncols))[:,usecols]
+            carry,count = scratch[nrows*ncols:nvals].copy(),count+nrows
+        start = stop
+
+    if usecols is not None and carry.size!=0:
+        raise ValueError(f"The rows of {path} do not have {ncols} values each.")
+    elif usecols is not None:
+        return values[:count]
+
+    if count%ncols!=0:
+        raise ValueError(f"The rows of {path} do not have {ncols} values each.")
+
+    return values[:count].reshape((-1,ncols))
+
+class TextCache():
+    """It stores parsed frames on the disk. The columns of an entry are written by writeb
+    and memory-mapped back by readb, the other attributes of the frame are pickled next to
+    them. The entries are keyed by the cache version, the path, size and modification time
+    of the source file, the reading options and optionally the hash of the file content.
+    The least recently used entries are removed when the total size of the cache exceeds
+    maxsize in bytes; temporary files older than tempage seconds are removed as orphans."""
+
+    version = 2
+
+    tempage = 3600
+
+    def __init__(self,cachedir=None,maxsize=2_000_000_000,hashFlag=False):
+
+        if cachedir is None:
+            cachedir = os.path.join(os.path.expanduser("~"),".petepy","cache")
+
+        os.makedirs(cachedir,exist_ok=True)
+
+        self.cachedir = cachedir
+        self.maxsize = maxsize
+        self.hashFlag = hashFlag
+
+    def get_key(self,path,classname=None,**kwargs):
+        """It returns the key of the path, unique for its current state and the reading options."""
+
+        path = os.path.abspath(path)
+
+        stat = os.stat(path)
+
+        key = f"{self.version}|{path}|{stat.st_size}|{stat.st_mtime_ns}|{classname}|{sorted(kwargs.items())}"
+
+        if self.hashFlag:
+            with open(path,"rb") as bfile:
+                key += "|{}".format(hashlib.sha1(bfile.read()).hexdigest())
+
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def get_path(self,path,classname=None,**kwargs):
+        """It returns the path of the cache entry for the path without extension; the entry
+        is made of the pickled attributes, .pkl, and the binary columns, .dfb."""
+
+        return os.path.join(self.cachedir,self.get_key(path,classname,**kwargs))
+
+    def get(self,path,classname=None,**kwargs):
+        """It returns the cached frame of the path or None if there is no valid entry.
+        An entry which can not be loaded for any reason is removed and counted as a miss."""
+
+        cachepath = self.get_path(path,classname,**kwargs)
+
+        try:
+            with open(f"{cachepath}.pkl","rb") as bfile:
+                attrs = pickle.load(bfile)
+            frame = DataFrame()
+            frame.__dict__.update(attrs)
+            frame.readb(cachepath)
+        except FileNotFoundError:
+            return
+        except Exception as error:
+            logging.warning(f"Removing unreadable cache entry {cachepath}, {error!r}.")
+            self._remove_(f"{cachepath}.pkl",f"{cachepath}.{DataFrame.binary_extension}")
+            return
+
+        try:
+            os.utime(f"{cachepath}.pkl")
+        except OSError:
+            pass
+
+        return frame
+
+    def set(self,frame,path,classname=None,**kwargs):
+        """It stores the frame of the path and evicts the old entries if needed."""
+
+        cachepath = self.get_path(path,classname,**kwargs)
+
+        temppath = f"{cachepath}.{os.getpid()}.tmp"
+
+        attrs = {key:value for key,value in frame.__dict__.items() if key not in ("running","_headmap_")}
+
+        try:
+            frame.writeb(temppath)
+            with open(f"{temppath}.pkl","wb") as bfile:
+                pickle.dump(attrs,bfile,protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(f"{temppath}.{frame.binary_extension}",f"{cachepath}.{frame.binary_extension}")
+            os.replace(f"{temppath}.pkl",f"{cachepath}.pkl")
+        except (OSError,TypeError,pickle.PicklingError) as error:
+            logging.warning(f"Could not cache {path}, {error!r}.")
+            self._remove_(f"{temppath}.{frame.binary_extension}",f"{temppath}.pkl")
+            return
+
+        self.evict()
+
+    def evict(self):
+        """It removes the orphan temporary files and the least recently used entries until
+        the cache fits in maxsize. The files removed by other processes meanwhile are skipped."""
+
+        entries,now = {},datetime.datetime.now().timestamp()
+
+        for entry in os.scandir(self.cachedir):
+
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+
+            if ".tmp" in entry.name:
+                if now-stat.st_mtime>self.tempage:
+                    self._remove_(entry.path)
+                continue
+
+            key = entry.name.split(".")[0]
+
+            mtime,size,paths = entries.get(key,(0,0,[]))
+
+            entries[key] = (max(mtime,stat.st_mtime),size+stat.st_size,paths+[entry.path])
+
+        entries = sorted(entries.values())
+
+        cachesize = sum([size for _,size,_ in entries])
+
+        for _,size,paths in entries:
+
+            if cachesize<=self.maxsize:
+                break
+
+            self._remove_(*paths)
+
+            cachesize -= size
+
+    def clear(self):
+        """It removes all the entries of the cache."""
+
+        self._remove_(*[entry.path for entry in os.scandir(self.cachedir)])
+
+    @staticmethod
+    def _remove_(*paths):
+        """It removes the paths, skipping the ones already removed or still in use."""
+
+        for path in paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
 # Collective Data Input/Output Classes
 
 class RegText(DataFrame):
 
-    def __init__(self,filepaths=None,**kwargs):
+    def __init__(self,filepaths=None,workers=None,cache=None,**kwargs):
 
         super().__init__(**kwargs)
 
         self.frames = []
+        self.errors = {}
 
-        self.add_frames(filepaths,**kwargs)
+        self.add_frames(filepaths,workers=workers,cache=cache,**kwargs)
 
-    def add_frames(self,filepaths,**kwargs):
+    def add_frames(self,filepaths,workers=None,cache=None,**kwargs):
+        """It reads the files and appends the frames in the input order. If workers
+        is more than one, the files are parsed in parallel processes. The files are read
+        by the read of this class, which is rebuilt from type(self) in the processes. If a
+        file could not be read, the frames before it are kept, the errors are stored in
+        self.errors and the error of the first failing file is raised. If cache, TextCache,
+        is given, the unchanged files are taken from the cache."""
 
         if filepaths is None:
             return
         if not isinstance(filepaths,list) and not isinstance(filepaths,tuple):
             filepaths = (filepaths,)
 
-        for filepath in filepaths:
-            self.frames.append(self.read(filepath,**kwargs))
+        filepaths = [self.get_abspath(filepath) for filepath in filepaths]
+
+        reader = self.read if workers is None or workers<=1 else type(self)
+
+        frames,errors = loadtxts(filepaths,reader,workers=workers,cache=cache,**kwargs)
+
+        self.errors.update(errors)
+
+        for filepath,frame in zip(filepaths,frames):
+            if frame is None:
+                raise errors[filepath]
+            self.frames.append(frame)
             logging.info(f"Loaded {filepath} as expected.")
 
     def read(self,filepath,delimiter="\t",comments="#",skiprows=None,nondigitflag=False):
 
         filepath = self.get_abspath(filepath)
 
+        if nondigitflag:
+            builder = None
+            for batch in self.iterread(filepath,delimiter=delimiter,comments=comments,skiprows=skiprows):
+                builder = batch.builder() if builder is None else builder.add_rows(batch)
+            frame = DataFrame(filedir=filepath) if builder is None else builder.finalize()
+            frame.filepath = filepath
+            return frame
+
         frame = DataFrame(filedir=filepath)
 
         frame.filepath = filepath
 
         with open(filepath,mode="r",encoding="latin1") as text:
+            skiprows,_ = self._skiprows_(text,delimiter,skiprows)
 
-            if skiprows is None:
-                skiprows = 0
-                line = next(text).split("\n")[0]
-                while not line.split(delimiter)[0].isdigit():
-                    skiprows += 1
-                    line = next(text).split("\n")[0]
-            else:
-                for _ in range(skiprows):
-                    line = next(text)
+        data = loadnum(filepath,delimiter=delimiter,comments=comments,skiprows=skiprows)
 
-            line = next(text).split("\n")[0]
+        for column in data.transpose():
+            frame.running.append(Column(vals=column))
 
-        if nondigitflag:
-            row = line.split(delimiter)
-            dtypes = [float if column.isdigit() else str for column in row]
-            columns = []
-            for index,dtype in enumerate(dtypes):
-                column = np.loadtxt(filepath,dtype=dtype,delimiter=delimiter,skiprows=skiprows,usecols=[index],encoding="latin1")
-                columns.append(column)
+        return frame
+
+    def iterread(self,filepath,chunksize=100_000,delimiter="\t",comments="#",skiprows=None,heads=None,dtypes=None):
+        """It yields DataFrame batches of chunksize rows reading the file once, so that
+        the memory is bounded by the chunk. The number of columns and their dtypes are
+        inferred from the first chunk, unless dtypes is given, and kept for all batches.
+        If heads is not defined, the last skipped row is used when it fits the columns."""
+
+        filepath = self.get_abspath(filepath)
+
+        with open(filepath,mode="r",encoding="latin1") as text:
+
+            skiprows,header = self._skiprows_(text,delimiter,skiprows)
+
+            text.seek(0)
+
+            lines = (line.rstrip("\r\n") for line in itertools.islice(text,skiprows,None))
+
+            lines = (line for line in lines if line.strip() and not (comments and line.startswith(comments)))
+
+            while True:
+
+                chunk = np.array(list(itertools.islice(lines,chunksize)),dtype=str)
+
+                if chunk.size==0:
+                    return
+
+                if dtypes is None:
+                    columns = str2cols(chunk,delimiter=delimiter)
+                    dtypes = [self._dtype_(column) for column in columns]
+                else:
+                    columns = str2cols(chunk,delimiter=delimiter,maxsplit=len(dtypes)-1)
+
+                if heads is None:
+                    fields = header.split(delimiter) if header is not None else []
+                    heads = fields if len(fields)==len(dtypes) else [f"column_{index}" for index in range(len(dtypes))]
+
+                frame = DataFrame(filedir=filepath)
+
+                frame.filepath = filepath
+
+                for head,dtype,index in zip(heads,dtypes,range(len(dtypes))):
+                    vals = columns[index] if index<len(columns) else np.zeros(chunk.shape,dtype="U1")
+                    frame.running.append(Column(vals=vals,head=head,dtype=dtype))
+
+                yield frame
+
+    @staticmethod
+    def _skiprows_(text,delimiter,skiprows=None):
+        """It returns the number of rows before the data and the last of them. If skiprows
+        is None, the data starts at the first row whose first field is a digit."""
+
+        header = None
+
+        if skiprows is None:
+            skiprows = 0
+            for line in text:
+                line = line.rstrip("\r\n")
+                if line.split(delimiter)[0].strip().isdigit():
+                    break
+                header = line
+                skiprows += 1
         else:
-            data = np.loadtxt(filepath,comments="#",delimiter=delimiter,skiprows=skiprows,encoding="latin1")
-            columns = [column for column in data.transpose()]
+            for line in itertools.islice(text,skiprows):
+                header = line.rstrip("\r\n")
 
-        frame.set_running(*columns,init=True)
+        return skiprows,header
 
-        return frame
+    @staticmethod
+    def _dtype_(strings):
+        """It returns float if all the strings are numbers, np.datetime64 if all of them
+        are dates with the same format, else str; empty strings are nones."""
+
+        strings = np.unique(strings[np.char.str_len(strings)>0])
+
+        if strings.size==0:
+            return str
+
+        try:
+            str2float(strings)
+        except ValueError:
+            pass
+        else:
+            return float
+
+        if infer_datetime_format(strings[:20]) is not None:
+            return np.datetime64
+
+        return str
 
 class LogASCII(DataFrame):
 
-    def __init__(self,filepaths=None,**kwargs):
+    def __init__(self,filepaths=None,workers=None,usecols=None,cache=None,**kwargs):
 
         super().__init__(**kwargs)
 
         self.frames = []
+        self.errors = {}
 
-        self.add_frames(filepaths,**kwargs)
+        self.add_frames(filepaths,workers=workers,usecols=usecols,cache=cache,**kwargs)
 
-    def add_frames(self,filepaths,**kwargs):
+    def add_frames(self,filepaths,workers=None,usecols=None,cache=None,**kwargs):
+        """It reads the files and appends the frames in the input order. If workers
+        is more than one, the files are parsed in parallel processes. The files are read
+        by the read of this class, which is rebuilt from type(self) in the processes. If a
+        file could not be read, the frames before it are kept, the errors are stored in
+        self.errors and the error of the first failing file is raised. If cache, TextCache,
+        is given, the unchanged files are taken from the cache. If usecols, curve mnemonics,
+        is given, only these curves are stored in the frames."""
 
         if filepaths is None:
             return
@@ -1618,28 +3329,49 @@ class LogASCII(DataFrame):
         if not isinstance(filepaths,list) and not isinstance(filepaths,tuple):
             filepaths = (filepaths,)
 
-        for filepath in filepaths:
-            self.frames.append(self.read(filepath,**kwargs))
+        filepaths = [self.get_abspath(filepath) for filepath in filepaths]
+
+        reader = self.read if workers is None or workers<=1 else type(self)
+
+        frames,errors = loadtxts(filepaths,reader,workers=workers,cache=cache,usecols=usecols,**kwargs)
+
+        self.errors.update(errors)
+
+        for filepath,frame in zip(filepaths,frames):
+            if frame is None:
+                raise errors[filepath]
+            self.frames.append(frame)
             logging.info(f"Loaded {filepath} as expected.")
 
-    def read(self,filepath):
+    def read(self,filepath,usecols=None):
+        """It reads LAS file in a single pass; the header is scanned line by line and
+        the ~ASCII section is tokenized once from where the header scan has stopped.
+        If usecols, curve mnemonics or indices, is given, only these curves are converted
+        and stored while the header sections keep all the curves."""
 
         filepath = self.get_abspath(filepath)
 
-        datasection = "{}ASCII".format("~")
+        frame = DataFrame(filedir=filepath)
+
+        frame.filepath = filepath
 
-        skiprows = 1
+        mnemonics,units,values,descriptions = [],[],[],[]
 
-        frame = DataFrame(filedir=filepath)
+        title = None
 
-        with open(filepath,"r",encoding="latin1") as text:
+        with open(filepath,"rb") as text:
 
-            line = next(text).strip()
+            for line in text:
 
-            while not line.startswith(datasection[:2]):
+                line = line.decode("latin1").strip()
 
                 if line.startswith("~"):
 
+                    self._set_section(frame,title,mnemonics,units,values,descriptions)
+
+                    if line.upper().startswith("~A"):
+                        break
+
                     title = line[1:].split()[0].lower()
 
                     mnemonics,units,values,descriptions = [],[],[],[]
@@ -1691,88 +3423,116 @@ class LogASCII(DataFrame):
                     values.append(value)
                     descriptions.append(descrptn.strip())
 
-                skiprows += 1
+            offset = text.tell()
 
-                line = next(text).strip()
+        heads = frame.curve[:,"mnemonic"]
+        units = frame.curve[:,"unit"]
+        infos = frame.curve[:,"description"]
 
-                if line.startswith("~"):
+        indices = self._get_usecols(filepath,heads,usecols)
+
+        try:
+            tokens = loadnum(filepath,ncols=len(heads),offset=offset,usecols=None if usecols is None else indices,
+                wrapped=getattr(frame,"mode",None)=="Wrapped")
+        except ValueError:
+            tokens = self._get_tokens(filepath,offset,len(heads))[:,indices]
 
-                    if title=="version":
+        value_null = self._get_null(frame)
 
-                        vnumb = "LAS {}".format(values[mnemonics.index("VERS")])
-                        vinfo = descriptions[mnemonics.index("VERS")]
-                        mtype = "Un-wrapped" if values[mnemonics.index("WRAP")]=="NO" else "Wrapped"
-                        minfo = descriptions[mnemonics.index("WRAP")]
+        for vals,index in zip(tokens.transpose(),indices):
 
-                        frame.add_attrs(info=vnumb)
-                        frame.add_attrs(infodetail=vinfo)
-                        frame.add_attrs(mode=mtype)
-                        frame.add_attrs(modedetail=minfo)
+            head,unit,info = heads[index],units[index],infos[index]
 
-                    elif title=="curve":
+            try:
+                vals = vals.astype(float)
+            except ValueError:
+                unit = None
+            else:
+                vals[vals==value_null] = np.nan
+                unit = "dimensionless" if unit=="" else unit
 
-                        frame.set_headers(*mnemonics)
-                        frame.add_attrs(units=units)
-                        frame.add_attrs(details=descriptions)
+            frame.running.append(Column(vals=vals,head=head,unit=unit,info=info))
 
-                    else:
+        return frame
 
-                        frame.add_glossary(title,
-                            mnemonic=mnemonics,
-                            unit=units,
-                            value=values,
-                            description=descriptions)
+    @staticmethod
+    def _set_section(frame,title,mnemonics,units,values,descriptions):
+        """It sets the header section of LAS file to the frame."""
 
-            line = next(text).strip()
+        if title is None:
+            return
 
-            row = re.sub(' +',' ',line).split(" ")
+        if title=="version":
 
-            dtypes = [float if isnumber(cell) else str for cell in row]
+            vnumb = "LAS {}".format(values[mnemonics.index("VERS")])
+            vinfo = descriptions[mnemonics.index("VERS")]
+            mtype = "Un-wrapped" if values[mnemonics.index("WRAP")]=="NO" else "Wrapped"
+            minfo = descriptions[mnemonics.index("WRAP")]
 
-        usecols = None
+            frame.add_attrs(info=vnumb)
+            frame.add_attrs(infodetail=vinfo)
+            frame.add_attrs(mode=mtype)
+            frame.add_attrs(modedetail=minfo)
 
-        if all([dtype is float for dtype in dtypes]):
+        else:
 
-            logdata = np.loadtxt(filepath,
-                comments="#",
-                skiprows=skiprows,
-                usecols=usecols,
-                encoding="latin1")
+            frame.add_glossary(title,mnemonic=str,unit=str,value=float,description=str)
 
-            if hasattr(frame,"well"):
-                try:
-                    value_null = frame.well.get_row(mnemonic="NULL")["value"]
-                except TypeError:
-                    value_null = -999.25
-                except KeyError:
-                    value_null = -999.25
-            else:
-                value_null = -999.25
+            glossary = getattr(frame,title)
 
-            logdata[logdata==value_null] = np.nan
+            for line in zip(mnemonics,units,values,descriptions):
+                glossary.add_line(**dict(zip(glossary.heads,line)))
 
-            columns = [column for column in logdata.transpose()]
+    @staticmethod
+    def _get_usecols(filepath,heads,usecols=None):
+        """It returns the indices of usecols, mnemonics or indices, in the curve heads;
+        all of them if usecols is None. Mnemonics missing in the file are skipped, and
+        indices out of the curve count raise ValueError."""
 
-        else:
+        if usecols is None:
+            return list(range(len(heads)))
+
+        if isinstance(usecols,str) or isinstance(usecols,int):
+            usecols = (usecols,)
+
+        indices = []
+
+        for usecol in usecols:
+            if isinstance(usecol,int) and not -len(heads)<=usecol<len(heads):
+                raise ValueError(f"The curve index {usecol} is out of the {len(heads)} curves in {filepath}.")
+            elif isinstance(usecol,int):
+                indices.append(usecol%len(heads))
+            elif usecol in heads:
+                indices.append(list(heads).index(usecol))
+            else:
+                logging.warning(f"The curve {usecol} is not in {filepath}.")
 
-            # usecols_flt = [index for index,dtype in enumerate(dtypes) if dtype is float]
-            # usecols_str = [index for index,dtype in enumerate(dtypes) if dtype is str]
+        return indices
 
-            columns = []
+    @staticmethod
+    def _get_tokens(filepath,offset,ncols):
+        """It returns the string tokens of ~ASCII section starting at the byte offset
+        when it has non-numeric curves."""
 
-            for index,dtype in enumerate(dtypes):
+        with open(filepath,"rb") as text:
+            text.seek(offset)
+            datasection = text.read().decode("latin1")
 
-                column = np.loadtxt(filepath,
-                    dtype=dtype,
-                    skiprows=skiprows,
-                    usecols=[index],
-                    encoding="latin1")
+        if "#" in datasection:
+            datasection = "\n".join([line for line in datasection.split("\n") if not line.lstrip().startswith("#")])
 
-                columns.append(column)
+        return np.array(datasection.split(),dtype=str).reshape((-1,ncols))
 
-        frame.set_running(*columns,cols=range(len(columns)))
+    @staticmethod
+    def _get_null(frame):
+        """It returns the null value defined in the well section of LAS file."""
 
-        return frame
+        try:
+            return float(frame.well["NULL","value"])
+        except AttributeError:
+            return -999.25
+        except ValueError:
+            return -999.25
 
     def printwells(self,idframes=None):
 
@@ -1841,6 +3601,8 @@ class LogASCII(DataFrame):
             self.frames[index].set_running(*columns,cols=range(len(columns)))
             
     def set_interval(self,top,bottom,idframes=None,inplace=False):
+        """It cuts the frames to the depth interval (top,bottom) as views of the columns. If not
+        inplace, the list of view frames is returned and the frames are kept as they are."""
 
         if idframes is None:
             idframes = range(len(self.frames))
@@ -1852,19 +3614,23 @@ class LogASCII(DataFrame):
 
         self.gross_thickness = self.bottom-self.top
 
-        for index in idframes:
+        frames = []
 
-            depth = self.frames[index].columns(0)
+        for index in idframes:
 
-            depth_cond = np.logical_and(depth>self.top,depth<self.bottom)
+            frame = self.frames[index].view(self.frames[index].window(self.top,self.bottom))
 
             if inplace:
-                self.frames[index]._running = [column[depth_cond] for column in self.frames[index]._running]
-                self.frames[index].running = [np.asarray(column) for column in self.frames[index]._running]
+                self.frames[index].running = frame.running
             else:
-                self.frames[index].running = [np.asarray(column[depth_cond]) for column in self.frames[index]._running]
+                frames.append(frame)
+
+        if not inplace:
+            return frames
 
     def get_interval(self,top,bottom,idframes=None,curveID=None):
+        """It returns the rows, slice or boolean mask, of frames in the depth interval (top,bottom).
+        If curveID is defined, the views of the curve in the interval are returned instead."""
 
         returningList = []
 
@@ -1878,16 +3644,14 @@ class LogASCII(DataFrame):
             las = self.frames[idfile]
 
             try:
-                depth = las.columns("MD")
+                rows = las.window(top,bottom,"MD")
             except ValueError:
-                depth = las.columns("DEPT")
-
-            depth_cond = np.logical_and(depth>top,depth<bottom)
+                rows = las.window(top,bottom,"DEPT")
 
             if curveID is None:
-                returningList.append(depth_cond)
+                returningList.append(rows)
             else:
-                returningList.append(las.columns(curveID)[depth_cond])
+                returningList.append(las[curveID].view(rows))
 
         return returningList
 
@@ -2480,6 +4244,88 @@ class VTKit(DataFrame):
 
         pass
 
+# Supporting Unit Functions
+
+_unitregistry = None
+
+def get_unitregistry():
+    """It returns the process-wide pint.UnitRegistry which is built on the first call."""
+
+    global _unitregistry
+
+    if _unitregistry is None:
+        _unitregistry = pint.UnitRegistry()
+
+    return _unitregistry
+
+@functools.lru_cache(maxsize=512)
+def get_unitfactors(from_unit,to_unit):
+    """It returns the scale and offset converting values from from_unit to to_unit as scale*value+offset."""
+
+    ureg = get_unitregistry()
+
+    offset = ureg.Quantity(0.,from_unit).to(to_unit).magnitude
+    scale = ureg.Quantity(1.,from_unit).to(to_unit).magnitude-offset
+
+    return scale,offset
+
+# Supporting Calendar Functions
+
+def snap_months(dates,snap="end"):
+    """It returns the dates snapped to the start or end of their months."""
+
+    dates = np.asarray(dates)
+
+    if dates.dtype.type is not np.datetime64:
+        dates = dates.astype("datetime64[us]")
+
+    months = dates.astype("datetime64[M]")
+
+    if snap=="start":
+        return months.astype(dates.dtype)
+    elif snap=="end":
+        return ((months+1).astype("datetime64[D]")-1).astype(dates.dtype)
+    else:
+        raise ValueError(f"snap can be start or end, not {snap}.")
+
+def shift_months(dates,delta,snap=None):
+    """It returns the dates shifted by delta calendar months. The days beyond the end of the new
+    month are clamped to its last day; snap, start or end, moves the results to the month bounds."""
+
+    dates = np.asarray(dates)
+
+    if dates.dtype.type is not np.datetime64:
+        dates = dates.astype("datetime64[us]")
+
+    months = dates.astype("datetime64[M]")
+
+    moved = months+delta
+
+    if snap is not None:
+        return snap_months(moved.astype(dates.dtype),snap)
+
+    offset = dates-months.astype(dates.dtype)
+    days = offset.astype("timedelta64[D]")
+
+    monthdays = (moved+1).astype("datetime64[D]")-moved.astype("datetime64[D]")
+
+    days = np.minimum(days,monthdays-1)
+
+    return moved.astype(dates.dtype)+days+(offset-offset.astype("timedelta64[D]"))
+
+def monthly_dates(start,periods=None,stop=None,snap="start"):
+    """It returns monthly dates starting from the month of start up to the month of stop,
+    inclusive, or for a number of periods, snapped to the start or end of the months."""
+
+    start = np.datetime64(start,"M")
+
+    if periods is None:
+        periods = int((np.datetime64(stop,"M")-start).astype(int))+1
+
+    months = start+np.arange(periods)
+
+    return snap_months(months.astype("datetime64[us]"),snap)
+
 # Supporting String Classes
 
 class Alphabet():